@@ -15,132 +15,161 @@ user-facing should be imported to this file.
 # TODO: import this in all user-facing files
 
 
-###################
-# General Imports #
-###################
-
-from aviary.variable_info.variables import Aircraft, Mission, Dynamic, Settings
-from aviary.variable_info.options import get_option_defaults, is_option
-from aviary.utils.develop_metadata import add_meta_data, update_meta_data
-from aviary.variable_info.variable_meta_data import CoreMetaData
-from aviary.variable_info.functions import add_aviary_input, add_aviary_output, get_units, override_aviary_vars, setup_trajectory_params
-from aviary.utils.merge_hierarchies import merge_hierarchies
-from aviary.utils.merge_variable_metadata import merge_meta_data
-from aviary.utils.named_values import NamedValues, get_keys, get_items, get_values
-from aviary.utils.aviary_values import AviaryValues
-from aviary.utils.csv_data_file import read_data_file, write_data_file
-from aviary.utils.data_interpolator_builder import build_data_interpolator
-from aviary.variable_info.enums import AlphaModes, AnalysisScheme, ProblemType, SpeedType, GASPEngineType, FlapType, EquationsOfMotion, LegacyCode, Verbosity
-from aviary.interface.default_phase_info.two_dof import phase_info as default_2DOF_phase_info
-from aviary.interface.default_phase_info.two_dof_fiti import phase_info as default_2DOF_fiti_phase_info
-from aviary.interface.default_phase_info.two_dof_fiti_deprecated import create_2dof_based_ascent_phases, create_2dof_based_descent_phases
-from aviary.interface.default_phase_info.height_energy import phase_info as default_height_energy_phase_info
-from aviary.interface.methods_for_level1 import run_level_1
-from aviary.interface.methods_for_level1 import run_aviary
-from aviary.interface.methods_for_level2 import AviaryProblem
-from aviary.interface.utils.check_phase_info import check_phase_info
-from aviary.utils.engine_deck_conversion import EngineDeckConverter
-from aviary.utils.fortran_to_aviary import create_aviary_deck
-from aviary.utils.functions import set_aviary_input_defaults, set_aviary_initial_values, get_path
-from aviary.utils.options import list_options
-from aviary.constants import GRAV_METRIC_GASP, GRAV_ENGLISH_GASP, GRAV_METRIC_FLOPS, GRAV_ENGLISH_FLOPS, GRAV_ENGLISH_LBM, RHO_SEA_LEVEL_ENGLISH, RHO_SEA_LEVEL_METRIC, MU_TAKEOFF, MU_LANDING, PSLS_PSF, TSLS_DEGR, RADIUS_EARTH_METRIC
-from aviary.subsystems.test.subsystem_tester import TestSubsystemBuilderBase, skipIfMissingDependencies
-from aviary.subsystems.propulsion.utils import build_engine_deck
-
-###################
-# Level 3 Imports #
-###################
-
-# Miscellaneous
-from aviary.interface.methods_for_level2 import PreMissionGroup, PostMissionGroup
-from aviary.subsystems.premission import CorePreMission
-from aviary.subsystems.subsystem_builder_base import SubsystemBuilderBase
-from aviary.utils.preprocessors import preprocess_options, preprocess_propulsion
-from aviary.utils.process_input_decks import create_vehicle
-from aviary.utils.functions import create_opts2vals, add_opts2vals, Null
-from aviary.utils.preprocessors import preprocess_crewpayload
-
-# ODEs
-# TODO: check and see if this works with both sides, or just GASP
-from aviary.mission.gasp_based.ode.base_ode import BaseODE
-from aviary.mission.flops_based.ode.landing_ode import LandingODE as DetailedLandingODE
-from aviary.mission.flops_based.ode.landing_ode import FlareODE as DetailedFlareODE
-from aviary.mission.flops_based.ode.takeoff_ode import TakeoffODE as DetailedTakeoffODE
-from aviary.mission.gasp_based.ode.accel_ode import AccelODE as TwoDOFAccelerationODE
-from aviary.mission.gasp_based.ode.ascent_ode import AscentODE as TwoDOFAscentODE
-from aviary.mission.gasp_based.ode.breguet_cruise_ode import BreguetCruiseODESolution
-from aviary.mission.gasp_based.ode.climb_ode import ClimbODE as TwoDOFClimbODE
-from aviary.mission.gasp_based.ode.descent_ode import DescentODE as TwoDOFDescentODE
-from aviary.mission.gasp_based.ode.flight_path_ode import FlightPathODE as TwoDOFFlightPathODE
-from aviary.mission.gasp_based.ode.groundroll_ode import GroundrollODE as TwoDOFGroundrollODE
-from aviary.mission.gasp_based.ode.rotation_ode import RotationODE as TwoDOFRotationODE
-from aviary.mission.gasp_based.ode.landing_ode import LandingSegment as TwoDOFSimplifiedLanding
-from aviary.mission.gasp_based.ode.taxi_ode import TaxiSegment as AnalyticTaxi
-from aviary.mission.flops_based.phases.simplified_takeoff import TakeoffGroup as HeightEnergySimplifiedTakeoff
-from aviary.mission.flops_based.phases.simplified_landing import LandingGroup as HeightEnergySimplifiedLanding
-
-
-# Phase builders
-from aviary.mission.phase_builder_base import PhaseBuilderBase
-# note that this is only for simplified right now
-from aviary.mission.energy_phase import EnergyPhase as HeightEnergyPhaseBuilder
-from aviary.mission.flops_based.phases.build_landing import Landing as HeightEnergyLandingPhaseBuilder
-# note that this is only for simplified right now
-from aviary.mission.flops_based.phases.build_takeoff import Takeoff as HeightEnergyTakeoffPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingApproachToMicP3 as DetailedLandingApproachToMicP3PhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingMicP3ToObstacle as DetailedLandingMicP3ToObstaclePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingObstacleToFlare as DetailedLandingObstacleToFlarePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingFlareToTouchdown as DetailedLandingFlareToTouchdownPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingTouchdownToNoseDown as DetailedLandingTouchdownToNoseDownPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingNoseDownToStop as DetailedLandingNoseDownToStopPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffBrakeReleaseToDecisionSpeed as DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffDecisionSpeedToRotate as DetailedTakeoffDecisionSpeedToRotatePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffDecisionSpeedBrakeDelay as DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffRotateToLiftoff as DetailedTakeoffRotateToLiftoffPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffLiftoffToObstacle as DetailedTakeoffLiftoffToObstaclePhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffObstacleToMicP2 as DetailedTakeoffObstacleToMicP2PhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffMicP2ToEngineCutback as DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffEngineCutback as DetailedTakeoffEngineCutbackPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffEngineCutbackToMicP1 as DetailedTakeoffEngineCutbackToMicP1PhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffMicP1ToClimb as DetailedTakeoffMicP1ToClimbPhaseBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffBrakeToAbort as DetailedTakeoffBrakeToAbortPhaseBuilder
-
-# Phase builders
-from aviary.mission.gasp_based.phases.accel_phase import AccelPhase as TwoDOFAccelerationPhase
-from aviary.mission.gasp_based.phases.ascent_phase import AscentPhase as TwoDOFAscentPhase
-from aviary.mission.gasp_based.phases.climb_phase import ClimbPhase as TwoDOFClimbPhase
-from aviary.mission.gasp_based.phases.descent_phase import DescentPhase as TwoDOFDescentPhase
-from aviary.mission.gasp_based.phases.groundroll_phase import GroundrollPhase as TwoDOFGroundrollPhase
-from aviary.mission.gasp_based.phases.rotation_phase import RotationPhase as TwoDOFRotationPhase
-
-
-# Trajectory builders
-from aviary.mission.flops_based.phases.detailed_landing_phases import LandingTrajectory as DetailedLandingTrajectoryBuilder
-from aviary.mission.flops_based.phases.detailed_takeoff_phases import TakeoffTrajectory as DetailedTakeoffTrajectoryBuilder
-
-# SimuPy
-from aviary.mission.gasp_based.ode.time_integration_base_classes import SimuPyProblem
-from aviary.mission.gasp_based.phases.time_integration_phases import SGMGroundroll, SGMRotation, SGMAscent, SGMAscentCombined, SGMAccel, SGMClimb, SGMCruise, SGMDescent
-from aviary.mission.gasp_based.phases.time_integration_traj import TimeIntegrationTrajBase, FlexibleTraj
-
-# Aerodynamics
-from aviary.subsystems.aerodynamics.aerodynamics_builder import AerodynamicsBuilderBase
-from aviary.subsystems.aerodynamics.aerodynamics_builder import CoreAerodynamicsBuilder
-from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import TabularAeroGroup
-
-# Atmosphere
-from aviary.subsystems.atmosphere.atmosphere import Atmosphere
-
-# Geometry
-from aviary.subsystems.geometry.geometry_builder import GeometryBuilderBase
-from aviary.subsystems.geometry.geometry_builder import CoreGeometryBuilder
-
-# Mass
-from aviary.subsystems.mass.mass_builder import MassBuilderBase
-from aviary.subsystems.mass.mass_builder import CoreMassBuilder
-
-# Propulsion
-from aviary.subsystems.propulsion.engine_deck import EngineDeck
-from aviary.subsystems.propulsion.engine_model import EngineModel
-from aviary.subsystems.propulsion.propulsion_builder import PropulsionBuilderBase
-from aviary.subsystems.propulsion.propulsion_builder import CorePropulsionBuilder
+import importlib
+
+# Everything is imported the first time it is used rather than when this module is
+# imported, so that scripts that only need a few lightweight objects (such as
+# AviaryValues) don't pay for importing the whole package, dymos and bokeh.
+# Each entry lists the objects imported from a module, like a from-import would.
+_lazy_imports = [
+    # General Imports
+    ('aviary.variable_info.variables', 'Aircraft, Mission, Dynamic, Settings'),
+    ('aviary.variable_info.options', 'get_option_defaults, is_option'),
+    ('aviary.utils.develop_metadata', 'add_meta_data, update_meta_data'),
+    ('aviary.variable_info.variable_meta_data', 'CoreMetaData'),
+    ('aviary.variable_info.functions', 'add_aviary_input, add_aviary_output, get_units, override_aviary_vars, setup_trajectory_params'),
+    ('aviary.utils.merge_hierarchies', 'merge_hierarchies'),
+    ('aviary.utils.merge_variable_metadata', 'merge_meta_data'),
+    ('aviary.utils.named_values', 'NamedValues, get_keys, get_items, get_values'),
+    ('aviary.utils.aviary_values', 'AviaryValues'),
+    ('aviary.utils.csv_data_file', 'read_data_file, write_data_file'),
+    ('aviary.utils.data_interpolator_builder', 'build_data_interpolator'),
+    ('aviary.variable_info.enums', 'AlphaModes, AnalysisScheme, ProblemType, SpeedType, GASPEngineType, FlapType, EquationsOfMotion, LegacyCode, Verbosity'),
+    ('aviary.interface.default_phase_info.two_dof', 'phase_info as default_2DOF_phase_info'),
+    ('aviary.interface.default_phase_info.two_dof_fiti', 'phase_info as default_2DOF_fiti_phase_info'),
+    ('aviary.interface.default_phase_info.two_dof_fiti_deprecated', 'create_2dof_based_ascent_phases, create_2dof_based_descent_phases'),
+    ('aviary.interface.default_phase_info.height_energy', 'phase_info as default_height_energy_phase_info'),
+    ('aviary.interface.methods_for_level1', 'run_level_1'),
+    ('aviary.interface.methods_for_level1', 'run_aviary'),
+    ('aviary.interface.methods_for_level2', 'AviaryProblem'),
+    ('aviary.interface.utils.check_phase_info', 'check_phase_info'),
+    ('aviary.utils.engine_deck_conversion', 'EngineDeckConverter'),
+    ('aviary.utils.fortran_to_aviary', 'create_aviary_deck'),
+    ('aviary.utils.functions', 'set_aviary_input_defaults, set_aviary_initial_values, get_path'),
+    ('aviary.utils.options', 'list_options'),
+    ('aviary.constants', 'GRAV_METRIC_GASP, GRAV_ENGLISH_GASP, GRAV_METRIC_FLOPS, GRAV_ENGLISH_FLOPS, GRAV_ENGLISH_LBM, RHO_SEA_LEVEL_ENGLISH, RHO_SEA_LEVEL_METRIC, MU_TAKEOFF, MU_LANDING, PSLS_PSF, TSLS_DEGR, RADIUS_EARTH_METRIC'),
+    ('aviary.subsystems.test.subsystem_tester', 'TestSubsystemBuilderBase, skipIfMissingDependencies'),
+    ('aviary.subsystems.propulsion.utils', 'build_engine_deck'),
+
+    # Level 3 Imports
+
+    # Miscellaneous
+    ('aviary.interface.methods_for_level2', 'PreMissionGroup, PostMissionGroup'),
+    ('aviary.subsystems.premission', 'CorePreMission'),
+    ('aviary.subsystems.subsystem_builder_base', 'SubsystemBuilderBase'),
+    ('aviary.utils.preprocessors', 'preprocess_options, preprocess_propulsion'),
+    ('aviary.utils.process_input_decks', 'create_vehicle'),
+    ('aviary.utils.functions', 'create_opts2vals, add_opts2vals, Null'),
+    ('aviary.utils.preprocessors', 'preprocess_crewpayload'),
+
+    # ODEs
+    # TODO: check and see if this works with both sides, or just GASP
+    ('aviary.mission.gasp_based.ode.base_ode', 'BaseODE'),
+    ('aviary.mission.flops_based.ode.landing_ode', 'LandingODE as DetailedLandingODE'),
+    ('aviary.mission.flops_based.ode.landing_ode', 'FlareODE as DetailedFlareODE'),
+    ('aviary.mission.flops_based.ode.takeoff_ode', 'TakeoffODE as DetailedTakeoffODE'),
+    ('aviary.mission.gasp_based.ode.accel_ode', 'AccelODE as TwoDOFAccelerationODE'),
+    ('aviary.mission.gasp_based.ode.ascent_ode', 'AscentODE as TwoDOFAscentODE'),
+    ('aviary.mission.gasp_based.ode.breguet_cruise_ode', 'BreguetCruiseODESolution'),
+    ('aviary.mission.gasp_based.ode.climb_ode', 'ClimbODE as TwoDOFClimbODE'),
+    ('aviary.mission.gasp_based.ode.descent_ode', 'DescentODE as TwoDOFDescentODE'),
+    ('aviary.mission.gasp_based.ode.flight_path_ode', 'FlightPathODE as TwoDOFFlightPathODE'),
+    ('aviary.mission.gasp_based.ode.groundroll_ode', 'GroundrollODE as TwoDOFGroundrollODE'),
+    ('aviary.mission.gasp_based.ode.rotation_ode', 'RotationODE as TwoDOFRotationODE'),
+    ('aviary.mission.gasp_based.ode.landing_ode', 'LandingSegment as TwoDOFSimplifiedLanding'),
+    ('aviary.mission.gasp_based.ode.taxi_ode', 'TaxiSegment as AnalyticTaxi'),
+    ('aviary.mission.flops_based.phases.simplified_takeoff', 'TakeoffGroup as HeightEnergySimplifiedTakeoff'),
+    ('aviary.mission.flops_based.phases.simplified_landing', 'LandingGroup as HeightEnergySimplifiedLanding'),
+
+    # Phase builders
+    ('aviary.mission.phase_builder_base', 'PhaseBuilderBase'),
+    # note that this is only for simplified right now
+    ('aviary.mission.energy_phase', 'EnergyPhase as HeightEnergyPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.build_landing', 'Landing as HeightEnergyLandingPhaseBuilder'),
+    # note that this is only for simplified right now
+    ('aviary.mission.flops_based.phases.build_takeoff', 'Takeoff as HeightEnergyTakeoffPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingApproachToMicP3 as DetailedLandingApproachToMicP3PhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingMicP3ToObstacle as DetailedLandingMicP3ToObstaclePhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingObstacleToFlare as DetailedLandingObstacleToFlarePhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingFlareToTouchdown as DetailedLandingFlareToTouchdownPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingTouchdownToNoseDown as DetailedLandingTouchdownToNoseDownPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingNoseDownToStop as DetailedLandingNoseDownToStopPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffBrakeReleaseToDecisionSpeed as DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffDecisionSpeedToRotate as DetailedTakeoffDecisionSpeedToRotatePhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffDecisionSpeedBrakeDelay as DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffRotateToLiftoff as DetailedTakeoffRotateToLiftoffPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffLiftoffToObstacle as DetailedTakeoffLiftoffToObstaclePhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffObstacleToMicP2 as DetailedTakeoffObstacleToMicP2PhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffMicP2ToEngineCutback as DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffEngineCutback as DetailedTakeoffEngineCutbackPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffEngineCutbackToMicP1 as DetailedTakeoffEngineCutbackToMicP1PhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffMicP1ToClimb as DetailedTakeoffMicP1ToClimbPhaseBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffBrakeToAbort as DetailedTakeoffBrakeToAbortPhaseBuilder'),
+
+    # Phase builders
+    ('aviary.mission.gasp_based.phases.accel_phase', 'AccelPhase as TwoDOFAccelerationPhase'),
+    ('aviary.mission.gasp_based.phases.ascent_phase', 'AscentPhase as TwoDOFAscentPhase'),
+    ('aviary.mission.gasp_based.phases.climb_phase', 'ClimbPhase as TwoDOFClimbPhase'),
+    ('aviary.mission.gasp_based.phases.descent_phase', 'DescentPhase as TwoDOFDescentPhase'),
+    ('aviary.mission.gasp_based.phases.groundroll_phase', 'GroundrollPhase as TwoDOFGroundrollPhase'),
+    ('aviary.mission.gasp_based.phases.rotation_phase', 'RotationPhase as TwoDOFRotationPhase'),
+
+    # Trajectory builders
+    ('aviary.mission.flops_based.phases.detailed_landing_phases', 'LandingTrajectory as DetailedLandingTrajectoryBuilder'),
+    ('aviary.mission.flops_based.phases.detailed_takeoff_phases', 'TakeoffTrajectory as DetailedTakeoffTrajectoryBuilder'),
+
+    # SimuPy
+    ('aviary.mission.gasp_based.ode.time_integration_base_classes', 'SimuPyProblem'),
+    ('aviary.mission.gasp_based.phases.time_integration_phases', 'SGMGroundroll, SGMRotation, SGMAscent, SGMAscentCombined, SGMAccel, SGMClimb, SGMCruise, SGMDescent'),
+    ('aviary.mission.gasp_based.phases.time_integration_traj', 'TimeIntegrationTrajBase, FlexibleTraj'),
+
+    # Aerodynamics
+    ('aviary.subsystems.aerodynamics.aerodynamics_builder', 'AerodynamicsBuilderBase'),
+    ('aviary.subsystems.aerodynamics.aerodynamics_builder', 'CoreAerodynamicsBuilder'),
+    ('aviary.subsystems.aerodynamics.flops_based.tabular_aero_group', 'TabularAeroGroup'),
+
+    # Atmosphere
+    ('aviary.subsystems.atmosphere.atmosphere', 'Atmosphere'),
+
+    # Geometry
+    ('aviary.subsystems.geometry.geometry_builder', 'GeometryBuilderBase'),
+    ('aviary.subsystems.geometry.geometry_builder', 'CoreGeometryBuilder'),
+
+    # Mass
+    ('aviary.subsystems.mass.mass_builder', 'MassBuilderBase'),
+    ('aviary.subsystems.mass.mass_builder', 'CoreMassBuilder'),
+
+    # Propulsion
+    ('aviary.subsystems.propulsion.engine_deck', 'EngineDeck'),
+    ('aviary.subsystems.propulsion.engine_model', 'EngineModel'),
+    ('aviary.subsystems.propulsion.propulsion_builder', 'PropulsionBuilderBase'),
+    ('aviary.subsystems.propulsion.propulsion_builder', 'CorePropulsionBuilder'),
+]
+
+# maps the name of each object in the API to its module and its name in that module
+_api_objects = {}
+for _module_name, _names in _lazy_imports:
+    for _name in _names.split(','):
+        _name, _, _alias = _name.strip().partition(' as ')
+        _api_objects[_alias or _name] = (_module_name, _name)
+
+del _module_name, _names, _name, _alias
+
+__all__ = list(_api_objects)
+
+
+def __getattr__(name):
+    try:
+        module_name, object_name = _api_objects[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), object_name)
+    # cache the object so that this is only called once for each of them
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_api_objects))
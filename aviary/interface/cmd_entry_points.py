@@ -1,17 +1,9 @@
 import argparse
+import importlib
 import os
 import sys
 
 import aviary
-from aviary.interface.methods_for_level1 import _exec_level1, _setup_level1_parser
-from aviary.utils.fortran_to_aviary import _exec_F2A, _setup_F2A_parser
-from aviary.utils.engine_deck_conversion import _exec_EDC, _setup_EDC_parser, EDC_description
-from aviary.utils.aero_table_conversion import _exec_ATC, _setup_ATC_parser
-from aviary.utils.propeller_map_conversion import _exec_PMC, _setup_PMC_parser
-from aviary.visualization.dashboard import _dashboard_setup_parser, _dashboard_cmd
-from aviary.interface.graphical_input import _exec_flight_profile, _setup_flight_profile_parser
-from aviary.interface.download_models import _exec_hangar, _setup_hangar_parser
-from aviary.interface.plot_drag_polar import _exec_plot_drag_polar, _setup_plot_drag_polar_parser
 
 
 def _load_and_exec(script_name, user_args):
@@ -43,23 +35,55 @@ def _load_and_exec(script_name, user_args):
     exec(code, globals_dict)  # nosec: private, internal use only
 
 
+def _lazy_function(module_name, func_name):
+    """
+    Return a function that imports the named function from its module and calls it.
+
+    Most command modules import a large part of Aviary and its dependencies, so they
+    are only imported when their command is run.
+    """
+    def func(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), func_name)(*args, **kwargs)
+
+    return func
+
+
+def _lazy_command(module_name, setup_func_name, exec_func_name, help_str):
+    return (_lazy_function(module_name, setup_func_name),
+            _lazy_function(module_name, exec_func_name), help_str)
+
+
 _command_map = {
-    'fortran_to_aviary': (_setup_F2A_parser, _exec_F2A,
-                          "Converts legacy Fortran input decks to Aviary csv based decks"),
-    'run_mission': (_setup_level1_parser, _exec_level1,
-                    "Runs Aviary using a provided input deck"),
-    'draw_mission': (_setup_flight_profile_parser, _exec_flight_profile,
-                     "Allows users to draw a mission profile for use in Aviary."),
-    'dashboard': (_dashboard_setup_parser, _dashboard_cmd,
-                  "Run the Dashboard tool"),
-    'hangar': (_setup_hangar_parser, _exec_hangar,
-               "Allows users that pip installed Aviary to download models from the Aviary hangar"),
-    'convert_engine': (_setup_EDC_parser, _exec_EDC, EDC_description),
-    'convert_aero_table': (_setup_ATC_parser, _exec_ATC,
-                           'Converts FLOPS- or GASP-formatted aero data files into Aviary csv format.'),
-    'convert_prop_table': (_setup_PMC_parser, _exec_PMC,
-                           'Converts GASP-formatted propeller map file into Aviary csv format.'),
-    'plot_drag_polar': (_setup_plot_drag_polar_parser, _exec_plot_drag_polar, 'Plot a Drag Polar Graph using a provided polar data csv input'),
+    'fortran_to_aviary': _lazy_command('aviary.utils.fortran_to_aviary',
+                                       '_setup_F2A_parser', '_exec_F2A',
+                                       "Converts legacy Fortran input decks to Aviary csv based decks"),
+    'run_mission': _lazy_command('aviary.interface.methods_for_level1',
+                                 '_setup_level1_parser', '_exec_level1',
+                                 "Runs Aviary using a provided input deck"),
+    'run_batch': _lazy_command('aviary.interface.run_batch',
+                               '_setup_batch_parser', '_exec_batch',
+                               "Runs the Aviary cases listed in a manifest across a pool of processes"),
+    'draw_mission': _lazy_command('aviary.interface.graphical_input',
+                                  '_setup_flight_profile_parser', '_exec_flight_profile',
+                                  "Allows users to draw a mission profile for use in Aviary."),
+    'dashboard': _lazy_command('aviary.visualization.dashboard',
+                               '_dashboard_setup_parser', '_dashboard_cmd',
+                               "Run the Dashboard tool"),
+    'hangar': _lazy_command('aviary.interface.download_models',
+                            '_setup_hangar_parser', '_exec_hangar',
+                            "Allows users that pip installed Aviary to download models from the Aviary hangar"),
+    'convert_engine': _lazy_command('aviary.utils.engine_deck_conversion',
+                                    '_setup_EDC_parser', '_exec_EDC',
+                                    'Converts FLOPS- or GASP-formatted engine decks into Aviary csv format.'),
+    'convert_aero_table': _lazy_command('aviary.utils.aero_table_conversion',
+                                        '_setup_ATC_parser', '_exec_ATC',
+                                        'Converts FLOPS- or GASP-formatted aero data files into Aviary csv format.'),
+    'convert_prop_table': _lazy_command('aviary.utils.propeller_map_conversion',
+                                        '_setup_PMC_parser', '_exec_PMC',
+                                        'Converts GASP-formatted propeller map file into Aviary csv format.'),
+    'plot_drag_polar': _lazy_command('aviary.interface.plot_drag_polar',
+                                     '_setup_plot_drag_polar_parser', '_exec_plot_drag_polar',
+                                     'Plot a Drag Polar Graph using a provided polar data csv input'),
 }
 
 
@@ -88,13 +112,17 @@ def aviary_cmd():
     # Adding the --version argument
     parser.add_argument('--version', action='store_true', help='show version and exit')
 
+    args = [a for a in sys.argv[1:] if not a.startswith('-')]
+
     subs = parser.add_subparsers(title='Tools', metavar='', dest="subparser_name")
     for p, (parser_setup_func, executor, help_str) in sorted(_command_map.items()):
         subp = subs.add_parser(p, help=help_str)
-        parser_setup_func(subp)
+        # setting up the parser imports the module of the command, so only the one of
+        # the command being run is set up
+        if args and p == args[0]:
+            parser_setup_func(subp)
         subp.set_defaults(executor=executor)
 
-    args = [a for a in sys.argv[1:] if not a.startswith('-')]
     # '--version', '--dependency_versions')]
     cmdargs = [a for a in sys.argv[1:] if a not in ('-h',)]
 
@@ -1,21 +1,88 @@
 """
 This file contains functions needed to run Aviary using the Level 1 interface.
 """
+import hashlib
 import os
 from importlib.machinery import SourceFileLoader
 from pathlib import Path
 
+import numpy as np
 import openmdao.api as om
 from aviary.variable_info.enums import AnalysisScheme, Verbosity
 from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.utils.warm_start import WarmStartDatabase
+from aviary.utils.aviary_values import AviaryValues, get_items
 from aviary.utils.functions import get_path
 
 
+# set-up problems kept by run_aviary in template mode, keyed on their structure
+_problem_templates = {}
+
+
+def clear_problem_templates():
+    """
+    Discard all the set-up problems kept by run_aviary in template mode.
+    """
+    _problem_templates.clear()
+
+
+def _get_values_digest(aviary_values):
+    """
+    Return a digest of the names, values and units held by an AviaryValues.
+    """
+    digest = hashlib.sha1()
+    for key, (val, units) in get_items(aviary_values):
+        digest.update(repr((key, units)).encode('utf-8'))
+        try:
+            array = np.asarray(val)
+        except ValueError:
+            # lists of varying lengths
+            array = None
+
+        if array is None or array.dtype.hasobject:
+            # enums, and values holding them
+            digest.update(repr(val).encode('utf-8'))
+        else:
+            digest.update(repr((type(val).__name__, array.dtype.str,
+                                array.shape)).encode('utf-8'))
+            digest.update(np.ascontiguousarray(array).tobytes())
+
+    return digest.hexdigest()
+
+
+def _get_template_key(aircraft_filename, phase_info, settings):
+    if isinstance(aircraft_filename, AviaryValues):
+        # values loaded in memory are identified by their contents, as their id can
+        # be reused by other values once they are garbage collected
+        aircraft = _get_values_digest(aircraft_filename)
+    else:
+        path = get_path(aircraft_filename)
+        aircraft = (str(path), path.stat().st_mtime_ns)
+
+    # phase_info holds the subsystem builders, whose repr is unique to each of them
+    return (aircraft, repr(phase_info), repr(settings))
+
+
+def _set_input_values(prob, input_values):
+    not_found = []
+    for key, (val, units) in get_items(input_values):
+        try:
+            prob.set_val(key, val, units)
+        except KeyError:
+            not_found.append(key)
+
+    if not_found:
+        raise KeyError(
+            f"{prob.msginfo}: {not_found} are not variables of the model and can only "
+            "be changed by setting up the problem again.")
+
+
 def run_aviary(aircraft_filename, phase_info, optimizer=None,
                analysis_scheme=AnalysisScheme.COLLOCATION, objective_type=None,
                record_filename='problem_history.db', restart_filename=None, max_iter=50,
                run_driver=True, make_plots=True, phase_info_parameterization=None,
-               optimization_history_filename=None, verbosity=Verbosity.BRIEF):
+               optimization_history_filename=None, verbosity=Verbosity.BRIEF,
+               template=False, input_values=None, warm_start=None):
     """
     Run the Aviary optimization problem for a specified aircraft configuration and mission.
 
@@ -26,8 +93,8 @@ def run_aviary(aircraft_filename, phase_info, optimizer=None,
 
     Parameters
     ----------
-    aircraft_filename : str
-        Filename from which to load the aircraft and options data.
+    aircraft_filename : str or AviaryValues
+        Filename from which to load the aircraft and options data, or the data itself.
     phase_info : dict
         Information about the phases of the mission.
     optimizer : str
@@ -54,6 +121,18 @@ def run_aviary(aircraft_filename, phase_info, optimizer=None,
         default is None.
     verbosity : Verbosity or int
         Sets level of information outputted to the terminal during model execution.
+    template : bool, optional
+        If True, the set-up problem is cached and later calls with the same aircraft
+        file (or aircraft values with the same contents), phase_info (including its
+        subsystems) and settings reuse it from its initial guesses instead of setting
+        up a new problem, defaults to False.
+    input_values : AviaryValues, optional
+        Values set on the problem with set_val after its initial guesses. These must
+        be variables of the model, not options.
+    warm_start : str or Path, optional
+        Directory of a warm-start store. The trajectory starts from the solution saved
+        there by an earlier run with the same phases, if any, and the solution of this
+        run is saved there if it succeeds.
 
     Returns
     -------
@@ -69,8 +148,55 @@ def run_aviary(aircraft_filename, phase_info, optimizer=None,
     # compatibility with being passed int for verbosity
     verbosity = Verbosity(verbosity)
 
-    # Build problem
-    prob = AviaryProblem(analysis_scheme, name=Path(aircraft_filename).stem)
+    if template:
+        settings = (optimizer, analysis_scheme, objective_type, max_iter,
+                    phase_info_parameterization)
+        key = _get_template_key(aircraft_filename, phase_info, settings)
+
+        if key in _problem_templates:
+            prob, initial_outputs = _problem_templates[key]
+            # restore the initial guesses and inputs of the first call
+            prob.model._outputs.set_val(initial_outputs)
+            if warm_start is not None:
+                WarmStartDatabase(warm_start).load(prob)
+        else:
+            prob = _setup_aviary(aircraft_filename, phase_info, optimizer,
+                                 analysis_scheme, objective_type, max_iter,
+                                 phase_info_parameterization, verbosity, warm_start)
+            prob.final_setup()
+            problem_template = (prob, prob.model._outputs.asarray(copy=True))
+            _problem_templates[key] = problem_template
+            # setup fills in phase_info, so it is also registered the way it will be
+            # passed back in by the next call
+            _problem_templates[_get_template_key(
+                aircraft_filename, phase_info, settings)] = problem_template
+    else:
+        prob = _setup_aviary(aircraft_filename, phase_info, optimizer, analysis_scheme,
+                             objective_type, max_iter, phase_info_parameterization,
+                             verbosity, warm_start)
+
+    if input_values is not None:
+        _set_input_values(prob, input_values)
+
+    prob.run_aviary_problem(
+        record_filename, restart_filename=restart_filename, run_driver=run_driver, make_plots=make_plots, optimization_history_filename=optimization_history_filename,
+        warm_start=warm_start)
+
+    return prob
+
+
+def _setup_aviary(aircraft_filename, phase_info, optimizer, analysis_scheme,
+                  objective_type, max_iter, phase_info_parameterization, verbosity,
+                  warm_start=None):
+    """
+    Build and set up an AviaryProblem, up to its initial guesses.
+    """
+    # Build problem, named after the aircraft file if there is one
+    if isinstance(aircraft_filename, AviaryValues):
+        name = None
+    else:
+        name = Path(aircraft_filename).stem
+    prob = AviaryProblem(analysis_scheme, name=name)
 
     # Load aircraft and options data from user
     # Allow for user overrides here
@@ -98,10 +224,7 @@ def run_aviary(aircraft_filename, phase_info, optimizer=None,
 
     prob.setup()
 
-    prob.set_initial_guesses()
-
-    prob.run_aviary_problem(
-        record_filename, restart_filename=restart_filename, run_driver=run_driver, make_plots=make_plots, optimization_history_filename=optimization_history_filename)
+    prob.set_initial_guesses(warm_start)
 
     return prob
 
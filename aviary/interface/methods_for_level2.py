@@ -1,4 +1,5 @@
 from dymos.transcriptions.transcription_base import TranscriptionBase
+from concurrent.futures import ProcessPoolExecutor
 import csv
 import warnings
 import inspect
@@ -8,8 +9,10 @@ import importlib.util
 import sys
 import json
 import enum
+import math
 
 import numpy as np
+import pandas as pd
 
 import dymos as dm
 from dymos.utils.misc import _unspecified
@@ -22,6 +25,7 @@ from openmdao.utils.reports_system import _default_reports
 from aviary.constants import GRAV_ENGLISH_LBM, RHO_SEA_LEVEL_ENGLISH
 from aviary.interface.default_phase_info.two_dof_fiti import add_default_sgm_args
 from aviary.interface.utils.check_phase_info import check_phase_info
+from aviary.interface.utils.warm_start import WarmStartDatabase
 from aviary.mission.energy_phase import EnergyPhase
 from aviary.mission.flops_based.phases.build_landing import Landing
 from aviary.mission.flops_based.phases.build_takeoff import Takeoff
@@ -51,12 +55,14 @@ from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.subsystems.propulsion.propulsion_builder import CorePropulsionBuilder
 
 from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.named_values import NamedValues
 from aviary.utils.functions import create_opts2vals, add_opts2vals, promote_aircraft_and_mission_vars, wrapped_convert_units
 from aviary.utils.functions import convert_strings_to_data, set_value
 from aviary.utils.merge_variable_metadata import merge_meta_data
 from aviary.utils.preprocessors import preprocess_crewpayload, preprocess_propulsion
 from aviary.utils.process_input_decks import create_vehicle, update_GASP_options, initialization_guessing
 
+from aviary.variable_info import enums as aviary_enums
 from aviary.variable_info.enums import AnalysisScheme, ProblemType, EquationsOfMotion, LegacyCode, Verbosity
 from aviary.variable_info.functions import setup_trajectory_params, override_aviary_vars
 from aviary.variable_info.variables import Aircraft, Mission, Dynamic, Settings
@@ -70,6 +76,22 @@ TWO_DEGREES_OF_FREEDOM = EquationsOfMotion.TWO_DEGREES_OF_FREEDOM
 HEIGHT_ENERGY = EquationsOfMotion.HEIGHT_ENERGY
 SOLVED_2DOF = EquationsOfMotion.SOLVED_2DOF
 
+# version of the files written by AviaryProblem.save_sizing_snapshot
+SIZING_SNAPSHOT_VERSION = 1
+
+# python types that sizing snapshots can hold, other than enums
+_snapshot_types = {t.__name__: t for t in (bool, int, float, str)}
+
+# enums that sizing snapshots can hold, by the type name they are saved under. Only
+# these are ever resolved when a snapshot is read, so the file can not name other
+# callables.
+_snapshot_enums = {
+    f'{value.__module__}:{value.__qualname__}': value
+    for value in vars(aviary_enums).values()
+    if isinstance(value, type) and issubclass(value, enum.Enum)
+    and value.__module__ == aviary_enums.__name__
+}
+
 if hasattr(TranscriptionBase, 'setup_polynomial_controls'):
     use_new_dymos_syntax = False
 else:
@@ -1978,7 +2000,7 @@ class AviaryProblem(om.Problem):
             warnings.simplefilter("ignore", om.PromotionWarning)
             super().setup(**kwargs)
 
-    def set_initial_guesses(self):
+    def set_initial_guesses(self, warm_start=None):
         """
         Call `set_val` on the trajectory for states and controls to seed
         the problem with reasonable initial guesses. This is especially
@@ -1992,6 +2014,14 @@ class AviaryProblem(om.Problem):
         and continue to the next phase after that. For other phases, we set the initial
         guesses for states and controls according to the information available
         in the 'initial_guesses' attribute of the phase.
+
+        Parameters
+        ----------
+        warm_start : str or Path, optional
+            Directory of a warm-start store (see `run_aviary_problem`). If it holds
+            the solution of a problem with the same phases, the time, states and
+            controls of the collocation phases start from it instead, interpolated
+            onto the grid of this problem. Not used by the shooting scheme.
         """
         # Grab the trajectory object from the model
         if self.analysis_scheme is AnalysisScheme.SHOOTING:
@@ -2049,6 +2079,9 @@ class AviaryProblem(om.Problem):
             # Set initial guesses for states and controls for each phase
             self._add_guesses(phase_name, phase, guesses)
 
+        if warm_start is not None:
+            WarmStartDatabase(warm_start).load(self)
+
     def _process_guess_var(self, val, key, phase):
         """
         Process the guess variable, which can either be a float or an array of floats.
@@ -2315,7 +2348,8 @@ class AviaryProblem(om.Problem):
     def run_aviary_problem(self,
                            record_filename="problem_history.db",
                            optimization_history_filename=None,
-                           restart_filename=None, suppress_solver_print=True, run_driver=True, simulate=False, make_plots=True):
+                           restart_filename=None, suppress_solver_print=True, run_driver=True, simulate=False, make_plots=True,
+                           warm_start=None):
         """
         This function actually runs the Aviary problem, which could be a simulation, optimization, or a driver execution, depending on the arguments provided.
 
@@ -2335,6 +2369,11 @@ class AviaryProblem(om.Problem):
             If True, an explicit Dymos simulation will be performed. The default is False.
         make_plots : bool, optional
             If True (default), Dymos html plots will be generated as part of the output.
+        warm_start : str or Path, optional
+            Directory of a warm-start store. If the problem runs successfully, the
+            solution of its collocation phases is saved there, keyed on the names,
+            transcriptions, number of segments and order of its phases, for
+            `set_initial_guesses` of later problems.
         """
 
         if self.aviary_inputs.get_val(Settings.VERBOSITY).value >= 2:
@@ -2345,7 +2384,12 @@ class AviaryProblem(om.Problem):
         if suppress_solver_print:
             self.set_solver_print(level=0)
 
-        if optimization_history_filename:
+        # a problem that is run again without running the driver (such as a template
+        # of run_aviary) still has the recorder attached by the previous run, since
+        # only dm.run_problem shuts it down; a second recorder would initialize the
+        # database again while the first one still writes to it
+        if optimization_history_filename and str(optimization_history_filename) not in [
+                str(rec._filepath) for rec in self.driver._rec_mgr]:
             recorder = om.SqliteRecorder(optimization_history_filename)
             self.driver.add_recorder(recorder)
 
@@ -2365,6 +2409,10 @@ class AviaryProblem(om.Problem):
 
         self.problem_ran_successfully = not failed
 
+        if warm_start is not None and self.problem_ran_successfully and \
+                self.analysis_scheme is AnalysisScheme.COLLOCATION:
+            WarmStartDatabase(warm_start).save(self)
+
     def alternate_mission(self, run_mission=True,
                           json_filename='sizing_problem.json',
                           payload_mass=None, mission_range=None,
@@ -2377,7 +2425,8 @@ class AviaryProblem(om.Problem):
         run_mission : bool
             Flag to determine whether to run the mission before returning the problem object.
         json_filename : str
-            Name of the file that the sizing mission has been saved to.
+            Name of the file that the sizing mission has been saved to, either a json
+            file or a .npz snapshot file.
         mission_range : float, optional
             Target range for the fallout mission.
         payload_mass : float, optional
@@ -2401,19 +2450,9 @@ class AviaryProblem(om.Problem):
         mission_mass = self.get_val(Mission.Design.GROSS_MASS)
         optimizer = self.driver.options["optimizer"]
 
-        prob_alternate = _load_off_design(json_filename, ProblemType.ALTERNATE,
-                                          phase_info, payload_mass, design_range, mission_mass)
-
-        prob_alternate.check_and_preprocess_inputs()
-        prob_alternate.add_pre_mission_systems()
-        prob_alternate.add_phases()
-        prob_alternate.add_post_mission_systems()
-        prob_alternate.link_phases()
-        prob_alternate.add_driver(optimizer, verbosity=verbosity)
-        prob_alternate.add_design_variables()
-        prob_alternate.add_objective()
-        prob_alternate.setup()
-        prob_alternate.set_initial_guesses()
+        prob_alternate = _setup_off_design(json_filename, ProblemType.ALTERNATE,
+                                           phase_info, payload_mass, design_range,
+                                           mission_mass, optimizer, verbosity)
         if run_mission:
             prob_alternate.run_aviary_problem(
                 record_filename='alternate_problem_history.db')
@@ -2431,7 +2470,8 @@ class AviaryProblem(om.Problem):
         run_mission : bool
             Flag to determine whether to run the mission before returning the problem object.
         json_filename : str
-            Name of the file that the sizing mission has been saved to.
+            Name of the file that the sizing mission has been saved to, either a json
+            file or a .npz snapshot file.
         mission_mass : float, optional
             Takeoff mass for the fallout mission.
         payload_mass : float, optional
@@ -2455,23 +2495,95 @@ class AviaryProblem(om.Problem):
         design_range = self.get_val(Mission.Design.RANGE)
         optimizer = self.driver.options["optimizer"]
 
-        prob_fallout = _load_off_design(json_filename, ProblemType.FALLOUT, phase_info,
-                                        payload_mass, design_range, mission_mass)
-
-        prob_fallout.check_and_preprocess_inputs()
-        prob_fallout.add_pre_mission_systems()
-        prob_fallout.add_phases()
-        prob_fallout.add_post_mission_systems()
-        prob_fallout.link_phases()
-        prob_fallout.add_driver(optimizer, verbosity=verbosity)
-        prob_fallout.add_design_variables()
-        prob_fallout.add_objective()
-        prob_fallout.setup()
-        prob_fallout.set_initial_guesses()
+        prob_fallout = _setup_off_design(json_filename, ProblemType.FALLOUT, phase_info,
+                                         payload_mass, design_range, mission_mass,
+                                         optimizer, verbosity)
         if run_mission:
             prob_fallout.run_aviary_problem(record_filename='fallout_problem_history.db')
         return prob_fallout
 
+    def off_design_sweep(self, points, n_workers=1,
+                         json_filename='sizing_problem.json',
+                         problem_type=ProblemType.FALLOUT,
+                         phase_info=None, run_driver=True, verbosity=Verbosity.BRIEF):
+        """
+        This function runs many off-design missions based on a sizing mission output,
+        such as the points of a payload-range diagram.
+
+        Each worker process sets up the off-design problem for each problem type only
+        once. Between points, only the payload, range and gross mass are reset, and
+        every point starts from the solution of the previous point run by the same
+        worker, so neighboring points should be next to each other in the list.
+
+        Parameters
+        ----------
+        points : list of dict
+            Off-design points to run. Each point can define 'problem_type'
+            (ProblemType.ALTERNATE or ProblemType.FALLOUT), 'payload_mass' in lbm,
+            'mission_range' in NM (used by alternate missions) and 'mission_mass' in
+            lbm (used by fallout missions). Missing values default to those of the
+            sizing mission.
+        n_workers : int
+            Number of processes to run the points in. Each one gets a contiguous
+            block of points. If 1, the points are run in this process.
+        json_filename : str
+            Name of the file that the sizing mission has been saved to, either a json
+            file or a .npz snapshot file.
+        problem_type : ProblemType
+            Problem type of the points that do not define one.
+        phase_info : dict, optional
+            Dictionary containing the phases and their required parameters. It must
+            be picklable if n_workers is greater than 1.
+        run_driver : bool
+            If True (default), the driver is run at each point. If False, the model is
+            only run once per point, which fails if its solvers do not converge.
+        verbosity : Verbosity or list, optional
+            If Verbosity.DEBUG, debug print options ['desvars','ln_cons','nl_cons','objs'] will be set.
+            If a list is provided, it will be used as the debug print options.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per point, in the same order as points, with the problem type,
+            whether the run succeeded, and the payload mass (lbm), gross mass (lbm),
+            range (NM) and total fuel mass (lbm) of the mission. The payload mass is
+            Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS for height-energy missions and
+            Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS for 2DOF missions, as computed
+            by the model.
+        """
+        if phase_info is None:
+            phase_info = self.phase_info
+
+        # the default units of these variables are the ones used by the points
+        defaults = {
+            'problem_type': problem_type,
+            'payload_mass': self.get_val(_get_payload_variable(self.mission_method))[0],
+            'mission_range': self.get_val(Mission.Design.RANGE)[0],
+            'mission_mass': self.get_val(Mission.Design.GROSS_MASS)[0],
+        }
+        points = [{**defaults, **point} for point in points]
+        for point in points:
+            if point['problem_type'] not in (ProblemType.ALTERNATE, ProblemType.FALLOUT):
+                raise ValueError(f"{point['problem_type']} is not a valid off-design "
+                                 "problem type.")
+
+        optimizer = self.driver.options["optimizer"]
+        args = (json_filename, phase_info, optimizer, verbosity, run_driver)
+
+        blocks = [block for block in np.array_split(np.arange(len(points)), n_workers)
+                  if block.size]
+        if len(blocks) < 2:
+            rows = _run_off_design_points(*args, points)
+        else:
+            with ProcessPoolExecutor(max_workers=len(blocks)) as executor:
+                futures = [
+                    executor.submit(_run_off_design_points, *args,
+                                    [points[idx] for idx in block])
+                    for block in blocks]
+                rows = [row for future in futures for row in future.result()]
+
+        return pd.DataFrame(rows)
+
     def save_sizing_to_json(self, json_filename='sizing_problem.json'):
         """
         This function saves an aviary problem object into a json file.
@@ -2508,10 +2620,10 @@ class AviaryProblem(om.Problem):
                         value = value.tolist()
 
                     # Lists are fine except if they contain enums
+                    # (a new list is made to keep aviary_inputs unchanged)
                     if type_value == list:
                         if isinstance(value[0], enum.Enum):
-                            for i in range(len(value)):
-                                value[i] = str([value[i]])
+                            value = [str([item]) for item in value]
 
                     # Enums need converting to a string
                     if isinstance(value, enum.Enum):
@@ -2526,6 +2638,66 @@ class AviaryProblem(om.Problem):
 
             jsonfile.close()
 
+    def save_sizing_snapshot(self, filename='sizing_problem.npz'):
+        """
+        This function saves an aviary problem object into a binary snapshot file.
+
+        Unlike save_sizing_to_json, the exact types of the inputs (including enums and
+        integer arrays) are kept, so they are loaded back without being parsed and
+        checked against the metadata again. The final values of the design variables
+        are saved too, and off-design missions start from them. The snapshot can be
+        passed to alternate_mission, fallout_mission and off_design_sweep in place of
+        a json file.
+
+        Parameters
+        ----------
+        filename : str
+            User specified name and relative path of the .npz file to save the data
+            into.
+        """
+        # the values are packed into one flat array per dtype and their descriptions
+        # into one array of strings, since every array of a .npz file is stored (and
+        # read) as a separate file
+        index = []
+        offsets = []
+        groups = {}
+
+        for name, (value, units) in self.aviary_inputs:
+            # Get the gross mass value from the sizing problem
+            if name == Mission.Summary.GROSS_MASS or name == Mission.Design.GROSS_MASS:
+                value = self.get_val(Mission.Summary.GROSS_MASS, units=units)[0]
+
+            kind, type_names, array = _encode_snapshot_value(name, value)
+            group = groups.setdefault(_get_snapshot_group(array.dtype), [])
+
+            shape = ','.join(str(dim) for dim in array.shape)
+            index.append((name, units, kind, type_names, array.dtype.str, shape))
+            offsets.append(sum(item.size for item in group))
+            group.append(array.ravel())
+
+        arrays = {'index': np.array(index, dtype=str).reshape(-1, 6),
+                  'offsets': np.array(offsets, dtype=int)}
+        for key, group in groups.items():
+            arrays[f'values:{key}'] = np.concatenate(group)
+
+        desvar_names = []
+        desvar_units = []
+        desvar_values = []
+        abs2meta = self.model._var_allprocs_abs2meta['output']
+
+        for name, meta in self.model.get_design_vars().items():
+            source = meta['source']
+            desvar_names.append(name)
+            desvar_units.append(abs2meta[source]['units'] or '')
+            desvar_values.append(np.ravel(self.get_val(source)))
+
+        arrays['desvar_index'] = np.array([desvar_names, desvar_units], dtype=str)
+        arrays['desvar_sizes'] = np.array([val.size for val in desvar_values], dtype=int)
+        arrays['desvar_values'] = np.concatenate(desvar_values or [np.zeros(0)])
+
+        np.savez_compressed(filename, version=np.array(SIZING_SNAPSHOT_VERSION),
+                            **arrays)
+
     def _add_hybrid_objective(self, phase_info):
         phases = list(phase_info.keys())
         takeoff_mass = self.aviary_inputs.get_val(
@@ -2851,8 +3023,160 @@ def _read_sizing_json(aviary_problem, json_filename):
     return aviary_problem
 
 
+def _encode_snapshot_value(name, value):
+    """
+    Return the kind of container of an input value, the names of the types of its
+    items and the array it is saved as in a sizing snapshot.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError(f'{name} is an array of objects, which can not be saved in '
+                            'a sizing snapshot.')
+        return 'array', '', value
+
+    if isinstance(value, (list, tuple)):
+        kind = type(value).__name__
+        items = value
+    else:
+        kind = 'scalar'
+        items = [value]
+
+    type_names = []
+    array = []
+    for item in items:
+        if isinstance(item, np.generic):
+            item = item.item()
+
+        if isinstance(item, enum.Enum):
+            enum_type = type(item)
+            type_name = f'{enum_type.__module__}:{enum_type.__qualname__}'
+            if _snapshot_enums.get(type_name) is not enum_type:
+                raise TypeError(f'{name} holds a value of type {enum_type}, which can '
+                                'not be saved in a sizing snapshot. Only the enums in '
+                                'aviary.variable_info.enums can be saved.')
+            type_names.append(type_name)
+            item = item.value
+        elif type(item).__name__ in _snapshot_types:
+            type_names.append(type(item).__name__)
+        else:
+            raise TypeError(f'{name} holds a value of type {type(item)}, which can not '
+                            'be saved in a sizing snapshot.')
+
+        array.append(item)
+
+    if kind == 'scalar':
+        array = array[0]
+
+    return kind, ','.join(type_names), np.array(array)
+
+
+def _get_snapshot_group(dtype):
+    """
+    Return the key of the flat array that values of the given dtype are packed into
+    in a sizing snapshot. Strings of all lengths share one array.
+    """
+    return 'U' if dtype.kind == 'U' else dtype.str
+
+
+def _decode_snapshot_value(kind, type_names, array):
+    """
+    Return the input value saved as an array in a sizing snapshot.
+    """
+    if kind == 'array':
+        return array
+
+    types = []
+    for type_name in type_names.split(',') if type_names else []:
+        if type_name in _snapshot_types:
+            types.append(_snapshot_types[type_name])
+        elif type_name in _snapshot_enums:
+            types.append(_snapshot_enums[type_name])
+        else:
+            raise TypeError(f'Sizing snapshot holds a value of unknown type '
+                            f'"{type_name}".')
+
+    if kind == 'scalar':
+        return types[0](array.item())
+
+    value = [item_type(item) for item_type, item in zip(types, array.tolist())]
+
+    if kind == 'tuple':
+        value = tuple(value)
+
+    return value
+
+
+def _read_sizing_snapshot(aviary_problem, filename):
+    """
+    This function reads in an aviary problem object from a sizing snapshot file.
+
+    Parameters
+    ----------
+    aviary_problem: OpenMDAO Aviary Problem
+        Aviary problem object to set the inputs of the sized aircraft on.
+    filename:   string
+        User specified name and relative path of the .npz file written by
+        AviaryProblem.save_sizing_snapshot.
+
+    Returns
+    ----------
+    Aviary Problem object with updated input values from the snapshot file
+    """
+    with np.load(filename) as snapshot:
+        version = snapshot['version'].item()
+        if version > SIZING_SNAPSHOT_VERSION:
+            raise ValueError(f'{filename} is a version {version} sizing snapshot, but '
+                             f'only versions up to {SIZING_SNAPSHOT_VERSION} can be '
+                             'read.')
+
+        index = snapshot['index'].tolist()
+        offsets = snapshot['offsets'].tolist()
+        groups = {key[len('values:'):]: snapshot[key] for key in snapshot.files
+                  if key.startswith('values:')}
+
+    for (name, units, kind, type_names, dtype, shape), offset in zip(index, offsets):
+        dtype = np.dtype(dtype)
+        shape = tuple(int(dim) for dim in shape.split(',')) if shape else ()
+        size = math.prod(shape)
+
+        array = groups[_get_snapshot_group(dtype)][offset:offset + size]
+        value = _decode_snapshot_value(kind, type_names,
+                                       array.astype(dtype).reshape(shape))
+
+        # the values were checked against the metadata when they were set on the
+        # sizing problem, and their types are kept by the snapshot
+        NamedValues.set_val(aviary_problem.aviary_inputs, name, value, units)
+
+    return aviary_problem
+
+
+def _set_sizing_design_vars(aviary_problem, filename):
+    """
+    Set the design variables of an off-design problem to their final values in the
+    sizing problem saved in a snapshot file. Design variables that are aviary inputs
+    of the off-design problem, or that do not have the same size in both problems,
+    are skipped.
+    """
+    design_vars = aviary_problem.model.get_design_vars()
+
+    with np.load(filename) as snapshot:
+        names, units_list = snapshot['desvar_index'].tolist()
+        sizes = snapshot['desvar_sizes']
+        values = np.split(snapshot['desvar_values'], np.cumsum(sizes)[:-1])
+
+    for name, units, val in zip(names, units_list, values):
+        if name not in design_vars or name in aviary_problem.aviary_inputs:
+            continue
+
+        source = design_vars[name]['source']
+        shape = np.shape(aviary_problem.get_val(source))
+
+        if val.size == np.prod(shape):
+            aviary_problem.set_val(source, val.reshape(shape), units=units or None)
+
+
 def _load_off_design(json_filename, ProblemType, phase_info,
-                     payload, mission_range, mission_gross_mass):
+                     payload, mission_range, mission_gross_mass, **kwargs):
     """
     This function loads a sized aircraft, and sets up an aviary problem
     for a specified off design mission.
@@ -2860,7 +3184,8 @@ def _load_off_design(json_filename, ProblemType, phase_info,
     Parameters
     ----------
     json_filename:      string
-        User specified name and relative path of json file containing the sized aircraft data
+        User specified name and relative path of json file containing the sized aircraft data,
+        or of a .npz sizing snapshot file
     ProblemType:        enum
         Alternate or Fallout. Alternate requires mission_range input and
          Fallout requires mission_fuel input
@@ -2871,6 +3196,8 @@ def _load_off_design(json_filename, ProblemType, phase_info,
         Mission.Summary.RANGE 'NM'
     mission_gross_mass  float
         Mission.Summary.GROSS_MASS 'lbm'
+    **kwargs
+        Keyword arguments passed to AviaryProblem
 
     Returns
     ----------
@@ -2878,10 +3205,13 @@ def _load_off_design(json_filename, ProblemType, phase_info,
     """
 
     # Initialize a new aviary problem and aviary_input data structure
-    prob = AviaryProblem()
+    prob = AviaryProblem(**kwargs)
     prob.aviary_inputs = AviaryValues()
 
-    prob = _read_sizing_json(prob, json_filename)
+    if _is_sizing_snapshot(json_filename):
+        prob = _read_sizing_snapshot(prob, json_filename)
+    else:
+        prob = _read_sizing_json(prob, json_filename)
 
     # Update problem type
     prob.problem_type = ProblemType
@@ -2903,3 +3233,155 @@ def _load_off_design(json_filename, ProblemType, phase_info,
     # Load inputs
     prob.load_inputs(prob.aviary_inputs, phase_info)
     return prob
+
+
+def _setup_off_design(json_filename, ProblemType, phase_info, payload, mission_range,
+                      mission_gross_mass, optimizer, verbosity, **kwargs):
+    """
+    This function loads a sized aircraft, and sets up an aviary problem for a
+    specified off design mission up to its initial guesses.
+    """
+    prob = _load_off_design(json_filename, ProblemType, phase_info, payload,
+                            mission_range, mission_gross_mass, **kwargs)
+
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver(optimizer, verbosity=verbosity)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses()
+
+    if _is_sizing_snapshot(json_filename):
+        _set_sizing_design_vars(prob, json_filename)
+
+    return prob
+
+
+def _is_sizing_snapshot(filename):
+    return Path(filename).suffix == '.npz'
+
+
+def _get_payload_variable(mission_method):
+    """
+    Return the name of the payload mass of the off-design missions of a mission
+    method.
+    """
+    if mission_method is HEIGHT_ENERGY:
+        return Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS
+    elif mission_method is TWO_DEGREES_OF_FREEDOM:
+        return Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS
+
+    raise ValueError(f'Off-design missions are not supported for the '
+                     f'{mission_method.value} mission method.')
+
+
+def _is_model_input(prob, name):
+    """
+    Return True if the variable is an input of the model that is not connected to the
+    output of any of its components, so setting it is kept when the model is run.
+    """
+    try:
+        source = prob.model.get_source(name)
+    except KeyError:
+        return False
+
+    return source.startswith('_auto_ivc.')
+
+
+def _fail_on_non_convergence(prob):
+    """
+    Make the outermost iterative nonlinear solvers of the model raise an AnalysisError
+    when they do not converge, so that running the model fails if it is not solved.
+    """
+    solved_paths = []
+    for system in prob.model.system_iter(include_self=True, recurse=True):
+        solver = system.nonlinear_solver
+        if solver is None or isinstance(solver, om.NonlinearRunOnce):
+            continue
+
+        # solvers of subsystems may fail along the way, as long as the solver of
+        # their parent converges
+        if any(path == '' or system.pathname.startswith(path + '.')
+               for path in solved_paths):
+            continue
+
+        solver.options['err_on_non_converge'] = True
+        solved_paths.append(system.pathname)
+
+
+def _run_off_design_points(json_filename, phase_info, optimizer, verbosity, run_driver,
+                           points):
+    """
+    Run a block of off-design points, setting up one problem per problem type and
+    reusing it for every point of that type. Returns one row of results per point.
+    """
+    problems = {}
+    last_solutions = {}
+    rows = []
+
+    for point in points:
+        problem_type = point['problem_type']
+        payload = point['payload_mass']
+
+        # a problem whose payload is not an input of the model can only run the
+        # payload it was set up with
+        key = problem_type if problem_type in problems else (problem_type, payload)
+        if key not in problems:
+            # reports of the different workers would overwrite each other
+            prob = _setup_off_design(json_filename, problem_type, phase_info, payload,
+                                     point['mission_range'], point['mission_mass'],
+                                     optimizer, verbosity, reports=False)
+            prob.set_solver_print(level=0)
+            if not run_driver:
+                # the model is only run once, so it must be solved
+                _fail_on_non_convergence(prob)
+
+            payload_is_input = _is_model_input(
+                prob, _get_payload_variable(prob.mission_method))
+            if payload_is_input:
+                key = problem_type
+            problems[key] = (prob, payload_is_input)
+        prob, payload_is_input = problems[key]
+        payload_variable = _get_payload_variable(prob.mission_method)
+
+        # start from the last point that worked
+        if key in last_solutions:
+            prob.model._outputs.set_val(last_solutions[key])
+
+        if payload_is_input:
+            prob.set_val(payload_variable, payload, units='lbm')
+        if problem_type is ProblemType.ALTERNATE:
+            prob.set_val(Mission.Design.RANGE, point['mission_range'], units='NM')
+        else:
+            prob.set_val(Mission.Summary.GROSS_MASS, point['mission_mass'], units='lbm')
+
+        # prevent UserWarning that is displayed when an event is triggered
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', category=UserWarning)
+            try:
+                if run_driver:
+                    failed = prob.run_driver()
+                else:
+                    failed = prob.run_model()
+            except om.AnalysisError:
+                failed = True
+
+        if not failed:
+            last_solutions[key] = prob.model._outputs.asarray(copy=True)
+
+        rows.append({
+            'problem_type': problem_type.value,
+            'success': not failed,
+            payload_variable: prob.get_val(payload_variable, units='lbm')[0],
+            Mission.Summary.GROSS_MASS:
+                prob.get_val(Mission.Summary.GROSS_MASS, units='lbm')[0],
+            Mission.Summary.RANGE: prob.get_val(Mission.Summary.RANGE, units='NM')[0],
+            Mission.Summary.TOTAL_FUEL_MASS:
+                prob.get_val(Mission.Summary.TOTAL_FUEL_MASS, units='lbm')[0],
+        })
+
+    return rows
@@ -0,0 +1,303 @@
+"""
+Run a batch of Aviary cases listed in a manifest across a pool of processes.
+
+Each worker process imports Aviary once and runs its cases one after the other, each
+in its own output directory, so the reports, recorder files and logs of different
+cases never overwrite each other. The results of all the cases are gathered in a
+summary csv file.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+import csv
+import os
+from pathlib import Path
+import time
+import traceback
+
+import numpy as np
+import pandas as pd
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.reports_system import clear_reports
+
+from aviary.interface.methods_for_level1 import run_level_1
+from aviary.utils.functions import get_path
+from aviary.variable_info.enums import AnalysisScheme
+from aviary.variable_info.variables import Mission
+
+# columns that the manifest can have, with the type of their values
+_manifest_columns = {
+    'name': str,
+    'input_deck': str,
+    'phase_info': str,
+    'optimizer': str,
+    'max_iter': int,
+}
+
+# outputs of each case written to the summary, with their units
+_summary_outputs = (
+    (Mission.Summary.GROSS_MASS, 'lbm'),
+    (Mission.Summary.RANGE, 'NM'),
+    (Mission.Summary.TOTAL_FUEL_MASS, 'lbm'),
+)
+
+
+def _resolve_path(path, directory):
+    """
+    Return the absolute path of a file named in the manifest, looking for it next to
+    the manifest first.
+    """
+    if (directory / path).exists():
+        return (directory / path).resolve()
+
+    return get_path(path).resolve()
+
+
+def read_manifest(manifest):
+    """
+    Read the cases of a batch from a manifest csv file.
+
+    The manifest has a header line naming its columns. The input_deck column is
+    required, while name, phase_info, optimizer and max_iter are optional. Names are
+    used as directory names, so they cannot hold path separators or be '.' or '..'.
+    Empty lines and lines starting with '#' are skipped. Paths are looked for next to the
+    manifest first, then as they are found by `get_path`.
+
+    Parameters
+    ----------
+    manifest : str or Path
+        Path to the manifest csv file.
+
+    Returns
+    -------
+    list of dict
+        One dict per case, holding its name, the absolute paths of its input deck
+        and phase_info file (or None), and its optimizer and max_iter if set.
+    """
+    manifest = get_path(manifest)
+    directory = manifest.resolve().parent
+
+    with open(manifest, newline='') as manifest_file:
+        lines = [line for line in manifest_file
+                 if line.strip() and not line.lstrip().startswith('#')]
+
+    reader = csv.DictReader(lines, skipinitialspace=True)
+    fieldnames = [name.strip() for name in reader.fieldnames or []]
+    unknown = set(fieldnames) - set(_manifest_columns)
+
+    if unknown:
+        raise ValueError(f'{manifest}: unknown manifest columns {sorted(unknown)}, the '
+                         f'valid columns are {list(_manifest_columns)}.')
+    if 'input_deck' not in fieldnames:
+        raise ValueError(f'{manifest}: the manifest must have an input_deck column.')
+
+    cases = []
+    names = set()
+
+    for row in reader:
+        case = {}
+        for key, value in row.items():
+            value = (value or '').strip()
+            if value:
+                case[key.strip()] = _manifest_columns[key.strip()](value)
+
+        if 'input_deck' not in case:
+            raise ValueError(f'{manifest}: case {len(cases) + 1} has no input_deck.')
+
+        case['input_deck'] = _resolve_path(case['input_deck'], directory)
+        if 'phase_info' in case:
+            case['phase_info'] = _resolve_path(case['phase_info'], directory)
+        else:
+            case['phase_info'] = None
+
+        # give every case a unique name, which is also the name of its directory
+        name = base_name = case.get('name', case['input_deck'].stem)
+        if name in ('.', '..') or '/' in name or '\\' in name:
+            raise ValueError(f'{manifest}: case {len(cases) + 1} has name "{name}", '
+                             'which is not a valid directory name.')
+        count = 1
+        while name in names:
+            count += 1
+            name = f'{base_name}_{count}'
+        names.add(name)
+        case['name'] = name
+
+        cases.append(case)
+
+    return cases
+
+
+def run_batch(manifest, outdir='batch_output', num_workers=1, optimizer='SNOPT',
+              max_iter=50, analysis_scheme=AnalysisScheme.COLLOCATION):
+    """
+    Run the cases listed in a manifest, like `aviary run_mission` would run each of
+    them, across a pool of processes.
+
+    Each case runs in its own directory inside outdir, named after the case, where
+    its reports, recorder files and n2 diagram are written, along with a run.log
+    file holding its printed output. A case that raises an error is reported as
+    failed in the summary and does not stop the others.
+
+    Parameters
+    ----------
+    manifest : str or Path
+        Path to the manifest csv file (see `read_manifest`).
+    outdir : str or Path
+        Directory to write the case directories and the batch_summary.csv file to.
+    num_workers : int
+        Maximum number of cases run at the same time, each one in its own process.
+        If 1, the cases are run in this process.
+    optimizer : str or None
+        Optimizer of the cases that do not set one in the manifest.
+    max_iter : int
+        Maximum number of iterations of the cases that do not set one in the
+        manifest.
+    analysis_scheme : AnalysisScheme
+        Analysis scheme of all the cases.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The summary, with one row per case in the order of the manifest, holding its
+        name, input deck, phase_info file, whether it succeeded, its wall time in
+        seconds, its gross mass (lbm), range (NM) and total fuel mass (lbm), and the
+        error it raised, if any.
+    """
+    outdir = Path(outdir).resolve()
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    cases = read_manifest(manifest)
+    for case in cases:
+        case.setdefault('optimizer', optimizer)
+        case.setdefault('max_iter', max_iter)
+        if case['optimizer'] == 'None':
+            case['optimizer'] = None
+        case['analysis_scheme'] = analysis_scheme
+        case['outdir'] = outdir / case['name']
+
+    if num_workers <= 1 or len(cases) <= 1:
+        rows = [_run_case(case) for case in cases]
+    else:
+        # the workers are reused for several cases, so they only import Aviary once
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(cases))) as executor:
+            rows = list(executor.map(_run_case, cases))
+
+    summary = pd.DataFrame(rows)
+    summary.to_csv(outdir / 'batch_summary.csv', index=False)
+
+    return summary
+
+
+def _run_case(case):
+    """
+    Run a single case of a batch in its directory, returning its row of the summary.
+    """
+    case_dir = case['outdir']
+    case_dir.mkdir(parents=True, exist_ok=True)
+
+    row = {
+        'name': case['name'],
+        'input_deck': str(case['input_deck']),
+        'phase_info': str(case['phase_info'] or ''),
+        'success': False,
+        'run_time': np.nan,
+        **{name: np.nan for name, _ in _summary_outputs},
+        'error': '',
+    }
+
+    # the problem names and reports of the cases run before by this process would
+    # clash with the ones of this case
+    _clear_problem_names()
+    clear_reports()
+
+    cwd = os.getcwd()
+    start_time = time.perf_counter()
+
+    with open(case_dir / 'run.log', 'w') as log, redirect_stdout(log), \
+            redirect_stderr(log):
+        try:
+            os.chdir(case_dir)
+
+            prob = run_level_1(
+                input_deck=str(case['input_deck']),
+                outdir=str(case_dir),
+                optimizer=case['optimizer'],
+                phase_info=None if case['phase_info'] is None else str(
+                    case['phase_info']),
+                max_iter=case['max_iter'],
+                analysis_scheme=case['analysis_scheme'],
+            )
+
+            row['success'] = bool(prob.problem_ran_successfully)
+
+            for name, units in _summary_outputs:
+                try:
+                    row[name] = prob.get_val(name, units=units)[0]
+                except KeyError:
+                    pass
+
+        except Exception as err:
+            traceback.print_exc()
+            row['error'] = f'{type(err).__name__}: {err}'
+
+        finally:
+            os.chdir(cwd)
+
+    row['run_time'] = time.perf_counter() - start_time
+
+    return row
+
+
+def _setup_batch_parser(parser):
+    def_outdir = os.path.join(os.getcwd(), "batch_output")
+    parser.add_argument(
+        'manifest',
+        type=str,
+        help='CSV file listing the cases to run, with an input_deck column and optional '
+        'name, phase_info, optimizer and max_iter columns',
+    )
+    parser.add_argument(
+        "-o", "--outdir", default=def_outdir, help="Directory to write outputs"
+    )
+    parser.add_argument(
+        "-n",
+        "--num_workers",
+        type=int,
+        default=1,
+        help="Number of cases run at the same time, each in its own process",
+    )
+    parser.add_argument(
+        "--optimizer",
+        type=str,
+        default='SNOPT',
+        help="Name of optimizer for cases that don't set one",
+        choices=("SNOPT", "IPOPT", "SLSQP", "None")
+    )
+    parser.add_argument(
+        "--max_iter",
+        type=int,
+        default=50,
+        help="maximum number of iterations for cases that don't set one")
+    parser.add_argument(
+        "--shooting",
+        action="store_true",
+        help="Use shooting instead of collocation",
+    )
+
+
+def _exec_batch(args, user_args):
+    if args.shooting:
+        analysis_scheme = AnalysisScheme.SHOOTING
+    else:
+        analysis_scheme = AnalysisScheme.COLLOCATION
+
+    summary = run_batch(
+        args.manifest,
+        outdir=args.outdir,
+        num_workers=args.num_workers,
+        optimizer=args.optimizer,
+        max_iter=args.max_iter,
+        analysis_scheme=analysis_scheme,
+    )
+
+    print(f"{summary['success'].sum()} of {len(summary)} cases succeeded, see "
+          f"{os.path.join(args.outdir, 'batch_summary.csv')}")
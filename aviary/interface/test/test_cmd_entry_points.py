@@ -48,6 +48,18 @@ class run_missionTestCases(CommandEntryPointsTestCases):
         self.run_and_test_cmd(cmd)
 
 
+class run_batchTestCases(CommandEntryPointsTestCases):
+    @require_pyoptsparse(optimizer="IPOPT")
+    def bench_test_IPOPT_cmd(self):
+        with open('manifest.csv', 'w') as manifest:
+            manifest.write('name,input_deck,phase_info\n'
+                           'GwGm,models/test_aircraft/aircraft_for_bench_GwGm.csv,'
+                           'interface/default_phase_info/two_dof.py\n'
+                           'FwFm,models/test_aircraft/aircraft_for_bench_FwFm.csv,\n')
+        cmd = 'aviary run_batch manifest.csv --optimizer IPOPT --max_iter 1 -n 2'
+        self.run_and_test_cmd(cmd)
+
+
 class fortran_to_aviaryTestCases(CommandEntryPointsTestCases):
     def test_diff_configuration_conversion(self):
         filepath = get_aviary_resource_path(
@@ -1,10 +1,19 @@
+import enum
 import unittest
 from pathlib import Path
 from copy import deepcopy
 
+import numpy as np
+from numpy.testing import assert_equal
+
+import openmdao.api as om
 from aviary.utils.functions import get_aviary_resource_path
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 import aviary.api as av
+from aviary.interface.methods_for_level2 import (
+    SIZING_SNAPSHOT_VERSION, _encode_snapshot_value, _fail_on_non_convergence,
+    _read_sizing_snapshot)
 from aviary.interface.default_phase_info.height_energy import phase_info, phase_info_parameterization
 
 
@@ -64,6 +73,138 @@ class TestJson(unittest.TestCase):
         prob_fallout = self.prob.fallout_mission(
             run_mission=False, json_filename=filepath, phase_info=local_phase_info)
 
+    def test_sizing_snapshot(self):
+        self.prob.final_setup()
+        self.prob.save_sizing_snapshot()
+
+        prob_snapshot = av.AviaryProblem()
+        prob_snapshot.aviary_inputs = av.AviaryValues()
+        _read_sizing_snapshot(prob_snapshot, 'sizing_problem.npz')
+
+        for name, (value, units) in self.prob.aviary_inputs:
+            if name in (av.Mission.Design.GROSS_MASS, av.Mission.Summary.GROSS_MASS):
+                continue
+            loaded_value, loaded_units = prob_snapshot.aviary_inputs.get_item(name)
+            self.assertEqual(loaded_units, units)
+            self.assertIs(type(loaded_value), type(value))
+            if isinstance(value, np.ndarray):
+                self.assertEqual(loaded_value.dtype, value.dtype)
+                assert_equal(loaded_value, value)
+            else:
+                self.assertEqual(loaded_value, value)
+
+        # the off-design mission starts from the final design variables of the sizing
+        # mission
+        prob_fallout = self.prob.fallout_mission(
+            run_mission=False, json_filename='sizing_problem.npz',
+            phase_info=local_phase_info)
+        prob_fallout.final_setup()
+        assert_near_equal(prob_fallout.get_val('traj.cruise.states:mass'),
+                          self.prob.get_val('traj.cruise.states:mass'))
+
+    def test_off_design_sweep(self):
+        filepath = self.get_file('interface/test/sizing_problem_for_test.json')
+        points = [{'mission_mass': 150000.}, {'mission_mass': 160000.},
+                  {'problem_type': av.ProblemType.ALTERNATE, 'mission_range': 2000.}]
+
+        results = self.prob.off_design_sweep(
+            points, json_filename=filepath, phase_info=local_phase_info,
+            run_driver=False)
+        parallel_results = self.prob.off_design_sweep(
+            points, n_workers=2, json_filename=filepath, phase_info=local_phase_info,
+            run_driver=False)
+
+        self.assertEqual(list(results['problem_type']),
+                         ['fallout', 'fallout', 'alternate'])
+        self.assertTrue(all(results['success']))
+        self.assertEqual(list(results[av.Mission.Summary.GROSS_MASS][:2]),
+                         [150000., 160000.])
+        self.assertTrue(results.equals(parallel_results))
+
+        # the payload is the one computed by the model, not the one requested
+        prob_fallout = self.prob.fallout_mission(
+            run_mission=False, json_filename=filepath, mission_mass=160000.,
+            phase_info=local_phase_info)
+        prob_fallout.run_model()
+
+        for name, units in ((av.Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm'),
+                            (av.Mission.Summary.GROSS_MASS, 'lbm'),
+                            (av.Mission.Summary.RANGE, 'NM'),
+                            (av.Mission.Summary.TOTAL_FUEL_MASS, 'lbm')):
+            assert_near_equal(results[name][1],
+                              prob_fallout.get_val(name, units=units)[0], 1e-10)
+
+    def test_off_design_sweep_solved_2dof(self):
+        self.prob.mission_method = av.EquationsOfMotion.SOLVED_2DOF
+
+        with self.assertRaisesRegex(ValueError, 'not supported for the solved_2DOF'):
+            self.prob.off_design_sweep([{'mission_mass': 150000.}])
+
+
+@use_tempdirs
+class TestSizingSnapshotTypes(unittest.TestCase):
+    """
+    Check that sizing snapshots only save and load the enums of aviary.
+    """
+
+    def test_forged_type_name(self):
+        # a snapshot whose only value claims to be of type os:system
+        np.savez('forged.npz', version=np.array(SIZING_SNAPSHOT_VERSION),
+                 index=np.array([['x', 'unitless', 'scalar', 'os:system', '<U7', '']]),
+                 offsets=np.array([0]), **{'values:U': np.array(['echo hi'])})
+
+        prob = av.AviaryProblem()
+        prob.aviary_inputs = av.AviaryValues()
+
+        with self.assertRaisesRegex(TypeError, 'unknown type "os:system"'):
+            _read_sizing_snapshot(prob, 'forged.npz')
+
+        self.assertNotIn('x', prob.aviary_inputs)
+
+    def test_other_enum(self):
+        Color = enum.Enum('Color', 'RED')
+
+        with self.assertRaisesRegex(TypeError, 'aviary.variable_info.enums'):
+            _encode_snapshot_value('x', Color.RED)
+
+        kind, type_names, _ = _encode_snapshot_value('x', av.Verbosity.BRIEF)
+        self.assertEqual(type_names, 'aviary.variable_info.enums:Verbosity')
+
+
+class TestFailOnNonConvergence(unittest.TestCase):
+    """
+    Check that off-design points run without a driver fail when their model is not
+    solved.
+    """
+
+    def test_outer_solver(self):
+        prob = om.Problem()
+        outer = prob.model.add_subsystem('outer', om.Group())
+        inner = outer.add_subsystem('inner', om.Group(), promotes=['*'])
+        # x**2 = 2, which Newton can't solve in one iteration from x = 1
+        inner.add_subsystem('square', om.ExecComp('y = x**2'), promotes=['*'])
+        inner.add_subsystem('balance', om.BalanceComp('x', val=1.0, lhs_name='y',
+                                                      rhs_val=2.0), promotes=['*'])
+
+        for group in (outer, inner):
+            group.nonlinear_solver = om.NewtonSolver(maxiter=1, iprint=-1,
+                                                     solve_subsystems=False)
+            group.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        _fail_on_non_convergence(prob)
+
+        self.assertTrue(outer.nonlinear_solver.options['err_on_non_converge'])
+        # inner solvers may fail while the outer one is iterating
+        self.assertFalse(inner.nonlinear_solver.options['err_on_non_converge'])
+
+        with self.assertRaises(om.AnalysisError):
+            prob.run_model()
+
+        outer.nonlinear_solver.options['maxiter'] = 20
+        prob.run_model()
+        assert_near_equal(prob.get_val('outer.x'), np.sqrt(2.0), 1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
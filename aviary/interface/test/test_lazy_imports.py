@@ -0,0 +1,75 @@
+import json
+import subprocess
+import sys
+import unittest
+
+# heavy dependencies that neither importing aviary.api nor printing the command line
+# help should import
+heavy_modules = ('dymos', 'bokeh', 'panel', 'tkinter')
+
+check_modules = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+print(json.dumps({{
+    'time': time.perf_counter() - start,
+    'modules': [name for name in {modules} if name in sys.modules],
+}}))
+"""
+
+
+def run_and_check_modules(statement):
+    """
+    Run a statement in a new interpreter, returning the time it took and which of the
+    heavy modules it imported.
+    """
+    code = check_modules.format(statement=statement, modules=heavy_modules)
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class LazyImportsTestCase(unittest.TestCase):
+    """
+    Test that aviary.api and the command line tools only import what they use.
+    """
+
+    def test_api_values(self):
+        result = run_and_check_modules(
+            'from aviary.api import AviaryValues, Aircraft, Mission')
+        self.assertEqual(result['modules'], [])
+
+    def test_api_attribute(self):
+        result = run_and_check_modules(
+            'import aviary.api as av\n'
+            'assert av.EngineDeck.__name__ == "EngineDeck"')
+        self.assertIn('dymos', result['modules'])
+
+    def test_api_all(self):
+        import aviary.api as av
+
+        for name in av.__all__:
+            self.assertIsNotNone(getattr(av, name), name)
+
+        with self.assertRaises(AttributeError):
+            av.NotAnAviaryObject
+
+    def test_cmd_help(self):
+        result = run_and_check_modules(
+            'import sys\n'
+            'sys.argv = ["aviary", "-h"]\n'
+            'from aviary.interface.cmd_entry_points import aviary_cmd\n'
+            'try:\n'
+            '    aviary_cmd()\n'
+            'except SystemExit:\n'
+            '    pass')
+        self.assertEqual(result['modules'], [])
+
+    def bench_test_import_time(self):
+        for statement in ('from aviary.api import AviaryValues',
+                          'from aviary.api import AviaryProblem'):
+            result = run_and_check_modules(statement)
+            print(f"{statement}: {result['time']:.2f} s")
+
+
+if __name__ == '__main__':
+    unittest.main()
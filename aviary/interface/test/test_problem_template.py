@@ -0,0 +1,102 @@
+from copy import deepcopy
+import unittest
+
+import openmdao.api as om
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.reports_system import clear_reports
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.methods_for_level1 import clear_problem_templates, run_aviary
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.functions import get_path
+from aviary.utils.process_input_decks import create_vehicle
+from aviary.variable_info.variables import Aircraft
+
+
+@use_tempdirs
+class ProblemTemplateTestCase(unittest.TestCase):
+    """
+    Test that run_aviary in template mode reuses the set-up problem.
+    """
+
+    def setUp(self):
+        clear_reports()
+        _clear_problem_names()
+        clear_problem_templates()
+        self.addCleanup(clear_problem_templates)
+        self.phase_info = deepcopy(phase_info)
+
+    def run_template(self, phase_info, input_values=None,
+                     aircraft='models/test_aircraft/aircraft_for_bench_FwFm.csv'):
+        return run_aviary(aircraft, phase_info, optimizer='SLSQP', max_iter=0,
+                          run_driver=False, make_plots=False, verbosity=0,
+                          template=True, input_values=input_values)
+
+    def test_reuse(self):
+        prob = self.run_template(self.phase_info)
+        span = prob.get_val(Aircraft.Wing.SPAN, units='ft')
+
+        input_values = AviaryValues()
+        input_values.set_val(Aircraft.Wing.SPAN, 120.0, units='ft')
+
+        # phase_info is filled in by the first call, while a new copy of it still
+        # describes the same problem
+        for local_phase_info in (self.phase_info, deepcopy(phase_info)):
+            new_prob = self.run_template(local_phase_info, input_values)
+            self.assertIs(new_prob, prob)
+            assert_near_equal(prob.get_val(Aircraft.Wing.SPAN, units='ft'), 120.0)
+
+        # every call starts over from the values of the first one
+        self.run_template(self.phase_info)
+        assert_near_equal(prob.get_val(Aircraft.Wing.SPAN, units='ft'), span)
+
+    def test_aircraft_values(self):
+        aircraft_values, _ = create_vehicle(
+            get_path('models/test_aircraft/aircraft_for_bench_FwFm.csv'))
+
+        prob = self.run_template(self.phase_info, aircraft=aircraft_values)
+
+        # values are matched on their contents, not their identity
+        same_values = aircraft_values.deepcopy()
+        self.assertIs(
+            self.run_template(self.phase_info, aircraft=same_values), prob)
+
+        same_values.set_val(Aircraft.Wing.SPAN, 120.0, units='ft')
+        self.assertIsNot(
+            self.run_template(self.phase_info, aircraft=same_values), prob)
+
+    def test_history_file(self):
+        for run_driver in (False, True):
+            num_cases = []
+            for _ in range(2):
+                prob = run_aviary('models/test_aircraft/aircraft_for_bench_FwFm.csv',
+                                  self.phase_info, optimizer='SLSQP', max_iter=0,
+                                  run_driver=run_driver, make_plots=False,
+                                  verbosity=0, template=True,
+                                  optimization_history_filename='history.db')
+
+                # the recorder of the previous run is never attached twice
+                self.assertLessEqual(len(prob.driver._rec_mgr._recorders), 1)
+                num_cases.append(len(om.CaseReader('history.db').list_cases(
+                    'driver', out_stream=None)))
+
+            if run_driver:
+                # the recorders are shut down after each run, so each one starts a
+                # new history
+                self.assertEqual(num_cases[0], num_cases[1])
+                self.assertGreater(num_cases[0], 0)
+
+    def test_options_need_setup(self):
+        input_values = AviaryValues()
+        input_values.set_val(Aircraft.Engine.NUM_ENGINES, [4])
+
+        with self.assertRaises(KeyError) as cm:
+            self.run_template(self.phase_info, input_values)
+
+        self.assertIn(Aircraft.Engine.NUM_ENGINES, str(cm.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
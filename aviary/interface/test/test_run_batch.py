@@ -0,0 +1,117 @@
+import unittest
+from pathlib import Path
+
+import pandas as pd
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.run_batch import read_manifest, run_batch
+from aviary.utils.functions import get_aviary_resource_path
+
+
+@use_tempdirs
+class ReadManifestTestCase(unittest.TestCase):
+    """
+    Test the parsing of the manifest of aviary run_batch.
+    """
+
+    def write_manifest(self, text):
+        with open('manifest.csv', 'w') as manifest:
+            manifest.write(text)
+
+    def test_read(self):
+        Path('decks').mkdir()
+        Path('decks/local.csv').touch()
+        self.write_manifest(
+            '# cases of the trade study\n'
+            'name, input_deck, phase_info, max_iter\n'
+            '\n'
+            ', models/test_aircraft/aircraft_for_bench_FwFm.csv, , 10\n'
+            'aircraft_for_bench_FwFm, models/test_aircraft/aircraft_for_bench_FwFm.csv,'
+            ' interface/default_phase_info/height_energy.py,\n'
+            'local, decks/local.csv, ,\n')
+
+        cases = read_manifest('manifest.csv')
+
+        deck = Path(get_aviary_resource_path(
+            'models/test_aircraft/aircraft_for_bench_FwFm.csv')).resolve()
+        phase_info = Path(get_aviary_resource_path(
+            'interface/default_phase_info/height_energy.py')).resolve()
+
+        self.assertEqual(cases, [
+            {'name': 'aircraft_for_bench_FwFm', 'input_deck': deck, 'phase_info': None,
+             'max_iter': 10},
+            {'name': 'aircraft_for_bench_FwFm_2', 'input_deck': deck,
+             'phase_info': phase_info},
+            {'name': 'local', 'input_deck': Path('decks/local.csv').resolve(),
+             'phase_info': None},
+        ])
+
+    def test_unknown_column(self):
+        self.write_manifest('input_deck,optimiser\n'
+                            'models/test_aircraft/aircraft_for_bench_FwFm.csv,SLSQP\n')
+
+        with self.assertRaises(ValueError) as cm:
+            read_manifest('manifest.csv')
+
+        self.assertIn("unknown manifest columns ['optimiser']", str(cm.exception))
+
+    def test_missing_input_deck(self):
+        self.write_manifest('name,input_deck\n'
+                            'first,\n')
+
+        with self.assertRaises(ValueError) as cm:
+            read_manifest('manifest.csv')
+
+        self.assertIn('case 1 has no input_deck', str(cm.exception))
+
+    def test_unsafe_name(self):
+        for name in ('../outside', 'cases/first', '..'):
+            with self.subTest(name=name):
+                self.write_manifest(
+                    'name,input_deck\n'
+                    f'{name},models/test_aircraft/aircraft_for_bench_FwFm.csv\n')
+
+                with self.assertRaises(ValueError) as cm:
+                    read_manifest('manifest.csv')
+
+                self.assertIn(f'case 1 has name "{name}", which is not a valid '
+                              'directory name', str(cm.exception))
+
+
+@use_tempdirs
+class RunBatchTestCase(unittest.TestCase):
+    """
+    Test that aviary run_batch reports the cases that fail.
+    """
+
+    def test_failed_cases(self):
+        # input decks that fail right away, missing most of their settings
+        with open('broken.csv', 'w') as deck:
+            deck.write('aircraft:wing:area,1370.0,ft**2\n')
+        with open('manifest.csv', 'w') as manifest:
+            manifest.write('name,input_deck,optimizer\n'
+                           'first,broken.csv,None\n'
+                           'second,broken.csv,None\n')
+
+        for num_workers in (1, 2):
+            with self.subTest(num_workers=num_workers):
+                outdir = Path(f'batch_{num_workers}')
+                summary = run_batch('manifest.csv', outdir=outdir,
+                                    num_workers=num_workers)
+
+                self.assertEqual(list(summary['name']), ['first', 'second'])
+                self.assertFalse(summary['success'].any())
+                for error in summary['error']:
+                    self.assertIn('settings:equations_of_motion', error)
+
+                saved = pd.read_csv(outdir / 'batch_summary.csv')
+                self.assertEqual(list(saved['name']), ['first', 'second'])
+                self.assertFalse(saved['success'].any())
+
+                for name in ('first', 'second'):
+                    with open(outdir / name / 'run.log') as log:
+                        self.assertIn('Traceback', log.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+from copy import deepcopy
+import unittest
+
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.reports_system import clear_reports
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.utils.warm_start import WarmStartDatabase
+
+
+def setup_problem(local_phase_info, warm_start=None):
+    prob = AviaryProblem()
+    prob.load_inputs('models/test_aircraft/aircraft_for_bench_FwFm.csv',
+                     local_phase_info)
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver('SLSQP', max_iter=0)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses(warm_start)
+    return prob
+
+
+@use_tempdirs
+class WarmStartTestCase(unittest.TestCase):
+    """
+    Test that the solution saved in a warm-start store is used as initial guess.
+    """
+
+    def setUp(self):
+        clear_reports()
+        _clear_problem_names()
+
+        self.prob = setup_problem(deepcopy(phase_info))
+        self.prob.run_aviary_problem(run_driver=False, make_plots=False,
+                                     warm_start='warm_start')
+
+    def test_same_structure(self):
+        prob = setup_problem(deepcopy(phase_info), warm_start='warm_start')
+        prob.final_setup()
+
+        for name in ('t_initial', 't_duration', 'states:mass', 'states:distance',
+                     'polynomial_controls:mach', 'polynomial_controls:altitude'):
+            assert_near_equal(prob.get_val(f'traj.cruise.{name}'),
+                              self.prob.get_val(f'traj.cruise.{name}'), 1e-12)
+
+    def test_new_grid(self):
+        local_phase_info = deepcopy(phase_info)
+        local_phase_info['cruise']['user_options']['num_segments'] = 6
+
+        prob = setup_problem(local_phase_info)
+        self.assertTrue(WarmStartDatabase('warm_start').load(prob))
+        prob.final_setup()
+
+        assert_near_equal(prob.get_val('traj.cruise.t_duration'),
+                          self.prob.get_val('traj.cruise.t_duration'), 1e-12)
+
+        # the ends of the phase are nodes of both grids
+        mass = prob.get_val('traj.cruise.states:mass')
+        expected_mass = self.prob.get_val('traj.cruise.states:mass')
+        self.assertEqual(len(mass), 19)
+        assert_near_equal(mass[[0, -1]], expected_mass[[0, -1]], 1e-12)
+
+    def test_empty(self):
+        self.assertFalse(WarmStartDatabase('empty').load(self.prob))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+A persistent store of converged trajectories, used to warm start the collocation
+phases of problems that share the phase structure of an earlier run.
+
+Each entry is a .npz file in the directory of the store, named after a hash of the
+phase structure of the trajectory: the name, transcription, number of segments and
+order of each phase. An entry holds the initial time and duration of each phase, and
+the input values of its states and controls along with their locations in the
+normalized time of the phase, so they can be interpolated onto a different grid.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import dymos as dm
+import numpy as np
+from dymos.utils.lgl import lgl
+
+
+def get_phase_structure(traj):
+    """
+    Return the phase structure of a trajectory as a list of the name, transcription,
+    number of segments and order of each of its phases.
+    """
+    structure = []
+    for phase_name, phase in traj._phases.items():
+        transcription = phase.options['transcription']
+        structure.append([phase_name, type(transcription).__name__,
+                          transcription.options['num_segments'],
+                          np.asarray(transcription.options['order']).tolist()])
+
+    return structure
+
+
+def _is_collocation(phase):
+    return isinstance(phase.options['transcription'], (dm.Radau, dm.GaussLobatto))
+
+
+def _get_phase_variables(phase):
+    """
+    Yield the path, units and node locations of the states and controls of a
+    collocation phase.
+    """
+    grid_data = phase.options['transcription'].grid_data
+
+    state_ptau = grid_data.node_ptau[grid_data.subset_node_indices['state_input']]
+    for name, options in phase.state_options.items():
+        yield f'states:{name}', options['units'], state_ptau
+
+    control_ptau = grid_data.node_ptau[grid_data.subset_node_indices['control_input']]
+    for name, options in phase.control_options.items():
+        yield f'controls:{name}', options['units'], control_ptau
+
+    for name, options in getattr(phase, 'polynomial_control_options', {}).items():
+        ptau, _ = lgl(options['order'] + 1)
+        yield f'polynomial_controls:{name}', options['units'], ptau
+
+
+class WarmStartDatabase:
+    """
+    A directory of converged trajectories, keyed on their phase structure.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory the entries are saved in. It is created when the first entry is
+        saved.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _get_filename(self, structure):
+        key = hashlib.sha1(json.dumps(structure).encode()).hexdigest()
+        return self.directory / f'{key}.npz'
+
+    def _find_entry(self, structure):
+        """
+        Return the file of the entry with the given phase structure. If there is none,
+        return the latest entry with the same phases and transcriptions, whose
+        solution is interpolated onto the new grid, or None.
+        """
+        filename = self._get_filename(structure)
+        if filename.exists():
+            return filename
+
+        if not self.directory.is_dir():
+            return None
+
+        phases = [item[:2] for item in structure]
+        compatible = []
+
+        for filename in self.directory.glob('*.npz'):
+            with np.load(filename) as entry:
+                entry_structure = json.loads(entry['structure'].item())
+
+            if [item[:2] for item in entry_structure] == phases:
+                compatible.append(filename)
+
+        if not compatible:
+            return None
+
+        return max(compatible, key=lambda filename: filename.stat().st_mtime_ns)
+
+    def save(self, prob):
+        """
+        Save the current solution of the collocation phases of a problem, replacing
+        any entry with the same phase structure.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            Problem that has been run.
+
+        Returns
+        -------
+        Path
+            The file the entry was saved to.
+        """
+        traj = prob.model.traj
+        structure = get_phase_structure(traj)
+
+        index = []
+        arrays = {'structure': np.array(json.dumps(structure))}
+
+        for phase_name, phase in traj._phases.items():
+            if not _is_collocation(phase):
+                continue
+
+            time_units = phase.time_options['units']
+            variables = [('t_initial', time_units, None),
+                         ('t_duration', time_units, None),
+                         *_get_phase_variables(phase)]
+
+            for path, units, ptau in variables:
+                idx = len(index)
+                index.append((phase_name, path, units or ''))
+                arrays[f'value:{idx}'] = prob.get_val(f'traj.{phase_name}.{path}',
+                                                      units=units)
+                if ptau is not None:
+                    arrays[f'ptau:{idx}'] = ptau
+
+        arrays['index'] = np.array(index, dtype=str).reshape(-1, 3)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        filename = self._get_filename(structure)
+
+        # write to a temporary file first so that runs sharing the store never read a
+        # partial entry
+        tmp_filename = filename.with_name(f'{filename.name}.{os.getpid()}.tmp')
+        with open(tmp_filename, 'wb') as tmp_file:
+            np.savez(tmp_file, **arrays)
+        os.replace(tmp_filename, filename)
+
+        return filename
+
+    def load(self, prob):
+        """
+        Set the initial guesses of the collocation phases of a problem from the entry
+        with its phase structure, or from a compatible one. Phases and variables that
+        are not in the entry are left unchanged.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            Problem that has been set up.
+
+        Returns
+        -------
+        bool
+            True if an entry was found and loaded.
+        """
+        traj = prob.model.traj
+        filename = self._find_entry(get_phase_structure(traj))
+
+        if filename is None:
+            return False
+
+        with np.load(filename) as entry:
+            index = entry['index'].tolist()
+            arrays = {key: entry[key] for key in entry.files}
+
+        phase_paths = {
+            phase_name: {path for path, *_ in _get_phase_variables(phase)}
+            for phase_name, phase in traj._phases.items()
+            if _is_collocation(phase)}
+
+        for idx, (phase_name, path, units) in enumerate(index):
+            if phase_name not in phase_paths:
+                continue
+
+            phase = traj._phases[phase_name]
+            val = arrays[f'value:{idx}']
+            units = units or None
+
+            if path not in ('t_initial', 't_duration'):
+                if path not in phase_paths[phase_name]:
+                    continue
+
+                # segment boundaries can repeat a node
+                ptau, unique = np.unique(arrays[f'ptau:{idx}'], return_index=True)
+                val = phase.interp(path.split(':')[-1], ys=val[unique], xs=ptau)
+
+            prob.set_val(f'traj.{phase_name}.{path}', val, units=units)
+
+        return True
@@ -92,8 +92,8 @@ class MissionODE(om.Group):
 
         if analysis_scheme is AnalysisScheme.SHOOTING:
             SGM_required_inputs = {
-                't_curr': {'units': 's'},
-                Dynamic.Mission.DISTANCE: {'units': 'm'},
+                't_curr': {'units': 's', 'shape': nn},
+                Dynamic.Mission.DISTANCE: {'units': 'm', 'shape': nn},
             }
             add_SGM_required_inputs(self, SGM_required_inputs)
 
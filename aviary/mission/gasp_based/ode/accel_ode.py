@@ -25,8 +25,8 @@ class AccelODE(BaseODE):
 
         if analysis_scheme is AnalysisScheme.SHOOTING:
             add_SGM_required_inputs(self, {
-                't_curr': {'units': 's'},
-                Dynamic.Mission.DISTANCE: {'units': 'ft'},
+                't_curr': {'units': 's', 'shape': nn},
+                Dynamic.Mission.DISTANCE: {'units': 'ft', 'shape': nn},
             })
             add_SGM_required_outputs(self, {
                 Dynamic.Mission.ALTITUDE_RATE: {'units': 'ft/s'},
@@ -31,8 +31,8 @@ class AscentODE(BaseODE):
         ascent_params = ParamPort()
         if analysis_scheme is AnalysisScheme.SHOOTING:
             add_SGM_required_inputs(self, {
-                Dynamic.Mission.ALTITUDE: {'units': 'ft'},
-                Dynamic.Mission.DISTANCE: {'units': 'ft'},
+                Dynamic.Mission.ALTITUDE: {'units': 'ft', 'shape': nn},
+                Dynamic.Mission.DISTANCE: {'units': 'ft', 'shape': nn},
             })
 
             ascent_params.add_params({
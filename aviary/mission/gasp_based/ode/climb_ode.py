@@ -53,8 +53,8 @@ class ClimbODE(BaseODE):
 
         if analysis_scheme is AnalysisScheme.SHOOTING:
             add_SGM_required_inputs(self, {
-                't_curr': {'units': 's'},
-                Dynamic.Mission.DISTANCE: {'units': 'ft'},
+                't_curr': {'units': 's', 'shape': nn},
+                Dynamic.Mission.DISTANCE: {'units': 'ft', 'shape': nn},
                 'alt_trigger': {'units': self.options['alt_trigger_units'], 'val': 10e3},
                 'speed_trigger': {'units': self.options['speed_trigger_units'], 'val': 100},
             })
@@ -64,14 +64,14 @@ class FlightPathODE(BaseODE):
 
         if analysis_scheme is AnalysisScheme.SHOOTING:
             SGM_required_inputs = {
-                't_curr': {'units': 's'},
+                't_curr': {'units': 's', 'shape': nn},
                 'distance_trigger': {'units': 'ft'},
-                Dynamic.Mission.ALTITUDE: {'units': 'ft'},
-                Dynamic.Mission.DISTANCE: {'units': 'ft'},
+                Dynamic.Mission.ALTITUDE: {'units': 'ft', 'shape': nn},
+                Dynamic.Mission.DISTANCE: {'units': 'ft', 'shape': nn},
             }
             if kwargs['method'] == 'cruise':
                 SGM_required_inputs[Dynamic.Mission.FLIGHT_PATH_ANGLE] = {
-                    'val': 0, 'units': 'deg'}
+                    'val': 0, 'units': 'deg', 'shape': nn}
             add_SGM_required_inputs(self, SGM_required_inputs)
             prop_group = om.Group()
         else:
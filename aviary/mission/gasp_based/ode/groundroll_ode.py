@@ -40,7 +40,7 @@ class GroundrollODE(BaseODE):
 
         if analysis_scheme is AnalysisScheme.SHOOTING:
             add_SGM_required_inputs(self, {
-                Dynamic.Mission.DISTANCE: {'units': 'ft'},
+                Dynamic.Mission.DISTANCE: {'units': 'ft', 'shape': nn},
             })
 
         # TODO: paramport
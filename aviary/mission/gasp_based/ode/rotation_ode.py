@@ -24,7 +24,7 @@ class RotationODE(BaseODE):
 
         if analysis_scheme is AnalysisScheme.SHOOTING:
             add_SGM_required_inputs(self, {
-                Dynamic.Mission.DISTANCE: {'units': 'ft'},
+                Dynamic.Mission.DISTANCE: {'units': 'ft', 'shape': nn},
             })
 
         # TODO: paramport
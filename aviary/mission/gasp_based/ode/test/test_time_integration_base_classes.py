@@ -0,0 +1,349 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.mission.gasp_based.ode.time_integration_base_classes import (
+    SGMCheckpoints, SimuPyProblem)
+from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
+from aviary.variable_info.enums import Verbosity
+
+
+class _DecayODE(om.Group):
+    """
+    Small ODE with a scalar parameter used to check batch evaluation.
+    """
+
+    def initialize(self):
+        self.options.declare("num_nodes", default=1, types=int)
+
+    def setup(self):
+        nn = self.options["num_nodes"]
+
+        self.add_subsystem(
+            "eom",
+            om.ExecComp(
+                ["x_rate = -k*x*t_curr", "y_rate = x + y**2", "z = x*y"],
+                x_rate={"shape": nn, "units": "1/s"},
+                y_rate={"shape": nn, "units": "1/s"},
+                z={"shape": nn, "units": "unitless"},
+                x={"shape": nn, "units": "unitless"},
+                y={"shape": nn, "units": "unitless"},
+                t_curr={"shape": nn, "units": "s"},
+                k={"val": 0.5, "units": "1/s**2"},
+            ),
+            promotes=["*"],
+        )
+
+
+class _ScaledDecayODE(_DecayODE):
+    """
+    _DecayODE that can only be built with a constructor argument.
+    """
+
+    def __init__(self, scale, **kwargs):
+        super().__init__(**kwargs)
+        self.scale = scale
+
+
+class SimuPyProblemBatchTestCase(unittest.TestCase):
+    """
+    Test that evaluating the ODE at many points in a single batch matches evaluating
+    it point by point.
+    """
+
+    def setUp(self):
+        self.ts = np.linspace(0.0, 3.0, 7)
+        self.xs = np.column_stack([np.linspace(1.0, 2.0, 7), np.linspace(-1.0, 0.5, 7)])
+
+    def build(self, batch_size):
+        prob = SimuPyProblem(
+            _DecayODE(),
+            states=["x", "y"],
+            outputs=["z"],
+            batch_size=batch_size,
+        )
+        prob.set_val("k", 2.0)
+        return prob
+
+    def test_compute_along_traj(self):
+        # 7 points do not fill the batches, so the last batch is padded
+        batched = self.build(batch_size=4)
+        pointwise = self.build(batch_size=0)
+
+        self.assertIsNotNone(batched.batch_prob)
+        self.assertIsNone(pointwise.batch_prob)
+
+        x, y = self.xs.T
+        expected_rates = np.column_stack([-2.0 * x * self.ts, x + y**2])
+
+        for prob in (batched, pointwise):
+            state_rates, outputs = prob.compute_along_traj(self.ts, self.xs)
+            assert_near_equal(state_rates, expected_rates, 1e-12)
+            assert_near_equal(outputs[:, 0], x * y, 1e-12)
+
+    def test_batch_disabled(self):
+        prob = SimuPyProblem(_ScaledDecayODE(2.0), states=["x", "y"], outputs=["z"],
+                             batch_size=4, verbosity=Verbosity.BRIEF)
+
+        with self.assertWarnsRegex(UserWarning, "cannot be built without arguments"):
+            self.assertIsNone(prob.batch_prob)
+
+        state_rates, outputs = prob.compute_along_traj(self.ts, self.xs)
+        x, y = self.xs.T
+        assert_near_equal(outputs[:, 0], x * y, 1e-12)
+
+    def test_compute_totals_along_traj(self):
+        batched = self.build(batch_size=4)
+        pointwise = self.build(batch_size=0)
+
+        of = ["x_rate", "y_rate"]
+        wrt = ["x", "y", "k"]
+        totals = batched.compute_totals_along_traj(self.ts, self.xs, of, wrt)
+        expected = pointwise.compute_totals_along_traj(self.ts, self.xs, of, wrt)
+
+        self.assertEqual(totals.shape, (7, 2, 3))
+        assert_near_equal(totals, expected, 1e-12)
+
+        x, y = self.xs.T
+        assert_near_equal(totals[:, 0, 0], -2.0 * self.ts, 1e-12)
+        assert_near_equal(totals[:, 0, 2], -x * self.ts, 1e-12)
+        assert_near_equal(totals[:, 1, 1], 2.0 * y, 1e-12)
+
+
+class SimuPyProblemCacheTestCase(unittest.TestCase):
+    """
+    Test that repeated evaluations at the same point reuse the cached model run.
+    """
+
+    def setUp(self):
+        self.prob = SimuPyProblem(_DecayODE(), states=["x", "y"], outputs=["z"],
+                                  cache_size=2)
+        self.prob.set_val("k", 2.0)
+        self.prob.add_trigger("x", 0.5)
+        self.prob.output_nan = False
+
+    def test_cache_hits(self):
+        prob = self.prob
+        x = np.array([1.5, -0.5])
+
+        rate = prob.state_equation_function(1.0, x)
+        assert_near_equal(rate, [-3.0, 1.75], 1e-12)
+        self.assertEqual(prob.cache_info().misses, 1)
+
+        # outputs and events at the same point do not rerun the model
+        assert_near_equal(prob.output_equation_function(1.0, x), [-0.75], 1e-12)
+        assert_near_equal(prob.event_equation_function(1.0, x), [1.0], 1e-12)
+        self.assertEqual(prob.cache_info(), (2, 1, 2, 1))
+
+        # evaluating other points evicts the oldest entry, and going back to a cached
+        # point restores all of its outputs
+        prob.state_equation_function(2.0, x)
+        prob.state_equation_function(1.0, x)
+        self.assertEqual(prob.cache_info(), (3, 2, 2, 2))
+        assert_near_equal(prob.get_val("x_rate"), [-3.0], 1e-12)
+        assert_near_equal(prob.compute_totals("x_rate", "x", return_format='array'),
+                          [[-2.0]], 1e-12)
+
+        prob.state_equation_function(3.0, x)
+        prob.state_equation_function(2.0, x)
+        self.assertEqual(prob.cache_info(), (3, 4, 2, 2))
+
+    def test_parameter_change_clears_cache(self):
+        prob = self.prob
+        x = np.array([1.5, -0.5])
+
+        prob.state_equation_function(1.0, x)
+        # setting the same value keeps the cache
+        prob.set_val("k", 2.0)
+        self.assertEqual(prob.cache_info().currsize, 1)
+
+        prob.set_val("k", 4.0)
+        self.assertEqual(prob.cache_info().currsize, 0)
+
+        rate = prob.state_equation_function(1.0, x)
+        assert_near_equal(rate, [-6.0, 1.75], 1e-12)
+        self.assertEqual(prob.cache_info().misses, 2)
+
+
+class SimuPyProblemVectorMapTestCase(unittest.TestCase):
+    """
+    Test that reading and writing groups of variables directly in the problem vectors
+    matches get_val and set_val, including unit conversion.
+    """
+
+    def setUp(self):
+        self.prob = SimuPyProblem(
+            _DecayODE(),
+            states={
+                "x": {"units": "unitless", "rate": "x_rate", "rate_units": "1/min"},
+                "y": {"units": "unitless", "rate": "y_rate", "rate_units": None},
+            },
+            parameters={"k": "1/min**2"},
+            outputs=["z"],
+        )
+
+    def test_gather(self):
+        prob = self.prob
+        prob.set_val("k", 2.0)
+        prob.state_equation_function(1.0, np.array([1.5, -0.5]))
+
+        for kind in ("time", "state", "state_rate", "parameter", "output"):
+            self.assertIsNotNone(prob._get_vector_map(kind))
+            expected = np.array([prob.get_val(name, units=units)[0]
+                                 for name, units in prob._get_vector_items(kind)])
+            assert_near_equal(prob._gather(kind), expected, 1e-14)
+
+        assert_near_equal(prob.state_rate, [-180.0, 1.75], 1e-14)
+        assert_near_equal(prob.parameter, [7200.0], 1e-14)
+
+    def test_scatter(self):
+        prob = self.prob
+        prob.time = 2.0
+        prob.state = np.array([3.0, 4.0])
+        prob.parameter = np.array([3600.0])
+
+        assert_near_equal(prob.get_val("t_curr"), [2.0], 1e-14)
+        assert_near_equal(prob.get_val("y"), [4.0], 1e-14)
+        assert_near_equal(prob.get_val("k", units="1/s**2"), [1.0], 1e-14)
+
+        prob.compute()
+        assert_near_equal(prob.state_rate, [-360.0, 19.0], 1e-14)
+
+
+class SGMCheckpointsTestCase(unittest.TestCase):
+    """
+    Test that checkpointed phases can be integrated again between checkpoints, and
+    that cached data stays under the memory limit.
+    """
+
+    def setUp(self):
+        self.prob = SimuPyProblem(_DecayODE(), states=["x", "y"], outputs=["z"])
+        self.prob.add_trigger("y", 0.5)
+        self.prob.initial_condition = np.array([1.0, 0.0])
+        self.sim_result = self.prob.simulate((0.0, 100.0))
+
+    def test_dense(self):
+        checkpoints = SGMCheckpoints()
+        result = checkpoints.add_phase(self.prob, self.sim_result)
+
+        self.assertTrue(checkpoints.is_dense(0))
+        self.assertEqual(checkpoints.num_segments(0), 1)
+        t, x = checkpoints.get_segment(0, 0)
+        assert_near_equal(t, self.sim_result.t, 0.0)
+        assert_near_equal(x, self.sim_result.x, 0.0)
+        assert_near_equal(result.y, self.sim_result.y, 0.0)
+        self.assertEqual(checkpoints.recomputed_segments, 0)
+
+    def test_recompute_segments(self):
+        checkpoints = SGMCheckpoints(num_checkpoints=3)
+        result = checkpoints.add_phase(self.prob, self.sim_result)
+
+        self.assertFalse(checkpoints.is_dense(0))
+        self.assertEqual(result.t.shape, (3,))
+        assert_near_equal(result.x[[0, -1]], self.sim_result.x[[0, -1]], 0.0)
+        assert_near_equal(result.e[-1], self.sim_result.e[-1], 0.0)
+
+        segments = [checkpoints.get_segment(0, idx) for idx in range(2)]
+        self.assertEqual(checkpoints.recomputed_segments, 2)
+        # the segments meet at the checkpoints and follow the original solution
+        assert_near_equal(segments[0][0][[0, -1]], result.t[:2], 0.0)
+        assert_near_equal(segments[1][1][[0, -1]], result.x[1:], 0.0)
+        t_ref, x_ref = self.sim_result.t, self.sim_result.x
+        for t, x in segments:
+            for col in range(2):
+                assert_near_equal(x[:, col], np.interp(t, t_ref, x_ref[:, col]), 1e-2)
+
+        # cached segments are not integrated again
+        checkpoints.get_segment(0, 0)
+        self.assertEqual(checkpoints.recomputed_segments, 2)
+
+    def test_memory_limit(self):
+        checkpoints = SGMCheckpoints(memory_limit=200)
+
+        checkpoints.get('a', lambda: np.zeros(10))
+        checkpoints.get('b', lambda: np.zeros(10))
+        self.assertEqual(checkpoints.nbytes, 160)
+
+        # using "a" again makes "b" the least recently used entry
+        checkpoints.get('a', lambda: self.fail("'a' should be cached"))
+        checkpoints.get('c', lambda: (np.zeros(3), np.zeros(4)))
+        self.assertEqual(list(checkpoints._cache), ['a', 'c'])
+        self.assertEqual(checkpoints.nbytes, 136)
+
+        # data larger than the limit is returned but not kept
+        val = checkpoints.get('d', lambda: np.ones(30))
+        assert_near_equal(val, np.ones(30), 0.0)
+        self.assertEqual(checkpoints.nbytes, 0)
+
+
+def _build_decay_phase(trigger):
+    prob = SimuPyProblem(
+        _DecayODE(),
+        states={
+            "x": {"units": "unitless", "rate": "x_rate", "rate_units": "1/s"},
+            "y": {"units": "unitless", "rate": "y_rate", "rate_units": "1/s"},
+        },
+        parameters={"k": "1/s**2"},
+        outputs=["z"],
+    )
+    prob.add_trigger("y", trigger)
+    return prob
+
+
+@use_tempdirs
+class SGMTrajBaseCheckpointsTestCase(unittest.TestCase):
+    """
+    Test that the partials of a trajectory computed from checkpoints, with or without
+    cached segments, match the ones computed from every integrator step.
+    """
+
+    def run_traj(self, **options):
+        phases = {
+            "first": {"builder": _build_decay_phase, "kwargs": {"trigger": 0.6},
+                      "user_options": {}},
+            "second": {"builder": _build_decay_phase, "kwargs": {"trigger": 1.5},
+                       "user_options": {}},
+        }
+        traj = FlexibleTraj(
+            Phases=phases, traj_initial_state_input=["x", "y"],
+            traj_final_state_output=["x"],
+            param_dict={"k": {"val": 0.5, "units": "1/s**2"}}, **options)
+
+        prob = om.Problem()
+        prob.model.add_subsystem("traj", traj, promotes=["*"])
+        prob.setup()
+        prob.set_val("x_initial", 1.0)
+        prob.set_val("y_initial", 0.0)
+        prob.run_model()
+
+        # the trajectory is the only component, so these are its partials
+        totals = prob.compute_totals("x_final", ["x_initial", "y_initial", "k"],
+                                     return_format="array")
+        return totals, traj.checkpoints
+
+    def test_partials(self):
+        expected, checkpoints = self.run_traj()
+        self.assertEqual(checkpoints.recomputed_segments, 0)
+
+        totals, checkpoints = self.run_traj(num_checkpoints=4)
+        self.assertFalse(checkpoints.is_dense(1))
+        self.assertGreater(checkpoints.recomputed_segments, 0)
+        assert_near_equal(totals, expected, 1e-3)
+
+        # nothing is kept, so every segment is integrated again when it is needed
+        limited_totals, limited_checkpoints = self.run_traj(
+            num_checkpoints=4, checkpoint_memory_limit=1)
+        self.assertEqual(limited_checkpoints.nbytes, 0)
+        self.assertGreater(limited_checkpoints.recomputed_segments,
+                           checkpoints.recomputed_segments)
+        assert_near_equal(limited_totals, totals, 1e-12)
+
+        dense_totals, _ = self.run_traj(checkpoint_memory_limit=1)
+        assert_near_equal(dense_totals, expected, 1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
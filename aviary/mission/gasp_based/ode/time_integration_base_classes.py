@@ -1,8 +1,17 @@
+from collections import namedtuple, OrderedDict
+from contextlib import redirect_stdout
+import inspect
+import io
+import sys
+import warnings
+
 import numpy as np
 from scipy import interpolate
 
 import openmdao.api as om
+from openmdao.utils import name_maps as om_name_maps
 from openmdao.utils import units
+from openmdao.utils.coloring import ColoringMeta, compute_total_coloring
 
 from simupy.block_diagram import DEFAULT_INTEGRATOR_OPTIONS, SimulationMixin
 from simupy.systems import DynamicalSystem
@@ -70,6 +79,14 @@ class event_trigger():
         self.channel_name = channel_name
 
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# location of a group of scalar variables in the root output vector of a problem, and
+# the factors and offsets that convert them from their source units as
+# (val + offset) * factor
+VectorMap = namedtuple('VectorMap', ['indices', 'factor', 'offset'])
+
+
 class SimuPyProblem(SimulationMixin):
     """
     Subproblem used as a basis for forward in time integration phases.
@@ -96,7 +113,8 @@ class SimuPyProblem(SimulationMixin):
         verbosity=Verbosity.QUIET,
         max_allowable_time=1_000_000,
         adjoint_int_opts=DEFAULT_INTEGRATOR_OPTIONS.copy(),
-
+        batch_size=32,
+        cache_size=8,
     ):
         """
         states: a dictionary of the form {state_name:{'units':unit, 'rate':state_rate_name, 'rate_units':state_rate_units}}
@@ -109,6 +127,10 @@ class SimuPyProblem(SimulationMixin):
         include_state_outputs : automatically add the state to the input
         works well for auto-parsed naming, does not check for duplication before adding
         states, parameters, outputs, and controls can also be input as a list of keys for the dictionary
+        batch_size: number of nodes in the copy of the ODE used to evaluate many (t, x)
+        points in a single run_model, set to 0 to always evaluate point by point
+        cache_size: number of model evaluations kept to avoid rerunning the model at a
+        time/state/control point that was already computed, set to 0 to disable
         """
 
         default_om_list_args = dict(prom_name=True, val=False,
@@ -121,29 +143,22 @@ class SimuPyProblem(SimulationMixin):
         self.adjoint_int_opts['name'] = "dop853"
 
         self.dt = 0.0
-        prob = om.Problem()
-        if aviary_options:
-            from aviary.interface.methods_for_level2 import AviaryGroup
-            prob.model = AviaryGroup(
-                aviary_options=aviary_options, aviary_metadata=meta_data)
-        prob.model.add_subsystem(
-            "ODE_group",
-            ode,
-            promotes=["*"],
-        )
+        self.aviary_options = aviary_options
+        self.meta_data = meta_data
         self.ode = ode
+        self.prob = prob = self._setup_problem(ode)
 
-        self.prob = prob
-        prob.setup(check=False, force_alloc_complex=True)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
-        # TODO - This is a hack to mimic the behavior of the old paramport, which
-        # contains some initial default values. It is unclear how actual "parameter"
-        # values are supposed to propagate from the pre-mission and top ivcs into
-        # the SGM phases.
-        from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
-        set_params_for_unit_tests(prob)
+        self._vector_maps = {}
 
-        prob.final_setup()
+        self.batch_size = batch_size
+        self._batch_prob = None
+        self._batch_inputs = None
+        self._batch_colorings = {}
 
         if triggers is None:
             triggers = []
@@ -262,6 +277,10 @@ class SimuPyProblem(SimulationMixin):
         self.dim_output = len(outputs)
         self.dim_input = len(controls)
         self.dim_parameters = len(parameters)
+
+        for kind in ('time', 'state', 'state_rate', 'control', 'parameter', 'output'):
+            self._get_vector_map(kind)
+
         # TODO: add defensive checks to make sure dimensions match in both setup and
         # calls
         if verbosity >= Verbosity.VERBOSE:
@@ -273,53 +292,361 @@ class SimuPyProblem(SimulationMixin):
                 prob.model.list_inputs(out_stream=outfile,)
             print(states)
 
+    def _setup_problem(self, ode):
+        prob = om.Problem()
+        if self.aviary_options:
+            from aviary.interface.methods_for_level2 import AviaryGroup
+            prob.model = AviaryGroup(
+                aviary_options=self.aviary_options, aviary_metadata=self.meta_data)
+        prob.model.add_subsystem(
+            "ODE_group",
+            ode,
+            promotes=["*"],
+        )
+
+        prob.setup(check=False, force_alloc_complex=True)
+
+        # TODO - This is a hack to mimic the behavior of the old paramport, which
+        # contains some initial default values. It is unclear how actual "parameter"
+        # values are supposed to propagate from the pre-mission and top ivcs into
+        # the SGM phases.
+        from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
+        set_params_for_unit_tests(prob)
+
+        prob.final_setup()
+
+        return prob
+
     def add_parameter(self, name, units, **kwargs):
         self.parameters[name] = units
         self.dim_parameters = len(self.parameters)
+        self._vector_maps.pop('parameter', None)
+
+    def _get_vector_items(self, kind):
+        """
+        Return the (name, units) of each variable in a group of problem variables.
+        """
+        if kind == 'time':
+            return [(self.t_name, None)]
+        if kind == 'state':
+            return [(name, data['units']) for name, data in self.states.items()]
+        if kind == 'state_rate':
+            return [(data['rate'], data['rate_units']) for data in self.states.values()]
+        if kind == 'control':
+            return list(self.controls.items())
+        if kind == 'parameter':
+            return list(self.parameters.items())
+        if kind == 'output':
+            return list(self.outputs.items())
+        if kind == 'events':
+            return list(zip(self.event_names, self.event_units))
+        raise ValueError(f'Unknown kind of variable: {kind}')
+
+    def _get_vector_map(self, kind):
+        """
+        Return the VectorMap of a group of problem variables, or None if any of them
+        cannot be read directly from the root output vector.
+        """
+        if kind not in self._vector_maps:
+            self._vector_maps[kind] = self._setup_vector_map(
+                self._get_vector_items(kind))
+        return self._vector_maps[kind]
+
+    def _setup_vector_map(self, items):
+        model = self.prob.model
+        conns = model._conn_global_abs_in2out
+        abs2meta = model._var_allprocs_abs2meta
+
+        # offset of each output in the root vector, in the same order as it is built
+        starts = {}
+        start = 0
+        for abs_name, meta in model._var_abs2meta['output'].items():
+            starts[abs_name] = start
+            start += meta['size']
+
+        indices = []
+        factor = []
+        offset = []
+        for name, var_units in items:
+            abs_names = om_name_maps.name2abs_names(model, name)
+            if not abs_names:
+                return None
+
+            src = abs_name = abs_names[0]
+            if abs_name in abs2meta['input']:
+                meta = abs2meta['input'][abs_name]
+                # inputs read a slice of their source that is not always at its start
+                if meta.get('src_indices') is not None or abs_name not in conns:
+                    return None
+                src = conns[abs_name]
+            else:
+                meta = abs2meta['output'].get(abs_name)
+
+            if src not in starts or meta is None:
+                return None
+
+            src_units = abs2meta['output'][src]['units']
+            if var_units is None:
+                var_units = meta['units']
+            else:
+                var_units = units.simplify_unit(var_units)
+
+            if not src_units or not var_units or src_units == var_units:
+                scale, shift = 1.0, 0.0
+            else:
+                try:
+                    scale, shift = units.unit_conversion(src_units, var_units)
+                except Exception:
+                    return None
+
+            indices.append(starts[src])
+            factor.append(scale)
+            offset.append(shift)
+
+        return VectorMap(np.array(indices, dtype=int), np.array(factor),
+                         np.array(offset))
+
+    def _gather(self, kind):
+        """
+        Return the value of each variable in a group of problem variables.
+        """
+        vector_map = self._get_vector_map(kind)
+        if vector_map is None:
+            return np.array([self.prob.get_val(name, units=var_units)[0]
+                             for name, var_units in self._get_vector_items(kind)])
+
+        vals = self.prob.model._outputs.asarray()[vector_map.indices]
+        return (vals + vector_map.offset) * vector_map.factor
+
+    def _scatter(self, kind, value):
+        """
+        Set the value of each variable in a group of problem variables.
+        """
+        vector_map = self._get_vector_map(kind)
+        if vector_map is None:
+            for (name, var_units), elem_val in zip(self._get_vector_items(kind), value):
+                self.prob.set_val(name, elem_val, units=var_units)
+            return
+
+        # asarray returns a view, so this writes directly into the problem
+        self.prob.model._outputs.asarray()[vector_map.indices] = \
+            value / vector_map.factor - vector_map.offset
 
     @property
     def time(self):
-        return self.prob.get_val(self.t_name)[0]
+        return self._gather('time')[0]
 
     @time.setter
     def time(self, value):
         if self.time_independent or self.time == value:
             return
-        self.prob.set_val(self.t_name, value)
+        self._scatter('time', np.atleast_1d(value))
 
     @property
     def state(self):
-        return np.array(
-            [
-                self.prob.get_val(state_name, units=state_data['units'])[0]
-                for state_name, state_data in self.states.items()
-            ]
-        )
+        return self._gather('state')
 
     @state.setter
     def state(self, value):
         if np.all(self.state == value):
             return
-        for state_name, elem_val in zip(
-            self.states.keys(), value
+        self._scatter('state', np.asarray(value))
+
+    @property
+    def batch_prob(self):
+        """
+        Copy of the ODE built with num_nodes=batch_size, or None if this problem can
+        only be evaluated point by point.
+        """
+        if self._batch_prob is None:
+            self._batch_prob = self._setup_batch_problem() or False
+        return self._batch_prob or None
+
+    def _setup_batch_problem(self):
+        cls = type(self)
+        if (
+            not self.batch_size or self.batch_size < 2
+            # subclasses that evaluate the ODE themselves cannot be batched
+            or cls.state_equation_function is not SimuPyProblem.state_equation_function
+            or cls.compute_totals is not SimuPyProblem.compute_totals
+            or 'num_nodes' not in self.ode.options
         ):
-            self.prob.set_val(state_name, elem_val,
-                              units=self.states[state_name]['units'])
+            return None
+
+        nn = self.batch_size
+        ode_class = type(self.ode)
+        try:
+            inspect.signature(ode_class).bind()
+        except TypeError:
+            self._warn_batch_disabled(
+                f"{ode_class.__name__} cannot be built without arguments")
+            return None
+
+        try:
+            ode = ode_class()
+            for name in self.ode.options:
+                # options declared during setup are left to their defaults
+                if name not in ode.options:
+                    continue
+                try:
+                    ode.options[name] = self.ode.options[name]
+                except RuntimeError:
+                    # required option that was never set
+                    continue
+            ode.options['num_nodes'] = nn
 
-    def compute_along_traj(self, ts, xs):
-        self.prob.set_val(self.t_name, ts)
+            prob = self._setup_problem(ode)
+        except (RuntimeError, ValueError, KeyError, TypeError, AttributeError) as error:
+            self._warn_batch_disabled(error)
+            return None
+
+        pointwise = [*self.states.keys()]
+        if not self.time_independent:
+            pointwise.append(self.t_name)
+
+        batch_inputs = {}
+        data = self.prob.model.list_inputs(
+            is_indep_var=True, prom_name=True, val=False, out_stream=None)
+        for prom_name in {meta['prom_name'] for _, meta in data}:
+            try:
+                size = prob.get_val(prom_name).size
+                scalar_size = self.get_val(prom_name).size
+            except KeyError as error:
+                self._warn_batch_disabled(error)
+                return None
+
+            if prom_name in pointwise:
+                if size != nn:
+                    return None
+            elif size != scalar_size and scalar_size != 1:
+                return None
+            else:
+                batch_inputs[prom_name] = size
+
+        self._batch_inputs = batch_inputs
+
+        return prob
+
+    def _warn_batch_disabled(self, reason):
+        if self.verbosity >= Verbosity.BRIEF:
+            warnings.warn(
+                f"Batch evaluation disabled for {self.__class__.__name__}: {reason}")
+
+    def _set_batch_inputs(self, ts, xs):
+        prob = self._batch_prob
+
+        # parameters and controls are only ever set on the pointwise problem, so they
+        # are copied over (and broadcast to every node) before each batch
+        for name, size in self._batch_inputs.items():
+            val = self.get_val(name)
+            if val.size != size:
+                val = np.full(size, val.ravel()[0])
+            prob.set_val(name, val)
+
+        if not self.time_independent:
+            prob.set_val(self.t_name, ts)
         for state_name, elem_val in zip(self.states.keys(), xs.T):
-            self.prob.set_val(state_name, elem_val,
-                              units=self.states[state_name]['units'])
+            prob.set_val(state_name, elem_val,
+                         units=self.states[state_name]['units'])
+
+    def _iter_batches(self, ts, xs):
+        """
+        Set each batch of points on the batch problem, padding the last batch by
+        repeating its final point, and yield the number of real points in it.
+        """
+        nn = self.batch_size
+        for start in range(0, ts.size, nn):
+            idx = np.arange(start, min(start + nn, ts.size))
+            padded = np.r_[idx, np.full(nn - idx.size, idx[-1])]
+            self._set_batch_inputs(ts[padded], xs[padded])
+            self._batch_prob.run_model()
+            yield idx
+
+    def _gather_batch(self, name, units, count):
+        val = self._batch_prob.get_val(name, units=units).ravel()
+        if val.size == 1:
+            return np.full(count, val[0])
+        return val[:count]
+
+    def compute_along_traj(self, ts, xs):
+        """
+        Evaluate the ODE at every (t, x) point of a trajectory, using the batch
+        problem when possible. Returns the state rates and outputs at each point.
+        """
+        ts = np.asarray(ts, dtype=float).reshape(-1)
+        xs = np.asarray(xs, dtype=float).reshape(ts.size, self.dim_state)
+
+        state_rates = np.empty((ts.size, self.dim_state))
+        outputs = np.empty((ts.size, self.dim_output))
+
+        if self.batch_prob is None:
+            for idx, (t, x) in enumerate(zip(ts, xs)):
+                state_rates[idx] = self.state_equation_function(t, x)
+                outputs[idx] = self.output
+            return state_rates, outputs
+
+        for idx in self._iter_batches(ts, xs):
+            for col, state_data in enumerate(self.states.values()):
+                state_rates[idx, col] = self._gather_batch(
+                    state_data['rate'], state_data['rate_units'], idx.size)
+            for col, (output_name, unit) in enumerate(self.outputs.items()):
+                outputs[idx, col] = self._gather_batch(output_name, unit, idx.size)
+
+        return state_rates, outputs
+
+    def compute_totals_along_traj(self, ts, xs, of, wrt):
+        """
+        Compute the total derivatives of "of" with respect to "wrt" at every (t, x)
+        point of a trajectory. Returns an array of shape (len(ts), len(of), len(wrt))
+        where each slice matches compute_totals(of, wrt, return_format='array')
+        evaluated at that point.
+        """
+        ts = np.asarray(ts, dtype=float).reshape(-1)
+        xs = np.asarray(xs, dtype=float).reshape(ts.size, self.dim_state)
+
+        totals = np.empty((ts.size, len(of), len(wrt)))
+
+        if self.batch_prob is None:
+            for idx, (t, x) in enumerate(zip(ts, xs)):
+                self.state_equation_function(t, x)
+                totals[idx] = self.compute_totals(of, wrt, return_format='array')
+            return totals
+
+        for idx in self._iter_batches(ts, xs):
+            coloring_info = self._get_batch_coloring(of, wrt)
+            data = self._batch_prob.compute_totals(
+                of, wrt, return_format='dict', coloring_info=coloring_info)
+
+            # every node of the batch problem is independent of the others, so the
+            # pointwise derivatives sit on the diagonal of each sub-jacobian (or in
+            # its single column for inputs that are not vectorized)
+            for i, of_name in enumerate(of):
+                for j, wrt_name in enumerate(wrt):
+                    subjac = data[of_name][wrt_name]
+                    rows = idx - idx[0] if subjac.shape[0] > 1 else 0
+                    cols = idx - idx[0] if subjac.shape[1] > 1 else 0
+                    totals[idx, i, j] = subjac[rows, cols]
+
+        return totals
+
+    def _get_batch_coloring(self, of, wrt):
+        key = (tuple(of), tuple(wrt))
+        if key not in self._batch_colorings:
+            coloring_info = ColoringMeta()
+            # computing the sparsity always prints a summary
+            if self.verbosity >= Verbosity.VERBOSE:
+                out_stream = sys.stdout
+            else:
+                out_stream = io.StringIO()
+            with redirect_stdout(out_stream):
+                coloring_info.coloring = compute_total_coloring(
+                    self._batch_prob, of=list(of), wrt=list(wrt))
+            self._batch_colorings[key] = coloring_info
+        return self._batch_colorings[key]
 
     @property
     def control(self):
-        return np.array(
-            [
-                self.prob.get_val(control_name, units=unit)[0]
-                for control_name, unit in self.controls.items()
-            ]
-        )
+        return self._gather('control')
 
     @control.setter
     def control(self, value):
@@ -327,63 +654,81 @@ class SimuPyProblem(SimulationMixin):
             value = np.array([])
         if (self.control.size == value.size) and np.all(self.control == value):
             return
-        for control_name, elem_val in zip(
-            self.controls, value
-        ):
-            self.prob.set_val(control_name, elem_val, units=self.controls[control_name])
+        # simupy passes the outputs of the system here, so only the first dim_input
+        # entries are controls
+        self._scatter('control', np.asarray(value)[:self.dim_input])
 
     @property
     def parameter(self):
-        return np.array(
-            [
-                self.prob.get_val(parameter_name, units=unit)[0]
-                for parameter_name, unit in self.parameters.items()
-            ]
-        )
+        return self._gather('parameter')
 
     @parameter.setter
     def parameter(self, value):
         if np.all(self.parameter == value):
             return
-        for parameter_name, elem_val in zip(
-            self.paramaters, value
-        ):
-            self.prob.set_val(parameter_name, elem_val)
+        self._scatter('parameter', np.asarray(value))
+        self.clear_cache()
 
     @property
     def state_rate(self):
-        return np.array(
-            [
-                self.prob.get_val(state_data['rate'], units=state_data['rate_units'])[0]
-                for _, state_data in self.states.items()
-            ]
-        )
+        return self._gather('state_rate')
 
     @property
     def output(self):
-        return np.array(
-            [
-                self.prob.get_val(output_name, units=unit)[0]
-                for output_name, unit in self.outputs.items()
-            ]
-        )
+        return self._gather('output')
 
     @property
     def events(self):
-        return np.array(
-            [
-                self.prob.get_val(event_name, units=unit)[0]
-                for event_name, unit in zip(self.event_names, self.event_units)
-            ]
-        )
+        return self._gather('events')
 
-    @property
     def compute(self):
-        # TODO: create cache -- t, x (optionally u) as hash
-        # I guess just set_val for every input and output?
-        # for compute_totals, force run_model. anywhere else that needs forced
-        # run_model?
-        return self.prob.run_model
+        """
+        Run the model at the current time, state, and control, reusing a previous
+        evaluation at the same point if one is cached.
+        """
+        if not self.cache_size:
+            self.prob.run_model()
+            return
+
+        key = (
+            None if self.time_independent else self.time,
+            self.state.tobytes(),
+            self.control.tobytes(),
+        )
+        model = self.prob.model
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            # restoring every input and output leaves the model exactly as it was
+            # after the cached run, so outputs and compute_totals are consistent
+            inputs, outputs = self._cache[key]
+            model._inputs.set_val(inputs)
+            model._outputs.set_val(outputs)
+            return
+
+        self.cache_misses += 1
+        self.prob.run_model()
+
+        self._cache[key] = (model._inputs.asarray(copy=True),
+                            model._outputs.asarray(copy=True))
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        """
+        Discard all cached model evaluations. This must be called whenever an input
+        other than time, state, or control is changed.
+        """
+        self._cache.clear()
+
+    def cache_info(self):
+        """
+        Return the number of cache hits and misses, and the current and maximum number
+        of cached model evaluations.
+        """
+        return CacheInfo(self.cache_hits, self.cache_misses, self.cache_size,
+                         len(self._cache))
 
     @property
     def compute_totals(self):
@@ -437,7 +782,8 @@ class SimuPyProblem(SimulationMixin):
         self.num_events = 0
 
     def event_equation_function(self, t, x):
-        self.output_equation_function(t, x)
+        self.time = t
+        self.state = x
         self.compute()
         event_values = [self.evaluate_trigger(trigger) for trigger in self.triggers]
         # print(event_values)
@@ -460,9 +806,142 @@ class SimuPyProblem(SimulationMixin):
     def get_val(self):
         return self.prob.get_val
 
-    @property
-    def set_val(self):
-        return self.prob.set_val
+    def set_val(self, name, val, units=None, indices=None):
+        # setting a value that is already there keeps the cached evaluations
+        old = self.prob.get_val(name, units=units, indices=indices)
+        if np.shape(val) in ((), np.shape(old)) and np.all(old == val):
+            return
+        self.prob.set_val(name, val, units=units, indices=indices)
+        self.clear_cache()
+
+
+# forward solution of a phase kept by SGMCheckpoints, with the same attributes as the
+# simupy SimulationResult it replaces
+PhaseResult = namedtuple('PhaseResult', ['t', 'x', 'y', 'e'])
+
+
+class SGMCheckpoints:
+    """
+    Storage of the forward solution of every phase of an SGMTrajBase for the adjoint.
+
+    Each phase keeps its solution at num_checkpoints points, always including the first
+    and last ones, or at every integrator step if num_checkpoints is None. The solution
+    between two checkpoints is integrated again when the adjoint needs it. Recomputed
+    segments and anything else derived from them (like the ODE jacobians) are kept for
+    reuse as long as their total size stays under memory_limit bytes.
+    """
+
+    def __init__(self, num_checkpoints=None, memory_limit=None):
+        if num_checkpoints is not None and num_checkpoints < 2:
+            raise ValueError("num_checkpoints must be at least 2 to keep both ends of "
+                             "each phase")
+        self.num_checkpoints = num_checkpoints
+        self.memory_limit = memory_limit
+        self.clear()
+
+    def clear(self):
+        """
+        Discard all stored phases and cached data.
+        """
+        self.problems = []
+        self.results = []
+        self._dense = []
+        self._cache = OrderedDict()
+        self.nbytes = 0
+        self.recomputed_segments = 0
+
+    def add_phase(self, problem, sim_result):
+        """
+        Store the forward solution of the next phase and return what was kept of it.
+        """
+        num_points = sim_result.t.shape[0]
+        if self.num_checkpoints is None or num_points <= self.num_checkpoints:
+            idx = slice(None)
+        else:
+            idx = np.unique(np.linspace(0, num_points - 1, self.num_checkpoints)
+                            .round().astype(int))
+
+        result = PhaseResult(*(np.array(getattr(sim_result, name)[idx])
+                               for name in PhaseResult._fields))
+        self.problems.append(problem)
+        self.results.append(result)
+        self._dense.append(isinstance(idx, slice))
+        return result
+
+    def is_dense(self, phase_idx):
+        """
+        Return True if every integrator step of the phase was kept.
+        """
+        return self._dense[phase_idx]
+
+    def num_segments(self, phase_idx):
+        """
+        Return the number of segments the phase is split into for the adjoint.
+        """
+        if self.is_dense(phase_idx):
+            return 1
+        return self.results[phase_idx].t.shape[0] - 1
+
+    def get_segment(self, phase_idx, seg_idx):
+        """
+        Return the times and states of the phase between two of its checkpoints.
+        """
+        result = self.results[phase_idx]
+        if self.is_dense(phase_idx):
+            return result.t, result.x
+        return self.get((phase_idx, seg_idx, 'segment'),
+                        lambda: self._integrate_segment(phase_idx, seg_idx))
+
+    def _integrate_segment(self, phase_idx, seg_idx):
+        problem = self.problems[phase_idx]
+        result = self.results[phase_idx]
+        t0, t1 = result.t[seg_idx:seg_idx + 2]
+        x0, x1 = result.x[seg_idx:seg_idx + 2]
+
+        problem.initial_condition = x0
+        sim_result = problem.simulate((t0, t1))
+        self.recomputed_segments += 1
+
+        # end exactly on the stored checkpoint so that consecutive segments meet
+        keep = (sim_result.t > t0) & (sim_result.t < t1)
+        t = np.r_[t0, sim_result.t[keep], t1]
+        x = np.vstack([x0, sim_result.x[keep], x1])
+        return t, x
+
+    def get(self, key, compute):
+        """
+        Return the data cached under key, calling compute to build it if needed. The
+        least recently used data is discarded to stay under the memory limit.
+        """
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key][0]
+
+        value = compute()
+        nbytes = _nbytes(value)
+        self._cache[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while (self.memory_limit is not None and self.nbytes > self.memory_limit
+               and len(self._cache) > 1):
+            _, (_, old_nbytes) = self._cache.popitem(last=False)
+            self.nbytes -= old_nbytes
+
+        if self.memory_limit is not None and self.nbytes > self.memory_limit:
+            # too big to keep even on its own
+            self._cache.clear()
+            self.nbytes = 0
+
+        return value
+
+
+def _nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    # interpolants keep their data in ndarray attributes
+    return sum(_nbytes(item) for item in getattr(value, '__dict__', {}).values()
+               if isinstance(item, np.ndarray))
 
 
 class SGMTrajBase(om.ExplicitComponent):
@@ -478,6 +957,16 @@ class SGMTrajBase(om.ExplicitComponent):
         # TODO: param_dict
         self.options.declare("param_dict",
                              default=ParamPort.param_data)
+        self.options.declare(
+            "num_checkpoints", default=None, types=int, allow_none=True,
+            desc="number of points of each phase kept for the adjoint, the solution "
+            "between them is integrated again when needed. None keeps every "
+            "integrator step")
+        self.options.declare(
+            "checkpoint_memory_limit", default=None, types=(int, float),
+            allow_none=True,
+            desc="maximum number of bytes of recomputed trajectory segments and ODE "
+            "jacobians kept for reuse by the adjoint. None for no limit")
         self.verbosity = verbosity
         self.max_allowable_time = 1_000_000
         self.adjoint_int_opts = DEFAULT_INTEGRATOR_OPTIONS.copy()
@@ -670,6 +1159,8 @@ class SGMTrajBase(om.ExplicitComponent):
     def compute_traj_loop(self, first_problem, inputs, outputs, t0=0., state0=None):
         if self.verbosity >= Verbosity.VERBOSE:
             print("initializing compute_traj_loop")
+        self.checkpoints = SGMCheckpoints(self.options["num_checkpoints"],
+                                          self.options["checkpoint_memory_limit"])
         sim_results = []
         sim_problems = [first_problem]
         t = t0
@@ -692,7 +1183,7 @@ class SGMTrajBase(om.ExplicitComponent):
             )
             if sim_result.t.shape[0] == 2:
                 print("\n"*3, "IMMEDIATE PHASE TERMINATION", current_problem, "\n"*2)
-            sim_results.append(sim_result)
+            sim_results.append(self.checkpoints.add_phase(current_problem, sim_result))
 
             t = sim_result.t[-1]
             x = sim_result.x[-1, :]
@@ -764,6 +1255,53 @@ class SGMTrajBase(om.ExplicitComponent):
 
         self.last_inputs = np.array(list(inputs.values()))
 
+    def get_adjoint_jacobians(self, phase_idx, seg_idx, tf_total):
+        """
+        Return interpolants of the ODE jacobians with respect to the states and to the
+        parameters (or None if there are no parameters) over a segment of a phase.
+        Both are functions of the backward time tf_total - t used by the adjoint, and
+        are cached by the checkpoints so that every output reuses them.
+        """
+        def compute():
+            prob = self.sim_problems[phase_idx]
+            t, x = self.checkpoints.get_segment(phase_idx, seg_idx)
+            param_dict = self.options["param_dict"]
+
+            state_rate_names = [val['rate'] for _, val in prob.states.items()]
+            # evaluate the jacobians at every point of the segment in as few ODE
+            # evaluations as possible
+            df_dx_data = prob.compute_totals_along_traj(
+                t[::-1], x[::-1, :], state_rate_names, prob.state_names
+            ).transpose(0, 2, 1)
+            if param_dict:
+                df_dparam_data = prob.compute_totals_along_traj(
+                    t[::-1], x[::-1, :],
+                    state_rate_names, list(param_dict.keys())
+                )
+
+            k = min(3, t.shape[0]-1)
+            skip_interp = (k == 1) and np.isclose(t[0], t[1])
+
+            def interp(data):
+                if skip_interp:
+                    mean_data = np.mean(data, axis=0)
+                    return lambda t: mean_data
+
+                try:
+                    return interpolate.make_interp_spline(tf_total - t[::-1], data, k=k)
+                except ValueError as error:
+                    raise ValueError(
+                        f"Could not interpolate the adjoint jacobians of segment "
+                        f"{seg_idx} of phase {phase_idx} (spline degree {k}, times "
+                        f"{t[0]} to {t[-1]} over {t.shape[0]} points)") from error
+
+            df_dx = interp(df_dx_data)
+            df_dparam = interp(df_dparam_data) if param_dict else None
+
+            return df_dx, df_dparam
+
+        return self.checkpoints.get((phase_idx, seg_idx, 'jacobians'), compute)
+
     def compute_partials(self, inputs, J):
         self.compute_params(inputs)
         # defensive check -- should really make sure ALL inputs are the same, need a
@@ -785,8 +1323,6 @@ class SGMTrajBase(om.ExplicitComponent):
         next_res = self.sim_results[-1]
         next_prob = self.sim_problems[-1]
 
-        df_dxs = []
-        df_dparams = []
         dg_dxs = []
         f_minuses = []
         f_pluses = [np.zeros(self.sim_problems[-1].dim_state)]
@@ -832,14 +1368,6 @@ class SGMTrajBase(om.ExplicitComponent):
             self.sim_results[::-1],
             self.sim_problems[::-1],
         ):
-            # build time-varying co-state matrix
-            df_dx_data = np.empty(res.x.shape + (res.x.shape[-1],))
-
-            if param_dict:
-                df_dparam_data = np.empty(res.x.shape + (len(param_dict),))
-
-            last_res_idx = res.t.shape[0] - 1
-
             num_active_event_channels = 0
 
             state_rate = prob.state_equation_function(res.t[-1], res.x[-1, :])
@@ -876,124 +1404,77 @@ class SGMTrajBase(om.ExplicitComponent):
                                  "time in the future?? but currently no time-based "
                                  "events are used")
 
-            for idx, (t, x) in enumerate(zip(res.t[::-1], res.x[::-1, :])):
-                state_rate = prob.state_equation_function(t, x)
-
-                if (idx == last_res_idx) and (prob is not self.sim_problems[0]):
-                    next_prob = self.sim_problems[self.sim_problems.index(prob)-1]
-
-                    f_plus = np.zeros(next_prob.dim_state)
-                    plus_rate = state_rate
-
-                    # NOTE / TODO: should enforce that all states in all ODEs exist
-                    # in eachother (even if only as output). Don't like assuming
-                    # zero
-                    # state_update = np.zeros(next_prob.dim_state)
-                    state_update = np.ones(next_prob.dim_state)*np.inf
-                    dh_dx = np.zeros((next_prob.dim_state,)*2)
-                    dh_dparam = np.zeros((next_prob.dim_state, len(param_dict)))
-
-                    # here and co-state assume number of states is only decreasing
-                    # forward in time
-                    for state_name in next_prob.state_names:
-                        state_idx = next_prob.state_names.index(state_name)
-
-                        if state_name in prob.state_names:
-                            f_plus[
-                                state_idx
-                            ] = plus_rate[prob.state_names.index(state_name)]
-
-                            # state_update[
-                            #    next_prob.state_names.index(state_name)
-                            # ] = x[prob.state_names.index(state_name)]
-
-                            # TODO: make sure index multiplying next_pronb costate
-                            # lines up -- since costate is pre-filled to next_prob's
-                            # order, the continuous terms should be right
-                            # column should map to
-                            dh_dx[state_idx, state_idx] = 1.
-
-                        elif state_name in prob.outputs.keys():
-                            state_update[
-                                state_idx
-                            ] = res.y[-1, list(prob.outputs.keys()).index(state_name)]
-
-                            dh_j_dx = prob.compute_totals(
-                                [state_name],
-                                prob.state_names,
-                                return_format='array').squeeze()
-
-                            dh_dparam[state_idx, :] = prob.compute_totals(
-                                [state_name],
-                                list(param_dict.keys()),
-                                return_format='array'
-                            ).squeeze()
-
-                            for state_name_2 in prob.state_names:
-                                # I'm actually computing dh_dx.T
-                                # dh_dx rows are new state, columns are old state
-                                # now, dh_dx.T rows are old state, columns are new
-                                # so I think this is right
-                                dh_dx[
-                                    next_prob.state_names.index(state_name_2),
-                                    state_idx,
-                                ] = dh_j_dx[prob.state_names.index(state_name_2)]
-
-                        else:
-                            state_update[
-                                state_idx
-                            ] = 0.
-
-                    f_pluses.append(f_plus)
-                    state_updates.append(state_update)
-                    dh_dxs.append(dh_dx)
-                    dh_dparams.append(dh_dparam)
-
-                state_rate_names = [val['rate'] for _, val in prob.states.items()]
-                df_dx_data[idx, :, :] = prob.compute_totals(state_rate_names,
-                                                            prob.state_names,
-                                                            return_format='array').T
-                if param_dict:
-                    df_dparam_data[idx, ...] = prob.compute_totals(
-                        state_rate_names,
-                        list(param_dict.keys()),
-                        return_format='array'
-                    )
-
-            k = min(3, res.t.shape[0]-1)
-            skip_interp = (k == 1) and np.isclose(res.t[0], res.t[1])
-
-            # TODO: why is this failing?
-            if skip_interp:
-                mean_df_dx = np.mean(df_dx_data, axis=0)
-
-                df_dxs.append(lambda t: mean_df_dx)
-            else:
-                try:
-                    df_dxs.append(interpolate.make_interp_spline(
-                        tf_total - res.t[::-1],
-                        df_dx_data,
-                        k=k
-                    ))
-                except Exception as e:
-
-                    print("EXCEPTION!", k, res.t, df_dx_data, sep='\n')
-                    print("check: ", (k == 1) and (res.t[0] == res.t[1]))
-                    breakpoint()
-                    raise e
-
-            if param_dict:
-                if skip_interp:
-                    mean_df_dparam = np.mean(df_dparam_data, axis=0)
-                    df_dparams.append(lambda t: mean_df_dparam)
-                else:
-                    df_dparams.append(interpolate.make_interp_spline(
-                        tf_total - res.t[::-1],
-                        df_dparam_data,
-                        k=k
-                    ))
-            else:
-                df_dparams.append(None)
+            if prob is not self.sim_problems[0]:
+                state_rate = prob.state_equation_function(res.t[0], res.x[0, :])
+
+                next_prob = self.sim_problems[self.sim_problems.index(prob)-1]
+
+                f_plus = np.zeros(next_prob.dim_state)
+                plus_rate = state_rate
+
+                # NOTE / TODO: should enforce that all states in all ODEs exist
+                # in eachother (even if only as output). Don't like assuming
+                # zero
+                # state_update = np.zeros(next_prob.dim_state)
+                state_update = np.ones(next_prob.dim_state)*np.inf
+                dh_dx = np.zeros((next_prob.dim_state,)*2)
+                dh_dparam = np.zeros((next_prob.dim_state, len(param_dict)))
+
+                # here and co-state assume number of states is only decreasing
+                # forward in time
+                for state_name in next_prob.state_names:
+                    state_idx = next_prob.state_names.index(state_name)
+
+                    if state_name in prob.state_names:
+                        f_plus[
+                            state_idx
+                        ] = plus_rate[prob.state_names.index(state_name)]
+
+                        # state_update[
+                        #    next_prob.state_names.index(state_name)
+                        # ] = x[prob.state_names.index(state_name)]
+
+                        # TODO: make sure index multiplying next_pronb costate
+                        # lines up -- since costate is pre-filled to next_prob's
+                        # order, the continuous terms should be right
+                        # column should map to
+                        dh_dx[state_idx, state_idx] = 1.
+
+                    elif state_name in prob.outputs.keys():
+                        state_update[
+                            state_idx
+                        ] = res.y[-1, list(prob.outputs.keys()).index(state_name)]
+
+                        dh_j_dx = prob.compute_totals(
+                            [state_name],
+                            prob.state_names,
+                            return_format='array').squeeze()
+
+                        dh_dparam[state_idx, :] = prob.compute_totals(
+                            [state_name],
+                            list(param_dict.keys()),
+                            return_format='array'
+                        ).squeeze()
+
+                        for state_name_2 in prob.state_names:
+                            # I'm actually computing dh_dx.T
+                            # dh_dx rows are new state, columns are old state
+                            # now, dh_dx.T rows are old state, columns are new
+                            # so I think this is right
+                            dh_dx[
+                                next_prob.state_names.index(state_name_2),
+                                state_idx,
+                            ] = dh_j_dx[prob.state_names.index(state_name_2)]
+
+                    else:
+                        state_update[
+                            state_idx
+                        ] = 0.
+
+                f_pluses.append(f_plus)
+                state_updates.append(state_update)
+                dh_dxs.append(dh_dx)
+                dh_dparams.append(dh_dparam)
 
         if self.verbosity == Verbosity.DEBUG:
             print("data....")
@@ -1023,8 +1504,6 @@ class SGMTrajBase(om.ExplicitComponent):
                 phase_idx,
                 res,
                 prob,
-                df_dx,
-                df_dparam,
                 dg_dx,
                 f_minus,
                 f_plus,
@@ -1035,8 +1514,6 @@ class SGMTrajBase(om.ExplicitComponent):
                 range(len(self.sim_results), 0, -1),
                 self.sim_results[::-1],
                 self.sim_problems[::-1],
-                df_dxs,
-                df_dparams,
                 dg_dxs,
                 f_minuses,
                 f_pluses,
@@ -1046,6 +1523,9 @@ class SGMTrajBase(om.ExplicitComponent):
             ):
 
                 t0, tf = tf_total - res.t[[-1, 0]]
+                num_segments = self.checkpoints.num_segments(phase_idx - 1)
+                df_dx, df_dparam = self.get_adjoint_jacobians(
+                    phase_idx - 1, num_segments - 1, tf_total)
 
                 # assumes only 1 of time, state, or output dependence
                 # assume no discontinuous state update, would need an API for that in
@@ -1116,50 +1596,61 @@ class SGMTrajBase(om.ExplicitComponent):
                 if self.verbosity >= Verbosity.VERBOSE:
                     print('dim_state:', prob.dim_state, "ic:", costate)
 
-                costate_sys = DynamicalSystem(state_equation_function=co_state_rate,
-                                              dim_state=prob.dim_state)
-                costate_sys.initial_condition = costate
-
-                # simulate co-state system
-                co_res = costate_sys.simulate(
-                    (t0, tf), integrator_options=self.adjoint_int_opts)
-                costate_reses[output].append(co_res)
-
-                if param_dict:
-                    df_dparam_val = df_dparam(co_res.t)
-                    param_deriv_integrand_data = np.matmul(
-                        co_res.x[:, None, :],
-                        df_dparam_val
-                    ).squeeze()
-                    try:
-                        param_deriv_integrand = interpolate.make_interp_spline(
-                            co_res.t,
-                            np.atleast_1d(param_deriv_integrand_data),
-                            # k=df_dparam.k
-                            k=min(3, co_res.t.shape[0]-1)
+                # integrate backward over one segment between checkpoints at a time
+                seg_t = tf_total - res.t
+                for seg_idx in reversed(range(num_segments)):
+                    if num_segments > 1:
+                        t0, tf = seg_t[[seg_idx + 1, seg_idx]]
+                        df_dx, df_dparam = self.get_adjoint_jacobians(
+                            phase_idx - 1, seg_idx, tf_total)
+
+                    costate_sys = DynamicalSystem(
+                        state_equation_function=co_state_rate, dim_state=prob.dim_state)
+                    costate_sys.initial_condition = costate
+
+                    # simulate co-state system
+                    co_res = costate_sys.simulate(
+                        (t0, tf), integrator_options=self.adjoint_int_opts)
+                    costate_reses[output].append(co_res)
+
+                    if param_dict:
+                        df_dparam_val = df_dparam(co_res.t)
+                        param_deriv_integrand_data = np.matmul(
+                            co_res.x[:, None, :],
+                            df_dparam_val
+                        ).squeeze()
+                        try:
+                            param_deriv_integrand = interpolate.make_interp_spline(
+                                co_res.t,
+                                np.atleast_1d(param_deriv_integrand_data),
+                                # k=df_dparam.k
+                                k=min(3, co_res.t.shape[0]-1)
+                            )
+                        except ValueError as e:
+                            print(
+                                "HIT VALUE ERROR!",
+                                output,
+                                prob,
+                                co_res.t.shape,
+                                co_res.x.shape,
+                                df_dparam_val.shape,
+                                df_dparam.k,
+                                "final_results:\n\n",
+                                t0, tf,
+                                co_res.t,
+                                co_res.x,
+                            )
+                            raise e
+                        param_deriv_integrand_antideriv = \
+                            param_deriv_integrand.antiderivative()
+
+                        # TODO: is the sign wrong here?
+                        param_deriv -= (
+                            param_deriv_integrand_antideriv(t0)
+                            - param_deriv_integrand_antideriv(tf)
                         )
-                    except ValueError as e:
-                        print(
-                            "HIT VALUE ERROR!",
-                            output,
-                            prob,
-                            co_res.t.shape,
-                            co_res.x.shape,
-                            df_dparam_val.shape,
-                            df_dparam.k,
-                            "final_results:\n\n",
-                            t0, tf,
-                            co_res.t,
-                            co_res.x,
-                        )
-                        raise e
-                    param_deriv_integrand_antideriv = param_deriv_integrand.antiderivative()
 
-                    # TODO: is the sign wrong here?
-                    param_deriv -= (
-                        param_deriv_integrand_antideriv(t0)
-                        - param_deriv_integrand_antideriv(tf)
-                    )
+                    costate = co_res.x[-1].copy()
 
                 # consume initial condition
                 if prob is not self.sim_problems[0]:
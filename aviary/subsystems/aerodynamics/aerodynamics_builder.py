@@ -98,6 +98,9 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
 
         self.code_origin = code_origin
 
+        # formatted aero tables shared by the tabular aero groups of every phase
+        self._data_cache = {}
+
         super().__init__(name=name, meta_data=meta_data)
 
     def build_pre_mission(self, aviary_inputs):
@@ -143,6 +146,7 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                 aero_group = TabularAeroGroup(num_nodes=num_nodes,
                                               CD0_data=kwargs.pop('CD0_data'),
                                               CDI_data=kwargs.pop('CDI_data'),
+                                              data_cache=self._data_cache,
                                               **kwargs)
 
             else:
@@ -159,6 +163,7 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                     aero_group = TabularCruiseAero(num_nodes=num_nodes,
                                                    aviary_options=aviary_inputs,
                                                    aero_data=kwargs.pop('aero_data'),
+                                                   data_cache=self._data_cache,
                                                    **kwargs)
                 else:
                     aero_group = CruiseAero(num_nodes=num_nodes,
@@ -176,6 +181,7 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                                                          'free_flaps_data'),
                                                      free_ground_data=kwargs.pop(
                                                          'free_ground_data'),
+                                                     data_cache=self._data_cache,
                                                      **kwargs)
 
                 else:
@@ -70,6 +70,12 @@ class TabularAeroGroup(om.Group):
             'for drag coefficients in data will be ignored.',
         )
 
+        options.declare('data_cache', types=dict, default=None, allow_none=True,
+                        recordable=False,
+                        desc='Dictionary shared with other aero groups built from the '
+                             'same data, where formatted drag tables are stored so they '
+                             'are only formatted once.')
+
     def setup(self):
         options = self.options
         nn = options['num_nodes']
@@ -77,6 +83,7 @@ class TabularAeroGroup(om.Group):
         CD0_table = options['CD0_data']
         structured = options['structured']
         connect_training_data = options['connect_training_data']
+        data_cache = options['data_cache']
 
         # if data is from file, read data using alias dict
         if isinstance(CDI_table, str):
@@ -100,6 +107,7 @@ class TabularAeroGroup(om.Group):
             method=method,
             structured=structured,
             connect_training_data=connect_training_data,
+            data_cache=data_cache,
         )
 
         CDI_interp = build_data_interpolator(
@@ -109,6 +117,7 @@ class TabularAeroGroup(om.Group):
             method=method,
             structured=structured,
             connect_training_data=connect_training_data,
+            data_cache=data_cache,
         )
 
         # add subsystems
@@ -200,6 +200,92 @@ class TabularAeroGroupDataTest(unittest.TestCase):
         )  # check the partial derivatives
 
 
+class TabularAeroGroupCacheTest(unittest.TestCase):
+    """
+    Test that the tabular aero groups of several phases share formatted drag tables
+    and their interpolants.
+    """
+
+    def build_model(self, aero_builder, num_nodes, CD0_data=CD0_table):
+        aviary_options = AviaryValues()
+        aviary_options.set_val(Settings.VERBOSITY, 0)
+
+        prob = om.Problem()
+        for idx, nn in enumerate(num_nodes):
+            prob.model.add_subsystem(
+                f'aero_{idx}',
+                aero_builder.build_mission(num_nodes=nn, aviary_inputs=aviary_options,
+                                           method='tabular', CDI_data=CDI_table,
+                                           CD0_data=CD0_data))
+
+        prob.setup(check=False, force_alloc_complex=True)
+
+        for idx, nn in enumerate(num_nodes):
+            prob.set_val(f'aero_{idx}.{Dynamic.Mission.VELOCITY}',
+                         np.linspace(100, 130, nn), units='m/s')
+            prob.set_val(f'aero_{idx}.{Dynamic.Mission.ALTITUDE}',
+                         np.linspace(8000, 10582, nn), units='m')
+            prob.set_val(f'aero_{idx}.{Dynamic.Mission.MASS}', 80442, units='kg')
+            prob.set_val(f'aero_{idx}.{Dynamic.Mission.MACH}',
+                         np.linspace(0.3, 0.4, nn), units='unitless')
+            prob.set_val(f'aero_{idx}.{Aircraft.Wing.AREA}', 1341, units='ft**2')
+            prob.set_val(f'aero_{idx}.{Dynamic.Mission.DENSITY}', 0.88821,
+                         units='kg/m**3')
+
+        prob.run_model()
+
+        return prob
+
+    def test_shared_tables(self):
+        aero_builder = CoreAerodynamicsBuilder(code_origin=FLOPS)
+        prob = self.build_model(aero_builder, (3, 5))
+
+        # one formatted table and one interpolant each for CD0 and CDI
+        data_cache = aero_builder._data_cache
+        self.assertEqual(len(data_cache), 3)
+        self.assertEqual(len(data_cache['interpolants']), 2)
+
+        for name in ('CD0_interp', 'CDI_interp'):
+            interps = [prob.model._get_subsystem(f'aero_{idx}.{name}')
+                       for idx in range(2)]
+            for training_data, other_training_data in zip(interps[0].inputs,
+                                                          interps[1].inputs):
+                self.assertIs(training_data, other_training_data)
+            self.assertFalse(interps[0].inputs[0].flags.writeable)
+            self.assertEqual(interps[0].interps.keys(), interps[1].interps.keys())
+            for out_name, interp in interps[0].interps.items():
+                self.assertIs(interp, interps[1].interps[out_name])
+
+        # the phases evaluate their shared interpolants at different points
+        partial_data = prob.check_partials(out_stream=None, method='cs',
+                                           includes=['*interp'])
+        assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
+
+        # each phase gives the same results as a model built on its own
+        for idx, nn in enumerate((3, 5)):
+            expected = self.build_model(CoreAerodynamicsBuilder(code_origin=FLOPS), (nn,))
+            assert_near_equal(
+                prob.get_val(f'aero_{idx}.{Dynamic.Mission.DRAG}', units='N'),
+                expected.get_val(f'aero_0.{Dynamic.Mission.DRAG}', units='N'), 1e-15)
+
+    def test_different_data(self):
+        aero_builder = CoreAerodynamicsBuilder(code_origin=FLOPS)
+        self.build_model(aero_builder, (3,))
+
+        CD0_data = _default_CD0_data()
+        CD0_data.set_val('zero_lift_drag_coefficient',
+                         1.1 * CD0_data.get_val('zero_lift_drag_coefficient'))
+        prob = self.build_model(aero_builder, (3,), CD0_data=CD0_data)
+        expected = self.build_model(CoreAerodynamicsBuilder(code_origin=FLOPS), (3,),
+                                    CD0_data=CD0_data)
+
+        self.assertEqual(len(aero_builder._data_cache), 4)
+        self.assertEqual(len(aero_builder._data_cache['interpolants']), 3)
+        assert_near_equal(prob.get_val(f'aero_0.{Dynamic.Mission.DRAG}', units='N'),
+                          expected.get_val(f'aero_0.{Dynamic.Mission.DRAG}', units='N'),
+                          1e-15)
+
+
 data_sets = ['LargeSingleAisle1FLOPS', 'LargeSingleAisle2FLOPS', 'N3CC']
 
 
@@ -7,8 +7,9 @@ from pathlib import Path
 
 from aviary.constants import GRAV_ENGLISH_LBM
 from aviary.subsystems.aerodynamics.gasp_based.common import AeroForces, TimeRamp
+from aviary.subsystems.propulsion.utils import SharedMetaModelStructuredComp
 from aviary.utils.named_values import NamedValues, get_keys
-from aviary.utils.data_interpolator_builder import build_data_interpolator
+from aviary.utils.data_interpolator_builder import _get_data_key, build_data_interpolator
 from aviary.utils.csv_data_file import read_data_file
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import get_items
@@ -52,6 +53,12 @@ class TabularCruiseAero(om.Group):
         self.options.declare('extrapolate', default=True, desc='Flag that sets if drag '
                                                                'data can be extrapolated')
 
+        self.options.declare('data_cache', types=dict, default=None, allow_none=True,
+                             recordable=False,
+                             desc='Dictionary shared with other aero groups built from '
+                                  'the same data, where formatted aero tables are stored '
+                                  'so they are only formatted once')
+
     def setup(self):
         options = self.options
         nn = options['num_nodes']
@@ -59,6 +66,7 @@ class TabularCruiseAero(om.Group):
         connect_training_data = options['connect_training_data']
         structured = options['structured']
         extrapolate = options['extrapolate']
+        data_cache = options['data_cache']
 
         # handle aliasing for training data
         extra_promotes = []
@@ -69,7 +77,8 @@ class TabularCruiseAero(om.Group):
         interp_comp = _build_free_aero_interp(num_nodes=nn, aero_data=aero_data,
                                               connect_training_data=connect_training_data,
                                               structured=structured,
-                                              extrapolate=extrapolate)
+                                              extrapolate=extrapolate,
+                                              data_cache=data_cache)
 
         self.add_subsystem('free_aero_interp',
                            subsys=interp_comp,
@@ -125,6 +134,12 @@ class TabularLowSpeedAero(om.Group):
         self.options.declare("retract_flaps", default=True, types=bool,
                              desc="True to start with flaps applied, False for reverse")
 
+        self.options.declare('data_cache', types=dict, default=None, allow_none=True,
+                             recordable=False,
+                             desc='Dictionary shared with other aero groups built from '
+                                  'the same data, where formatted aero tables are stored '
+                                  'so they are only formatted once')
+
     def setup(self):
         options = self.options
         nn = options['num_nodes']
@@ -134,6 +149,7 @@ class TabularLowSpeedAero(om.Group):
         connect_training_data = options['connect_training_data']
         structured = options['structured']
         extrapolate = options['extrapolate']
+        data_cache = options['data_cache']
 
         # convert altitude to height/span for ground effects
         hob = om.ExecComp(
@@ -162,7 +178,8 @@ class TabularLowSpeedAero(om.Group):
         free_aero_interp = _build_free_aero_interp(nn, aero_data=free_aero_data,
                                                    connect_training_data=connect_training_data,
                                                    structured=structured,
-                                                   extrapolate=extrapolate)
+                                                   extrapolate=extrapolate,
+                                                   data_cache=data_cache)
 
         # "base" free-air coefficients
         self.add_subsystem(
@@ -180,7 +197,8 @@ class TabularLowSpeedAero(om.Group):
         flaps_aero_interp = _build_flaps_aero_interp(nn, aero_data=flaps_aero_data,
                                                      connect_training_data=connect_training_data,
                                                      structured=structured,
-                                                     extrapolate=extrapolate)
+                                                     extrapolate=extrapolate,
+                                                     data_cache=data_cache)
 
         # flap drag and lift increment from full flap deflection
         self.add_subsystem(
@@ -198,7 +216,8 @@ class TabularLowSpeedAero(om.Group):
         ground_aero_interp = _build_ground_aero_interp(nn, aero_data=ground_aero_data,
                                                        connect_training_data=connect_training_data,
                                                        structured=structured,
-                                                       extrapolate=extrapolate)
+                                                       extrapolate=extrapolate,
+                                                       data_cache=data_cache)
 
         # drag and lift increments from ground effects
         self.add_subsystem(
@@ -382,7 +401,8 @@ class GearDragIncrement(om.ExplicitComponent):
 
 
 def _build_free_aero_interp(num_nodes=0, aero_data=None, connect_training_data=False,
-                            method='lagrange2', structured=True, extrapolate=True):
+                            method='lagrange2', structured=True, extrapolate=True,
+                            data_cache=None):
     """creates interpolation components for cruise aero"""
     # build_data_interpolator normally handles converting to filepath and reading
     # data, but here we need to query the data before building the component
@@ -391,26 +411,25 @@ def _build_free_aero_interp(num_nodes=0, aero_data=None, connect_training_data=F
     if isinstance(aero_data, Path):
         aero_data = read_data_file(aero_data, aliases=aliases)
 
-    # aero_data is modified in-place, deepcopy required
-    interp_data = aero_data.deepcopy()
-
-    interp_data = _structure_special_grid(interp_data)
-
     required_inputs = {Dynamic.Mission.ALTITUDE, Dynamic.Mission.MACH,
                        'angle_of_attack'}
     required_outputs = {'lift_coefficient', 'drag_coefficient'}
 
     missing_variables = []
-    if not required_inputs <= get_keys(interp_data):
+    if not required_inputs <= get_keys(aero_data):
         missing_variables.append([key for key in
-                                  required_inputs.difference(get_keys(interp_data))])
-    if not connect_training_data and not required_outputs <= get_keys(interp_data):
+                                  required_inputs.difference(get_keys(aero_data))])
+    if not connect_training_data and not required_outputs <= get_keys(aero_data):
         missing_variables.append([key for key in
-                                  required_outputs.difference(get_keys(interp_data))])
+                                  required_outputs.difference(get_keys(aero_data))])
     if missing_variables:
         raise KeyError('GASP-based aerodynamics interpolation missing required '
                        f'variables: {missing_variables}')
 
+    # aero_data is modified in-place, copy required
+    interp_data, data_key = _get_interp_data(aero_data, _structure_special_grid,
+                                             data_cache)
+
     if connect_training_data:
         method = 'lagrange2'
     else:
@@ -424,7 +443,9 @@ def _build_free_aero_interp(num_nodes=0, aero_data=None, connect_training_data=F
                                           method=method,
                                           structured=structured,
                                           connect_training_data=connect_training_data,
-                                          extrapolate=extrapolate)
+                                          extrapolate=extrapolate,
+                                          data_cache=data_cache,
+                                          data_key=data_key)
 
     if connect_training_data:
         return interp_comp
@@ -436,9 +457,14 @@ def _build_free_aero_interp(num_nodes=0, aero_data=None, connect_training_data=F
         # free aero CL at max alpha is the same across altitudes but ignore that for now
         cl_max = interp_data.get_val('lift_coefficient', 'unitless')[0, :, -1]
         # add a 1d metamodel for cl_max, promoting all variables
-        meta_1d = om.MetaModelStructuredComp(method='1D-lagrange2',
-                                             vec_size=num_nodes,
-                                             extrapolate=extrapolate)
+        if data_cache is None:
+            meta_1d = om.MetaModelStructuredComp(method='1D-lagrange2',
+                                                 vec_size=num_nodes,
+                                                 extrapolate=extrapolate)
+        else:
+            meta_1d = SharedMetaModelStructuredComp(
+                method='1D-lagrange2', vec_size=num_nodes, extrapolate=extrapolate,
+                interp_cache=data_cache.setdefault('interpolants', {}))
         meta_1d.add_input(Dynamic.Mission.MACH, 0.0, units="unitless",
                           shape=num_nodes,
                           training_data=interp_data.get_val(Dynamic.Mission.MACH,
@@ -451,7 +477,8 @@ def _build_free_aero_interp(num_nodes=0, aero_data=None, connect_training_data=F
 
 
 def _build_flaps_aero_interp(num_nodes=0, aero_data=None, connect_training_data=False,
-                             method='slinear', structured=True, extrapolate=False):
+                             method='slinear', structured=True, extrapolate=False,
+                             data_cache=None):
     """creates interpolation components for cruise aero"""
     # TODO linear method default because standard GASP tables have only two flap
     #      deflections - may want to have option for two separate 2D tables instead?
@@ -463,40 +490,22 @@ def _build_flaps_aero_interp(num_nodes=0, aero_data=None, connect_training_data=
     if isinstance(aero_data, Path):
         aero_data = read_data_file(aero_data, aliases=aliases)
 
-    # aero_data is modified in-place, deepcopy required
-    interp_data = aero_data.deepcopy()
-
-    interp_data = _structure_special_grid(interp_data)
-
     required_inputs = {'flap_deflection', Dynamic.Mission.MACH, 'angle_of_attack'}
     required_outputs = {'delta_lift_coefficient', 'delta_drag_coefficient'}
 
     missing_variables = []
-    if not required_inputs <= get_keys(interp_data):
+    if not required_inputs <= get_keys(aero_data):
         missing_variables.extend([key for key in
-                                  required_inputs.difference(get_keys(interp_data))])
-    if not connect_training_data and not required_outputs <= get_keys(interp_data):
+                                  required_inputs.difference(get_keys(aero_data))])
+    if not connect_training_data and not required_outputs <= get_keys(aero_data):
         missing_variables.extend([key for key in
-                                  required_outputs.difference(get_keys(interp_data))])
+                                  required_outputs.difference(get_keys(aero_data))])
     if missing_variables:
         raise KeyError('GASP-based aerodynamics interpolation missing required '
                        f'variables: {missing_variables}')
 
-    dcl = interp_data.get_val('delta_lift_coefficient', 'unitless')
-    defl = np.unique(interp_data.get_val('flap_deflection', 'deg')
-                     )  # units don't matter, not using values
-    alpha = np.unique(interp_data.get_val('angle_of_attack', 'deg')
-                      )  # units don't matter, not using values
-    mach = np.unique(interp_data.get_val(Dynamic.Mission.MACH, 'unitless'))
-
-    dcl_max = np.zeros_like(dcl)
-    shape = (defl.size, mach.size, alpha.size)
-    dcl_max = np.resize(dcl_max, shape)
-    dcl = np.reshape(dcl, shape)
-    for i in range(defl.size):
-        dcl_max[i, :, :] = np.broadcast_to(dcl[i, :, -1], (alpha.size, mach.size)).T
-
-    interp_data.set_val('delta_lift_coefficient_max', dcl_max.flatten(), 'unitless')
+    # aero_data is modified in-place, copy required
+    interp_data, data_key = _get_interp_data(aero_data, _prepare_flaps_data, data_cache)
 
     return build_data_interpolator(num_nodes=num_nodes,
                                    interpolator_data=interp_data,
@@ -506,11 +515,14 @@ def _build_flaps_aero_interp(num_nodes=0, aero_data=None, connect_training_data=
                                    method=method,
                                    structured=structured,
                                    connect_training_data=connect_training_data,
-                                   extrapolate=extrapolate)
+                                   extrapolate=extrapolate,
+                                   data_cache=data_cache,
+                                   data_key=data_key)
 
 
 def _build_ground_aero_interp(num_nodes=0, aero_data=None, connect_training_data=False,
-                              method='slinear', structured=True, extrapolate=True):
+                              method='slinear', structured=True, extrapolate=True,
+                              data_cache=None):
     """creates interpolation components for cruise aero"""
     # build_data_interpolator normally handles converting to filepath and reading
     # data, but here we need to query the data before building the component
@@ -519,37 +531,22 @@ def _build_ground_aero_interp(num_nodes=0, aero_data=None, connect_training_data
     if isinstance(aero_data, Path):
         aero_data = read_data_file(aero_data, aliases=aliases)
 
-    # aero_data is modified in-place, deepcopy required
-    interp_data = aero_data.deepcopy()
-
     required_inputs = {'hob', Dynamic.Mission.MACH, 'angle_of_attack'}
     required_outputs = {'delta_lift_coefficient', 'delta_drag_coefficient'}
 
     missing_variables = []
-    if not required_inputs <= get_keys(interp_data):
+    if not required_inputs <= get_keys(aero_data):
         missing_variables.append([key for key in
-                                  required_inputs.difference(get_keys(interp_data))])
-    if not connect_training_data and not required_outputs <= get_keys(interp_data):
+                                  required_inputs.difference(get_keys(aero_data))])
+    if not connect_training_data and not required_outputs <= get_keys(aero_data):
         missing_variables.append([key for key in
-                                  required_outputs.difference(get_keys(interp_data))])
+                                  required_outputs.difference(get_keys(aero_data))])
     if missing_variables:
         raise KeyError('GASP-based aerodynamics interpolation missing required '
                        f'variables: {missing_variables}')
 
-    dcl = interp_data.get_val('delta_lift_coefficient', 'unitless')
-    alpha = np.unique(interp_data.get_val('angle_of_attack', 'deg')
-                      )  # units don't matter, not using values
-    mach = np.unique(interp_data.get_val(Dynamic.Mission.MACH, 'unitless'))
-    hob = np.unique(interp_data.get_val('hob', 'unitless'))
-
-    dcl_max = np.zeros_like(dcl)
-    shape = (mach.size, hob.size, alpha.size)
-    dcl_max = np.resize(dcl_max, shape)
-    dcl = np.reshape(dcl, shape)
-    for i in range(mach.size):
-        dcl_max[i, :, :] = np.broadcast_to(dcl[i, :, -1], (alpha.size, hob.size)).T
-
-    interp_data.set_val('delta_lift_coefficient_max', dcl_max.flatten(), 'unitless')
+    # aero_data is modified in-place, copy required
+    interp_data, data_key = _get_interp_data(aero_data, _prepare_ground_data, data_cache)
 
     # extrapolation fine especially for HOB over max
     return build_data_interpolator(num_nodes=num_nodes,
@@ -560,7 +557,73 @@ def _build_ground_aero_interp(num_nodes=0, aero_data=None, connect_training_data
                                    method=method,
                                    structured=structured,
                                    connect_training_data=connect_training_data,
-                                   extrapolate=extrapolate)
+                                   extrapolate=extrapolate,
+                                   data_cache=data_cache,
+                                   data_key=data_key)
+
+
+def _get_interp_data(aero_data, prepare, data_cache=None):
+    """
+    Return a copy of aero data prepared for interpolation by the given function, which
+    modifies the data in place, and the key of the prepared data in data_cache (None
+    without a data_cache). If data_cache is given, data is only prepared once, and its
+    copies share its values until they are changed.
+    """
+    if data_cache is None:
+        return prepare(aero_data.deepcopy()), None
+
+    key = (prepare.__name__, _get_data_key(aero_data))
+    if key not in data_cache:
+        data_cache[key] = prepare(aero_data.deepcopy())
+
+    return data_cache[key].deepcopy(lazy=True), key
+
+
+def _prepare_flaps_data(aero_data):
+    """
+    Structure flaps aero data and add the maximum lift coefficient increment to it.
+    """
+    aero_data = _structure_special_grid(aero_data)
+
+    dcl = aero_data.get_val('delta_lift_coefficient', 'unitless')
+    defl = np.unique(aero_data.get_val('flap_deflection', 'deg')
+                     )  # units don't matter, not using values
+    alpha = np.unique(aero_data.get_val('angle_of_attack', 'deg')
+                      )  # units don't matter, not using values
+    mach = np.unique(aero_data.get_val(Dynamic.Mission.MACH, 'unitless'))
+
+    dcl_max = np.zeros_like(dcl)
+    shape = (defl.size, mach.size, alpha.size)
+    dcl_max = np.resize(dcl_max, shape)
+    dcl = np.reshape(dcl, shape)
+    for i in range(defl.size):
+        dcl_max[i, :, :] = np.broadcast_to(dcl[i, :, -1], (alpha.size, mach.size)).T
+
+    aero_data.set_val('delta_lift_coefficient_max', dcl_max.flatten(), 'unitless')
+
+    return aero_data
+
+
+def _prepare_ground_data(aero_data):
+    """
+    Add the maximum lift coefficient increment to ground effect aero data.
+    """
+    dcl = aero_data.get_val('delta_lift_coefficient', 'unitless')
+    alpha = np.unique(aero_data.get_val('angle_of_attack', 'deg')
+                      )  # units don't matter, not using values
+    mach = np.unique(aero_data.get_val(Dynamic.Mission.MACH, 'unitless'))
+    hob = np.unique(aero_data.get_val('hob', 'unitless'))
+
+    dcl_max = np.zeros_like(dcl)
+    shape = (mach.size, hob.size, alpha.size)
+    dcl_max = np.resize(dcl_max, shape)
+    dcl = np.reshape(dcl, shape)
+    for i in range(mach.size):
+        dcl_max[i, :, :] = np.broadcast_to(dcl[i, :, -1], (alpha.size, hob.size)).T
+
+    aero_data.set_val('delta_lift_coefficient_max', dcl_max.flatten(), 'unitless')
+
+    return aero_data
 
 
 def _structure_special_grid(aero_data):
@@ -8,7 +8,9 @@ from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from packaging import version
 
 from aviary.subsystems.aerodynamics.gasp_based.table_based import (
-    GearDragIncrement, TabularCruiseAero, TabularLowSpeedAero)
+    GearDragIncrement, TabularCruiseAero, TabularLowSpeedAero, aliases)
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.data_interpolator_builder import _get_data_key
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
 
@@ -69,6 +71,50 @@ class TestCruiseAero(unittest.TestCase):
         partial_data = prob.check_partials(method="cs", out_stream=None)
         assert_check_partials(partial_data, atol=9e-8, rtol=2e-7)
 
+    def test_shared_data_cache(self):
+        fp = "subsystems/aerodynamics/gasp_based/data/large_single_aisle_1_aero_free.txt"
+        data_cache = {}
+
+        prob = om.Problem()
+        prob.model.add_subsystem('climb', TabularCruiseAero(
+            num_nodes=4, aero_data=fp, data_cache=data_cache))
+        prob.model.add_subsystem('cruise', TabularCruiseAero(
+            num_nodes=2, aero_data=fp, data_cache=data_cache))
+        prob.setup(force_alloc_complex=True)
+
+        # the structured and the formatted table, and the interpolants of CL, CD and
+        # CL max
+        self.assertEqual(len(data_cache), 3)
+        self.assertEqual(len(data_cache['interpolants']), 3)
+        for comp_name in ('free_aero_interp', 'lift_coefficient_max_interp'):
+            comps = [prob.model._get_subsystem(f'{name}.free_aero_interp.{comp_name}')
+                     for name in ('climb', 'cruise')]
+            for out_name, interp in comps[0].interps.items():
+                self.assertIs(interp, comps[1].interps[out_name])
+
+        # hashing the structured table does not copy the values that its lazy copies
+        # share
+        structured_data = data_cache['_structure_special_grid',
+                                     _get_data_key(read_data_file(fp, aliases=aliases))]
+        data = structured_data.deepcopy(lazy=True)
+        self.assertEqual(_get_data_key(data), _get_data_key(structured_data))
+        for key, (val, _) in structured_data._mapping.items():
+            self.assertIs(data._mapping[key][0], val)
+
+        prob.set_val('climb.' + Dynamic.Mission.MACH, [0.381, 0.384, 0.391, 0.8])
+        prob.set_val('climb.alpha', [5.19, 5.19, 5.19, 4.216])
+        prob.set_val('climb.' + Dynamic.Mission.ALTITUDE, [500, 1000, 2000, 37500])
+        prob.set_val('cruise.' + Dynamic.Mission.MACH, [0.8, 0.8])
+        prob.set_val('cruise.alpha', [4.216, 3.146])
+        prob.set_val('cruise.' + Dynamic.Mission.ALTITUDE, [37500, 37500])
+        prob.run_model()
+
+        assert_near_equal(prob['climb.CL'][-1], prob['cruise.CL'][0], 1e-15)
+        assert_near_equal(prob['cruise.CL'], [0.6304, 0.5059], tolerance=0.005)
+
+        partial_data = prob.check_partials(method="cs", out_stream=None)
+        assert_check_partials(partial_data, atol=9e-8, rtol=2e-7)
+
 
 class TestLowSpeedAero(unittest.TestCase):
 
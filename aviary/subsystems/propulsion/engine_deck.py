@@ -21,13 +21,24 @@ required_options : tuple
 dependent_options : dict
     Options that may or may not be required based on the presence or value of other
     provided options.
+
+cache_key_options : tuple
+    Options that change how engine data is pre-processed, and are therefore included in
+    the key used to identify cached engine data.
 """
 
+import hashlib
 import math
+import os
+import tempfile
 import warnings
+from pathlib import Path
+from zipfile import BadZipFile
 
 import numpy as np
 import openmdao.api as om
+from openmdao.components.interp_util.interp import InterpND
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
 
 from openmdao.utils.units import convert_units
 
@@ -38,12 +49,14 @@ from aviary.subsystems.propulsion.engine_sizing import SizeEngine
 from aviary.subsystems.propulsion.utils import UncorrectData
 from aviary.subsystems.propulsion.utils import (
     EngineModelVariables,
+    SharedMetaModelSemiStructuredComp,
     convert_geopotential_altitude,
     default_units,
     max_variables,
 )
 from aviary.utils.aviary_values import AviaryValues, NamedValues, get_keys, get_items
 from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.functions import get_path
 from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.variable_meta_data import _MetaData
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission, Settings
@@ -119,6 +132,24 @@ dependent_options = {
                                            Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION,)
 }
 
+# options that change the result of engine data pre-processing
+cache_key_options = (
+    Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION,
+    Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION,
+    Aircraft.Engine.FLIGHT_IDLE_THRUST_FRACTION,
+    Aircraft.Engine.GENERATE_FLIGHT_IDLE,
+    Aircraft.Engine.GEOPOTENTIAL_ALT,
+    Aircraft.Engine.IGNORE_NEGATIVE_THRUST,
+)
+
+# Resampled structured grids are reduced in size if they would have more than this
+# many times as many points as the original data
+_MAX_RESAMPLE_FACTOR = 4
+
+# Version of the cached engine data format. Must be incremented whenever the way engine
+# data is pre-processed changes, so stale cache files are not used
+_CACHE_VERSION = 1
+
 
 class EngineDeck(EngineModel):
     """
@@ -187,6 +218,21 @@ class EngineDeck(EngineModel):
         self.global_throttle = True
         self.global_hybrid_throttle = True
 
+        # share trained interpolants between all mission instances of this EngineDeck
+        # (one per phase), only per-num_nodes evaluation buffers are built separately
+        self.share_interpolants = True
+        self._interp_cache = {}
+
+        # maximum thrust/shaft power for each flight condition, pre-solved once per
+        # interpolation method
+        self._max_data = {}
+
+        # structured grids for engine data and max thrust tables, by table and
+        # interpolation method
+        self._structured_data = {}
+        # type of grid the engine data interpolator was built with
+        self.interpolation_grid = None
+
         # ensure required variables are a set
         self.required_variables = {*required_variables}
 
@@ -316,7 +362,21 @@ class EngineDeck(EngineModel):
             Normalize throttles/hybrid throttles.
 
             Fill flight idle points.
+
+        If Aircraft.Engine.DATA_CACHE_DIR is provided, processed data is loaded from
+        cache when a matching cache file exists, and saved to cache otherwise.
         """
+        cache_file = None
+        if self.read_from_file and self.get_item(Aircraft.Engine.DATA_CACHE_DIR)[0]:
+            cache_file = self._get_cache_file()
+
+            if self._load_cache(cache_file):
+                if self.use_thrust:
+                    # scaling checks still need to be performed, they depend on options
+                    # that are not part of the cache key
+                    self._set_reference_thrust()
+                return
+
         self._read_data(data)
 
         # perform consistency checks on data
@@ -341,6 +401,181 @@ class EngineDeck(EngineModel):
         if self.get_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE):
             self._generate_flight_idle()
 
+        if cache_file is not None:
+            self._save_cache(cache_file)
+
+    def _get_cache_file(self):
+        """
+        Determine the path of the cache file for this EngineDeck.
+
+        The cache file name contains a hash of the contents of the data file, the options
+        that affect data pre-processing, and the cache format version, so any change to
+        these results in a different cache file.
+
+        Returns
+        -------
+        cache_file : Path
+            Location of the cache file for this EngineDeck.
+        """
+        data_file = get_path(self.get_val(Aircraft.Engine.DATA_FILE))
+        cache_dir = Path(self.get_item(Aircraft.Engine.DATA_CACHE_DIR)[0])
+
+        key = hashlib.sha256(data_file.read_bytes())
+
+        key_items = [f'version:{_CACHE_VERSION}']
+        for option in cache_key_options:
+            val, units = self.options.get_item(option)
+            key_items.append(f'{option}:{val}:{units}')
+        # reference thrust is only computed from data if it was not provided
+        key_items.append(f'reference_thrust_provided:'
+                         f'{Aircraft.Engine.REFERENCE_SLS_THRUST in self.options}')
+        key_items.append(f'global_throttle:{self.global_throttle}')
+        key_items.append(f'global_hybrid_throttle:{self.global_hybrid_throttle}')
+        key_items.append(f'tolerances:{self.mach_tol}:{self.alt_tol}:{self.thrust_tol}')
+        key.update('|'.join(key_items).encode('utf-8'))
+
+        return cache_dir / f'{data_file.stem}_{key.hexdigest()[:16]}.npz'
+
+    def _load_cache(self, cache_file):
+        """
+        Load processed engine data from a cache file, replacing all data
+        pre-processing.
+
+        Parameters
+        ----------
+        cache_file : Path
+            Location of the cache file to be loaded.
+
+        Returns
+        -------
+        bool
+            True if cached data was successfully loaded, False otherwise.
+        """
+        if not cache_file.exists():
+            return False
+
+        try:
+            with np.load(cache_file, allow_pickle=False) as cache:
+                if int(cache['version']) != _CACHE_VERSION:
+                    return False
+
+                data_keys = [EngineModelVariables[key] for key in cache['data_keys']]
+                self.data = {key: cache['data:' + key.name] for key in data_keys}
+                self.packed_data = {
+                    key: cache['packed:' + key.name] for key in data_keys}
+                if 'idle_keys' in cache:
+                    self.idle_points = {
+                        EngineModelVariables[key]: cache['idle:' + key]
+                        for key in cache['idle_keys']}
+
+                self._original_data = {}
+                for idx, key in enumerate(cache['original_keys']):
+                    kind, name = key.split(':', 1)
+                    if kind == 'enum':
+                        name = EngineModelVariables[name]
+                    self._original_data[name] = cache[f'original:{idx}']
+
+                self.engine_variables = {
+                    EngineModelVariables[key]: str(units) for key, units in
+                    zip(cache['engine_variables'], cache['engine_variable_units'])}
+
+                self.data_indices = cache['data_indices']
+                self.mach_max_count = int(cache['mach_max_count'])
+                self.alt_max_count = int(cache['alt_max_count'])
+                self.data_max_count = int(cache['data_max_count'])
+                self.model_length = int(cache['model_length'])
+
+                for attr in ('throttle_min', 'throttle_max',
+                             'hybrid_throttle_min', 'hybrid_throttle_max'):
+                    val = cache[attr]
+                    setattr(self, attr, val[()] if val.ndim == 0 else val)
+
+                reference_thrust = float(cache['reference_sls_thrust'])
+
+        except (BadZipFile, KeyError, OSError, ValueError) as err:
+            if self.get_val(Settings.VERBOSITY) >= Verbosity.BRIEF:
+                warnings.warn(
+                    f'EngineDeck <{self.name}>: cached engine data <{cache_file}> could '
+                    f'not be loaded ({err}). Engine data will be re-processed.')
+            return False
+
+        self._set_variable_flags()
+
+        # user-provided reference thrust takes priority over the value from engine data
+        if (
+            not np.isnan(reference_thrust)
+            and Aircraft.Engine.REFERENCE_SLS_THRUST not in self.options
+        ):
+            self.set_val(Aircraft.Engine.REFERENCE_SLS_THRUST, reference_thrust, 'lbf')
+
+        if self.get_val(Settings.VERBOSITY) >= Verbosity.VERBOSE:
+            print(f'EngineDeck <{self.name}>: loaded cached engine data from '
+                  f'<{cache_file}>')
+
+        return True
+
+    def _save_cache(self, cache_file):
+        """
+        Save processed engine data to a cache file. The file is written to a temporary
+        location first and then moved into place, so parallel processes never read a
+        partially written cache file.
+
+        Parameters
+        ----------
+        cache_file : Path
+            Location of the cache file to be written.
+        """
+        cache = {
+            'version': np.array(_CACHE_VERSION),
+            'data_keys': np.array([key.name for key in self.data]),
+            'engine_variables': np.array([key.name for key in self.engine_variables]),
+            'engine_variable_units': np.array(list(self.engine_variables.values())),
+            'data_indices': self.data_indices,
+            'mach_max_count': np.array(self.mach_max_count),
+            'alt_max_count': np.array(self.alt_max_count),
+            'data_max_count': np.array(self.data_max_count),
+            'model_length': np.array(self.model_length),
+            'throttle_min': np.asarray(self.throttle_min),
+            'throttle_max': np.asarray(self.throttle_max),
+            'hybrid_throttle_min': np.asarray(self.hybrid_throttle_min),
+            'hybrid_throttle_max': np.asarray(self.hybrid_throttle_max),
+        }
+
+        for key in self.data:
+            cache['data:' + key.name] = self.data[key]
+            cache['packed:' + key.name] = self.packed_data[key]
+
+        if hasattr(self, 'idle_points'):
+            cache['idle_keys'] = np.array([key.name for key in self.idle_points])
+            for key in self.idle_points:
+                cache['idle:' + key.name] = self.idle_points[key]
+
+        original_keys = []
+        for idx, key in enumerate(self._original_data):
+            if isinstance(key, EngineModelVariables):
+                original_keys.append('enum:' + key.name)
+            else:
+                original_keys.append('str:' + key)
+            cache[f'original:{idx}'] = np.asarray(self._original_data[key])
+        cache['original_keys'] = np.array(original_keys)
+
+        reference_thrust = np.nan
+        if self.use_thrust:
+            reference_thrust = self.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf')
+        cache['reference_sls_thrust'] = np.array(reference_thrust)
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_file.parent, suffix='.tmp',
+                                             delete=False) as file:
+                np.savez(file, **cache)
+            os.replace(file.name, cache_file)
+        except OSError as err:
+            if self.get_val(Settings.VERBOSITY) >= Verbosity.BRIEF:
+                warnings.warn(
+                    f'EngineDeck <{self.name}>: engine data could not be cached to '
+                    f'<{cache_file}> ({err}).')
+
     def _read_data(self, raw_data: NamedValues):
         """
         Import tabular engine data; either from memory or from a data file.
@@ -395,10 +630,14 @@ class EngineDeck(EngineModel):
             val, units = raw_data.get_item(key)
             if key in aliases:
                 # Convert data to expected units. Required so settings like tolerances
-                # that assume units work as expected
+                # that assume units work as expected. Data already in those units is not
+                # copied, so data memory-mapped from a columnar file stays shared
                 try:
-                    val = np.array([convert_units(i, units, default_units[key])
-                                   for i in val])
+                    if units == default_units[key]:
+                        val = np.asarray(val)
+                    else:
+                        val = np.array(convert_units(np.asarray(val), units,
+                                                     default_units[key]))
                 except TypeError:
                     raise TypeError(
                         f"{message}: units of '{units}' provided for "
@@ -575,32 +814,6 @@ class EngineDeck(EngineModel):
 
         Modifies unpacked data in place, updates packed data.
         """
-        def _extrapolate(array):
-            """
-            Linearly extrapolate variable to idle thrust point.
-
-            Parameters
-            ----------
-            array : numpy.ndarray
-                Data used for extrapolation.
-
-            Returns
-            -------
-            rvalue : float
-                Extrapolated flight idle value.
-            """
-            y0 = array[0]
-            y1 = array[1]
-
-            if y0 == 0 and y1 == 0:
-                return 0
-
-            rvalue = (
-                y0 + (y1 - y0) * extrap_term
-            )
-
-            return rvalue
-
         idle_thrust_fract = self.get_val(Aircraft.Engine.FLIGHT_IDLE_THRUST_FRACTION)
         idle_min_fract = self.get_val(Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION)
         idle_max_fract = self.get_val(Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION)
@@ -617,9 +830,7 @@ class EngineDeck(EngineModel):
             direct_calc_vars.append(SHAFT_POWER)
 
         # stored information about packed data
-        mach_max_count = self.mach_max_count
-        alt_max_count = self.alt_max_count
-        data_indices = self.data_indices
+        data_indices = self.data_indices[:self.mach_max_count, :self.alt_max_count]
 
         # Throttle is already normalized from 0 to 1. Set flight idle to -0.1, which will
         # get re-normalized to 0
@@ -629,8 +840,6 @@ class EngineDeck(EngineModel):
         throttle_idle = -0.1
         hybrid_throttle_idle = 0
 
-        idle_points = {key: np.empty(0) for key in packed_data}
-
         # Normally, only one idle point is needed - however, when hybrid throttle is
         # present, there needs to be a sweep of points for a given Mach/alt/throttle
         # to satisfy the interpolator's requirements for at least 3 points per dimension
@@ -643,107 +852,87 @@ class EngineDeck(EngineModel):
             # This time, we want an arbitrarily small number
             h_tol = 1e-4
 
-        for M in range(mach_max_count):
-            for A in range(alt_max_count):
-                # if no data at this Mach, alt index combination, skip
-                if data_indices[M, A] == 0:
-                    continue
-
-                # don't generate flight idle points if thrust is already zero or negative
-                # at lowest index
-                if packed_data[THRUST][M, A, 0] <= self.thrust_tol:
-                    continue
-
-                # define known data for idle point (independent variables)
-                idle_points[MACH] = np.append(
-                    idle_points[MACH], [packed_data[MACH][M, A, 0]] * num_points)
-                idle_points[ALTITUDE] = np.append(
-                    idle_points[ALTITUDE], [packed_data[ALTITUDE][M, A, 0]] * num_points)
-                idle_points[THROTTLE] = np.append(
-                    idle_points[THROTTLE], [throttle_idle] * num_points)
+        # Find all Mach, alt combinations that get an idle point. Skip combinations with
+        # no data, and don't generate flight idle points if thrust is already zero or
+        # negative at lowest index
+        mach_idx, alt_idx = np.nonzero(
+            (data_indices != 0) & ~(packed_data[THRUST][:, :, 0] <= self.thrust_tol))
+        data_idx = data_indices[mach_idx, alt_idx]
+        num_conditions = len(mach_idx)
+
+        # if there is only one data point at a Mach, alt combination, use thrust fraction
+        # instead of extrapolation
+        # TODO idle currently calculated using lowest index data points - this is not
+        #      guaranteed to be at hybrid throttle idle point, could be negative
+        single = data_idx == 1
+        multiple = ~single
+
+        def _first_points(key, index=0):
+            return packed_data[key][mach_idx, alt_idx, index]
+
+        idle_values = {}
+
+        # calculate idle thrust, shaft powers as a percentage of max thrust at Mach, alt
+        # point. Thrust, shaft powers do not get idle_min/max checks
+        extrap_term = np.zeros(num_conditions)
+        for var in direct_calc_vars:
+            idle_values[var] = \
+                packed_data[var][mach_idx, alt_idx, data_idx - 1] * idle_thrust_fract
+
+            # Calculate term for linear extrapolation - shaft power has highest
+            # "preference" since it is last in the list, followed by corrected
+            # shaft power then finally thrust. This is designed for compatibility
+            # with turboshaft engine decks in TurbopropModels.
+            # Only one extrapolation term can be used for all dependent vars
+            y0 = _first_points(var)[multiple]
+            y1 = _first_points(var, 1)[multiple]
+            extrap_term[multiple] = (idle_values[var][multiple] - y0) / (y1 - y0)
+
+        # compute idle data
+        for key in packed_data:
+            # skip independent variables or thrust, which is already calculated
+            if key in [MACH, ALTITUDE, THROTTLE, HYBRID_THROTTLE] + direct_calc_vars:
+                continue
+
+            idle_value = np.zeros(num_conditions)
+            idle_value[single] = _first_points(key)[single] * idle_thrust_fract
+
+            # extrapolate to idle from lowest two throttle points in data, variables
+            # that are zero at both points remain zero
+            y0 = _first_points(key)[multiple]
+            y1 = _first_points(key, 1)[multiple]
+            nonzero = ~((y0 == 0) & (y1 == 0))
+            extrap_value = np.zeros(len(y0))
+            extrap_value[nonzero] = y0[nonzero] + (y1[nonzero] - y0[nonzero]) * \
+                extrap_term[multiple][nonzero]
+            idle_value[multiple] = extrap_value
+
+            # idle cannot be below or above user-set limits
+            var_min = _first_points(key, -1) * idle_min_fract
+            var_max = _first_points(key, -1) * idle_max_fract
+            idle_values[key] = np.where(
+                idle_value < var_min, var_min,
+                np.where(idle_value > var_max, var_max, idle_value))
+
+        # store newly computed idle points, repeated for each point in hybrid sweep
+        idle_points = {}
+        for key in packed_data:
+            if key == MACH or key == ALTITUDE:
+                idle_points[key] = np.repeat(_first_points(key), num_points)
+            elif key == THROTTLE:
+                idle_points[key] = np.full(num_conditions * num_points, throttle_idle,
+                                           dtype=float)
+            elif key == HYBRID_THROTTLE:
                 if self.use_hybrid_throttle:
                     hybrid_throttle_range = np.linspace(hybrid_throttle_idle-h_tol,
                                                         hybrid_throttle_idle+h_tol,
                                                         num_points)
-                    idle_points[HYBRID_THROTTLE] = np.append(
-                        idle_points[HYBRID_THROTTLE], hybrid_throttle_range)
+                    idle_points[key] = np.tile(hybrid_throttle_range, num_conditions)
                 else:
-                    idle_points[HYBRID_THROTTLE] = np.append(
-                        idle_points[HYBRID_THROTTLE], hybrid_throttle_idle)
-
-                # if there is only one data point at this Mach, alt combination, use
-                # thrust fraction instead of extrapolation
-                # TODO idle currently calculated using lowest index data points - this is not
-                #      guaranteed to be at hybrid throttle idle point, could be negative
-                if data_indices[M, A] == 1:
-                    for key in packed_data:
-                        if key not in [
-                                MACH,
-                                ALTITUDE,
-                                THROTTLE,
-                                HYBRID_THROTTLE] + direct_calc_vars:
-                            idle_value = packed_data[key][M, A, 0] * idle_thrust_fract
-                            var_min = packed_data[key][M, A, -1] * idle_min_fract
-                            var_max = packed_data[key][M, A, -1] * idle_max_fract
-
-                            if idle_value < var_min:
-                                idle_value = var_min
-                            elif idle_value > var_max:
-                                idle_value = var_max
-
-                            idle_points[key] = np.append(idle_points[key],
-                                                         [idle_value] * num_points)
-                            # add Mach, alt combination to idle_points with idle power
-                            # codes
-
-                    # thrust, shaft powers do not get idle_min/max checks
-                    for var in direct_calc_vars:
-                        idle_points[var] = np.append(idle_points[var],
-                                                     [[packed_data[var][M, A, 0]
-                                                       * idle_thrust_fract]] * num_points)
-                    # move to next data point
-                    continue
-
-                # calculate idle thrust, shaft powers as a percentage of max thrust at Mach, alt point
-                for var in direct_calc_vars:
-                    idle_calc_value = packed_data[var][M, A, data_indices[M, A] - 1]\
-                        * idle_thrust_fract
-
-                    # add this point to idle_points
-                    idle_points[var] = np.append(idle_points[var],
-                                                 [idle_calc_value] * num_points)
-
-                    # Calculate term for linear extrapolation - shaft power has highest
-                    # "preference" since it is last in the list, followed by corrected
-                    # shaft power then finally thrust. This is designed for compatibility
-                    # with turboshaft engine decks in TurbopropModels.
-                    # Only one extrapolation term can be used for all dependent vars
-                    extrap_term = (idle_calc_value - packed_data[var][M, A, 0]) / (
-                        packed_data[var][M, A, 1] - packed_data[var][M, A, 0])
-
-                # compute idle data
-                for key in packed_data:
-                    # skip independent variables or thrust, which is already calculated
-                    if key not in [
-                            MACH,
-                            ALTITUDE,
-                            THROTTLE,
-                            HYBRID_THROTTLE] + direct_calc_vars:
-                        # extrapolate to idle from lowest two throttle points in data
-                        idle_value = _extrapolate(packed_data[key][M, A])
-
-                        # idle cannot be below or above user-set limits
-                        var_min = packed_data[key][M, A, -1] * idle_min_fract
-                        var_max = packed_data[key][M, A, -1] * idle_max_fract
-
-                        if idle_value < var_min:
-                            idle_value = var_min
-                        elif idle_value > var_max:
-                            idle_value = var_max
-
-                        # store newly computed idle point
-                        idle_points[key] = np.append(idle_points[key],
-                                                     [idle_value] * num_points)
+                    idle_points[key] = np.full(num_conditions, hybrid_throttle_idle,
+                                               dtype=float)
+            else:
+                idle_points[key] = np.repeat(idle_values[key], num_points)
 
         # add idle points to data
         for key in packed_data:
@@ -762,6 +951,67 @@ class EngineDeck(EngineModel):
         # Re-normalize throttle since "dummy" idle values were used
         self._normalize_throttle()
 
+    def _get_max_data(self, interp_method):
+        """
+        Returns maximum values of thrust and shaft power at each flight condition
+        (Mach, altitude) present in the data, along with the max throttle and hybrid
+        throttle they occur at. Maximums are assumed to occur at maximum throttle and
+        hybrid throttle, and are evaluated with the same interpolation method used for
+        the full engine data so results are consistent with it. The table is only
+        solved once per interpolation method.
+
+        Parameters
+        ----------
+        interp_method : str
+            Interpolation method used to evaluate engine data at max throttle.
+
+        Returns
+        -------
+        max_data : dict
+            Maximum values for each flight condition, keyed by EngineModelVariables.
+        """
+        if interp_method in self._max_data:
+            return self._max_data[interp_method]
+
+        max_data = self._max_data[interp_method] = {}
+
+        # flight conditions present in data, in the order they appear in data
+        mach_idx, alt_idx = np.nonzero(self.data_indices[:self.mach_max_count,
+                                                         :self.alt_max_count])
+        mach_table = self.packed_data[MACH][mach_idx, alt_idx, 0]
+        alt_table = self.packed_data[ALTITUDE][mach_idx, alt_idx, 0]
+        num_conditions = len(mach_table)
+
+        throttle_max = np.broadcast_to(self.throttle_max, num_conditions)
+        max_data[MACH] = mach_table
+        max_data[ALTITUDE] = alt_table
+        max_data[THROTTLE] = np.array(throttle_max, dtype=float)
+
+        grid = [self.data[MACH], self.data[ALTITUDE], self.data[THROTTLE]]
+        points = [mach_table, alt_table, throttle_max]
+        if self.use_hybrid_throttle:
+            hybrid_throttle_max = np.broadcast_to(self.hybrid_throttle_max,
+                                                  num_conditions)
+            max_data[HYBRID_THROTTLE] = np.array(hybrid_throttle_max, dtype=float)
+            grid.append(self.data[HYBRID_THROTTLE])
+            points.append(hybrid_throttle_max)
+
+        grid = np.array(grid).T
+        points = np.array(points).T
+
+        max_keys = [THRUST]
+        if self.use_shaft_power:
+            if SHAFT_POWER in self.engine_variables:
+                max_keys.append(SHAFT_POWER)
+            else:
+                max_keys.append(SHAFT_POWER_CORRECTED)
+
+        for variable in max_keys:
+            interp = InterpNDSemi(grid, self.data[variable], method=interp_method)
+            max_data[variable] = interp.interpolate(points)
+
+        return max_data
+
     def build_pre_mission(self, aviary_inputs) -> om.ExplicitComponent:
         """
         Build components to be added to pre-mission propulsion subsystem.
@@ -774,29 +1024,130 @@ class EngineDeck(EngineModel):
 
         return SizeEngine(aviary_options=self.options)
 
+    def _get_interp_cache(self):
+        """
+        Returns the dictionary of trained interpolants shared by the metamodel
+        components of this EngineDeck, or None if interpolants are not shared.
+        """
+        if self.share_interpolants:
+            return self._interp_cache
+        return None
+
+    def _get_structured_data(self, table, independent, dependent, interp_method):
+        """
+        Determine if data for an interpolation table can be served on a structured
+        grid, based on Aircraft.Engine.INTERPOLATION_GRID. Results are only computed
+        once per table and interpolation method.
+
+        Parameters
+        ----------
+        table : str
+            Name of the interpolation table, used to identify stored results.
+        independent : list of numpy.ndarray
+            Values of each independent variable, with one entry per data point.
+        dependent : dict
+            Values of each dependent variable, with one entry per data point.
+        interp_method : str
+            Interpolation method used with the table.
+
+        Returns
+        -------
+        grid_type : str
+            'structured' if data is a structured grid, 'resampled' if data was resampled
+            onto a structured grid, or 'semistructured' otherwise.
+        structured_data : tuple
+            Tuple of (grid, values) describing the structured grid, or None if a
+            semistructured grid is used.
+        """
+        key = (table, interp_method)
+        if key in self._structured_data:
+            return self._structured_data[key]
+
+        grid_type = self.get_item(Aircraft.Engine.INTERPOLATION_GRID)[0]
+        if grid_type is None:
+            grid_type = 'auto'
+        if grid_type not in ('auto', 'structured', 'semistructured'):
+            raise ValueError(f'EngineDeck <{self.name}>: invalid value <{grid_type}> '
+                             f'for {Aircraft.Engine.INTERPOLATION_GRID}, allowable '
+                             "values are 'auto', 'structured', and 'semistructured'.")
+
+        structured_data = None
+        if grid_type != 'semistructured':
+            structured_data = _get_structured_grid(independent, dependent)
+            if structured_data is not None:
+                grid_type = 'structured'
+            elif grid_type == 'structured':
+                structured_data = _resample_structured_grid(independent, dependent,
+                                                            interp_method)
+                grid_type = 'resampled'
+
+        if structured_data is not None:
+            grid, values = structured_data
+            try:
+                # check that grid has enough points in each dimension for method
+                InterpND(method=interp_method, points=grid,
+                         values=next(iter(values.values())))
+            except ValueError:
+                if grid_type == 'resampled':
+                    raise
+                structured_data = None
+
+        if structured_data is None:
+            grid_type = 'semistructured'
+
+        self._structured_data[key] = (grid_type, structured_data)
+        return grid_type, structured_data
+
     def _build_engine_interpolator(self, num_nodes, aviary_inputs):
         """
         Builds the OpenMDAO metamodel component for the engine deck.
-        Currently only the semistructured model is supported.
+        If data is (or is resampled onto) a structured grid, the structured metamodel is
+        used, otherwise the semistructured metamodel is used.
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
-        # interpolator object for engine data
-        engine = om.MetaModelSemiStructuredComp(
-            method=interp_method, extrapolate=True, vec_size=num_nodes)
 
         units = default_units
         for key in self.engine_variables:
             units[key] = self.engine_variables[key]
         self.engine_variable_units = units
 
-        # add inputs and outputs to interpolator
         independent_variables = [MACH, ALTITUDE, THROTTLE, HYBRID_THROTTLE]
         no_scale_variables = [TEMPERATURE]
-        for variable in self.engine_variables:
+
+        inputs = [var for var in independent_variables if var in self.engine_variables]
+        outputs = [var for var in self.engine_variables
+                   if var not in independent_variables]
+
+        grid_type, structured_data = self._get_structured_data(
+            'engine',
+            [self.data[var] for var in inputs],
+            {var: self.data[var] for var in outputs},
+            interp_method)
+        self.interpolation_grid = grid_type
+
+        # interpolator object for engine data
+        if structured_data is None:
+            engine = SharedMetaModelSemiStructuredComp(
+                method=interp_method, extrapolate=True, vec_size=num_nodes,
+                interp_cache=self._get_interp_cache())
+            training_data = self.data
+            variables = self.engine_variables
+        else:
+            # structured interpolants store the last evaluated point for use in
+            # computing partials, so they are not shared between components
+            engine = om.MetaModelStructuredComp(
+                method=interp_method, extrapolate=True, vec_size=num_nodes)
+            grid, values = structured_data
+            training_data = {**values, **dict(zip(inputs, grid))}
+            # inputs must be added in the same order as the dimensions of the grid
+            variables = inputs + outputs
+
+        # add inputs and outputs to interpolator
+        for variable in variables:
             if variable in independent_variables:
                 engine.add_input(
                     variable.value,
-                    self.data[variable],
+                    training_data=training_data[variable],
                     units=default_units[variable],
                 )
             else:
@@ -807,7 +1158,7 @@ class EngineDeck(EngineModel):
                     var_name = variable.value + '_unscaled'
                 engine.add_output(
                     var_name,
-                    self.data[variable],
+                    training_data=training_data[variable],
                     units=default_units[variable],
                 )
 
@@ -838,108 +1189,65 @@ class EngineDeck(EngineModel):
         engine = self._build_engine_interpolator(num_nodes, aviary_inputs)
         units = self.engine_variable_units
 
-        # Create copy of interpolation component that computes max thrust/shp for current
-        # flight condition
+        # Interpolate pre-solved maximum thrust/shp (and the max throttles they occur
+        # at) for current flight condition on a reduced (Mach, altitude) table
         # NOTE max thrust is assumed to occur at maximum throttle and hybrid throttle
         #      for each flight condition
         # TODO Use solver to find throttle/hybrid throttle for maximum thrust at given flight condition?
-        #      Pre-solve max throttle/hybrid throttle for each flight condition, interpolate on
-        #      reduced data set?
         if self.use_thrust or self.use_shaft_power:
-            if self.global_throttle or (self.global_hybrid_throttle
-                                        and self.use_hybrid_throttle):
-                # create IndepVarComp to pass maximum throttle is to max thrust interpolator
-                fixed_throttles = om.IndepVarComp()
-                if self.global_throttle:
-                    fixed_throttles.add_output('throttle_max',
-                                               val=np.ones(num_nodes) *
-                                               self.throttle_max,
-                                               units='unitless',
-                                               desc='Engine maximum throttle')
-                if self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    fixed_throttles.add_output('hybrid_throttle_max',
-                                               val=np.ones(num_nodes) *
-                                               self.hybrid_throttle_max,
-                                               units='unitless',
-                                               desc='Engine maximum hybrid throttle')
-            if not (self.global_throttle or (self.global_hybrid_throttle
-                                             and self.use_hybrid_throttle)):
-                interp_throttles = om.MetaModelSemiStructuredComp(method=interp_method,
-                                                                  extrapolate=False,
-                                                                  vec_size=num_nodes)
-
-                packed_data = self.packed_data
-                mach_table = np.array([])
-                alt_table = np.array([])
-
-                for M in range(self.mach_max_count):
-                    for A in range(self.alt_max_count):
-                        if self.data_indices[M, A] != 0:
-                            mach_table = np.append(
-                                mach_table, packed_data[MACH][M, A, 0])
-                            alt_table = np.append(
-                                alt_table, packed_data[ALTITUDE][M, A, 0])
-
-                # add inputs and outputs to interpolator
-                interp_throttles.add_input(Dynamic.Mission.MACH,
-                                           mach_table,
-                                           units='unitless',
-                                           desc='Current flight Mach number')
-                interp_throttles.add_input(Dynamic.Mission.ALTITUDE,
-                                           alt_table,
-                                           units=units[ALTITUDE],
-                                           desc='Current flight altitude')
-                if not self.global_throttle:
-                    interp_throttles.add_output('throttle_max',
-                                                self.throttle_max,
-                                                units='unitless',
-                                                desc='max throttle avaliable at current '
-                                                'flight condition')
-                if not self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    interp_throttles.add_output('hybrid_throttle_max',
-                                                self.hybrid_throttle_max,
-                                                units='unitless',
-                                                desc='max hybrid throttle avaliable at '
-                                                     'current flight condition')
-
-            # Calculation of max thrust currently done with a duplicate of the engine
-            # model and scaling components
-            max_thrust_engine = om.MetaModelSemiStructuredComp(
-                method=interp_method, extrapolate=False, vec_size=num_nodes)
+            max_data = self._get_max_data(interp_method)
+            max_outputs = {key: val for key, val in max_data.items()
+                           if key not in (MACH, ALTITUDE)}
+
+            _, structured_data = self._get_structured_data(
+                'max', [max_data[MACH], max_data[ALTITUDE]], max_outputs,
+                interp_method)
+
+            if structured_data is None:
+                max_thrust_engine = SharedMetaModelSemiStructuredComp(
+                    method=interp_method, extrapolate=False, vec_size=num_nodes,
+                    interp_cache=self._get_interp_cache())
+                training_data = max_data
+            else:
+                # semistructured interpolants always extrapolate, so the structured
+                # table must as well
+                max_thrust_engine = om.MetaModelStructuredComp(
+                    method=interp_method, extrapolate=True, vec_size=num_nodes)
+                grid, values = structured_data
+                training_data = {MACH: grid[0], ALTITUDE: grid[1], **values}
 
             max_thrust_engine.add_input(Dynamic.Mission.MACH,
-                                        self.data[MACH],
+                                        training_data=training_data[MACH],
                                         units='unitless',
                                         desc='Current flight Mach number')
             max_thrust_engine.add_input(Dynamic.Mission.ALTITUDE,
-                                        self.data[ALTITUDE],
+                                        training_data=training_data[ALTITUDE],
                                         units=units[ALTITUDE],
                                         desc='Current flight altitude')
-            # replace throttle coming from mission with max value based on flight condition
-            max_thrust_engine.add_input('throttle_max',
-                                        self.data[THROTTLE],
-                                        units='unitless',
-                                        desc='Current engine throttle')
+            max_thrust_engine.add_output('throttle_max',
+                                         training_data=training_data[THROTTLE],
+                                         units='unitless',
+                                         desc='max throttle avaliable at current '
+                                         'flight condition')
             if self.use_hybrid_throttle:
-                # replace hybrid throttle coming from mission with max value based on
-                # flight condition
-                max_thrust_engine.add_input('hybrid_throttle_max',
-                                            self.data[HYBRID_THROTTLE],
-                                            units='unitless',
-                                            desc='Current engine hybrid throttle')
+                max_thrust_engine.add_output('hybrid_throttle_max',
+                                             training_data=training_data[HYBRID_THROTTLE],
+                                             units='unitless',
+                                             desc='max hybrid throttle avaliable at '
+                                             'current flight condition')
             max_thrust_engine.add_output('thrust_net_max_unscaled',
-                                         self.data[THRUST],
+                                         training_data=training_data[THRUST],
                                          units=units[THRUST],
                                          desc='maximum thrust that can currently be produced')
         if self.use_shaft_power:
             if SHAFT_POWER in self.engine_variables:
                 max_thrust_engine.add_output('shaft_power_max_unscaled',
-                                             self.data[SHAFT_POWER],
+                                             training_data=training_data[SHAFT_POWER],
                                              units=units[SHAFT_POWER],
                                              desc='maximum shaft power that can currently be produced')
             else:
                 max_thrust_engine.add_output('shaft_power_corrected_max_unscaled',
-                                             self.data[SHAFT_POWER_CORRECTED],
+                                             training_data=training_data[SHAFT_POWER_CORRECTED],
                                              units=units[SHAFT_POWER_CORRECTED],
                                              desc='maximum corrected shaft power that can currently be produced')
 
@@ -972,23 +1280,15 @@ class EngineDeck(EngineModel):
                                  'uncorrect_shaft_power.corrected_data')
 
         if self.use_thrust or self.use_shaft_power:
-            if self.global_throttle or (self.global_hybrid_throttle
-                                        and self.use_hybrid_throttle):
-                engine_group.add_subsystem('fixed_max_throttles',
-                                           fixed_throttles,
-                                           promotes_outputs=['*'])
-
-            if not (self.global_throttle or (self.global_hybrid_throttle
-                                             and self.use_hybrid_throttle)):
-                engine_group.add_subsystem('interp_max_throttles',
-                                           interp_throttles,
-                                           promotes_inputs=['*'],
-                                           promotes_outputs=['*'])
+            max_throttles = ['throttle_max']
+            if self.use_hybrid_throttle:
+                max_throttles.append('hybrid_throttle_max')
 
             engine_group.add_subsystem(
                 'max_interpolation',
                 max_thrust_engine,
-                promotes_inputs=['*'])
+                promotes_inputs=['*'],
+                promotes_outputs=max_throttles)
 
             if uncorrect_shp:
                 engine_group.add_subsystem(
@@ -1128,6 +1428,18 @@ class EngineDeck(EngineModel):
                 summary_line = f'| {var_name} | {val} | {units} |\n'
                 f.write(summary_line)
 
+            # note which type of interpolator the engine data was served through
+            grid_descriptions = {
+                'structured': 'a structured grid (MetaModelStructuredComp)',
+                'resampled': 'a structured grid resampled from the provided data '
+                             '(MetaModelStructuredComp)',
+                'semistructured': 'a semistructured grid '
+                                  '(MetaModelSemiStructuredComp)',
+            }
+            if self.interpolation_grid is not None:
+                f.write('\nEngine performance data is interpolated on '
+                        f'{grid_descriptions[self.interpolation_grid]}.\n')
+
     def _set_reference_thrust(self):
         """
         Determine maximum sea-level static thrust produced by the engine (unscaled).
@@ -1390,25 +1702,30 @@ class EngineDeck(EngineModel):
         data_indices = self.data_indices
 
         packed_data = self.packed_data = {}
-        idx = 0
 
         for key in self.data:
             packed_data[key] = np.zeros((mach_max_count, alt_max_count, data_max_count))
 
-        for M in range(mach_max_count):
+        if not alt_max_count:
+            return
 
-            for A in range(alt_max_count):
-                if data_indices[M, A] == 0:
-                    # skip point if there is no data
-                    continue
+        # number of data points at each Mach, alt combination is index+1, points with no
+        # data are skipped. Data is consumed in order of Mach, then altitude
+        point_counts = np.where(data_indices > 0, data_indices + 1, 0)
+        point_counts = point_counts[:mach_max_count, :alt_max_count].ravel()
+        num_points = point_counts.sum()
+
+        # Mach, alt, and data index in packed array for each row of unpacked data
+        flight_condition = np.repeat(np.arange(point_counts.size), point_counts)
+        mach_idx, alt_idx = np.divmod(flight_condition, alt_max_count)
+        data_idx = np.arange(num_points) - np.repeat(
+            np.cumsum(point_counts) - point_counts, point_counts)
 
-                # number of data points is index+1
-                for D in range(data_indices[M, A] + 1):
-                    for key in self.data:
-                        unpacked_data = self.data[key]
-                        if idx < len(unpacked_data):
-                            packed_data[key][M, A, D] = unpacked_data[idx]
-                    idx += 1
+        for key in self.data:
+            unpacked_data = self.data[key]
+            length = min(num_points, len(unpacked_data))
+            packed_data[key][mach_idx[:length], alt_idx[:length], data_idx[:length]] = \
+                unpacked_data[:length]
 
     def _count_data(self):
         """
@@ -1421,83 +1738,54 @@ class EngineDeck(EngineModel):
             If insufficient number of altitude points (<2) provided for a given Mach
             number.
         """
-        mach_count = 0
-        # First mach number must have at least one altitude associated with it
-        alt_count = 1
-        max_alt_count = 0
-        # First mach number must have at least one data point associated with it
-        data_count = 1
-        max_data_count = 0
-
-        # data_indices stores how many data points there are for a given Mach/alt combo
-        data_indices = np.array([[]])
-
-        curr_mach = curr_alt = np.inf
-
         mach_numbers = self.data[MACH]
         altitudes = self.data[ALTITUDE]
 
-        # Loop through data. Keep track of last unique value (curr_*) to compare each new
-        #   value with
-        # Count number of altitudes per mach, number of data points per
-        #   mach/altitude combination, compare with max_count
-        for idx in range(self.model_length):
-            mach_num = mach_numbers[idx]
-            alt = altitudes[idx]
-
-            if math.isclose(mach_num, curr_mach, abs_tol=self.mach_tol):
-
-                if math.isclose(alt, curr_alt, abs_tol=self.alt_tol):
-                    data_indices[mach_count - 1, alt_count - 1] = data_count
-                    data_count += 1
-
-                else:
-                    # new altitude for this mach number, count it
-                    curr_alt = alt
-                    alt_count += 1
-                    data_indices = extend_array(data_indices, [mach_count, alt_count])
-
-                    if data_count > max_data_count:
-                        max_data_count = data_count
-                    # new altitude means reset data counter
-                    data_count = 1
-                    # count data associated with new altitude
-                    data_indices[mach_count - 1, alt_count - 1] = 1
-
-            else:
-                # new Mach number
-                # if there are less than two altitudes for this Mach number, quit
-                if alt_count < 2 and mach_count > 0:
-                    raise UserWarning(
-                        'Only one altitude provided for Mach number '
-                        f'{mach_numbers[mach_count]:6.3f} in engine data '
-                        'file '
-                        f'<{self.get_val(Aircraft.Engine.DATA_FILE).name}>'
-                    )
-
-                # record and count mach numbers
-                curr_mach = mach_num
-                mach_count += 1
+        if not len(mach_numbers):
+            self.mach_max_count = 0
+            self.alt_max_count = 0
+            self.data_max_count = 0
+            self.data_indices = np.zeros((1, 0), dtype=int)
+            return
+
+        # split data into groups with the same Mach number, then split each of those
+        # groups into groups with the same altitude
+        mach_starts = _find_group_starts(mach_numbers, self.mach_tol)
+        alt_starts = [
+            _find_group_starts(alt_group, self.alt_tol) + mach_start
+            for alt_group, mach_start
+            in zip(np.split(altitudes, mach_starts[1:]), mach_starts)]
+        alt_counts = np.array([len(starts) for starts in alt_starts])
+
+        # there must be at least two altitudes for each Mach number (last Mach number
+        # is not checked)
+        for mach_start, alt_count in zip(mach_starts[:-1], alt_counts[:-1]):
+            if alt_count < 2:
+                raise UserWarning(
+                    'Only one altitude provided for Mach number '
+                    f'{mach_numbers[mach_start]:6.3f} in engine data '
+                    'file '
+                    f'<{self.get_val(Aircraft.Engine.DATA_FILE).name}>'
+                )
 
-                # new mach comes with new altitude, record and count it
-                if alt_count > max_alt_count:
-                    max_alt_count = alt_count
-                # new mach means reset altitude counter
-                curr_alt = alt
-                alt_count = 1
-                data_indices = extend_array(data_indices, [mach_count, alt_count])
+        # number of data points for each Mach, alt combination, in order
+        all_alt_starts = np.concatenate(alt_starts)
+        data_counts = np.diff(all_alt_starts, append=len(mach_numbers))
 
-                if data_count > max_data_count:
-                    max_data_count = data_count
-                # new mach means reset data counter
-                data_count = 1
-                # count data associated with new altitude
-                data_indices[mach_count - 1, alt_count - 1] = 1
+        # data_indices stores how many data points there are for a given Mach/alt combo,
+        # following the convention of a single data point being counted as one
+        data_indices = np.zeros((len(mach_starts), alt_counts.max()), dtype=int)
+        mach_idx = np.repeat(np.arange(len(mach_starts)), alt_counts)
+        alt_idx = np.arange(len(all_alt_starts)) - np.repeat(
+            np.cumsum(alt_counts) - alt_counts, alt_counts)
+        data_indices[mach_idx, alt_idx] = np.maximum(data_counts - 1, 1)
 
-        self.mach_max_count = mach_count
-        self.alt_max_count = max_alt_count
-        self.data_max_count = max_data_count
-        self.data_indices = data_indices.astype(int)
+        # The counts for the final Mach and altitude groups are not included in the max
+        # counts, the packed data is sized using only the preceding groups
+        self.mach_max_count = len(mach_starts)
+        self.alt_max_count = int(max([1, *alt_counts[:-1]]))
+        self.data_max_count = int(max([1, *data_counts[:-1]]))
+        self.data_indices = data_indices
 
 
 #####################
@@ -1541,6 +1829,139 @@ def normalize(base_list, maximum=None, minimum=None):
     return norm_list
 
 
+def _find_group_starts(values, tolerance):
+    """
+    Find where groups of values that are equal within tolerance begin. A value belongs
+    to the current group if it is close to the first value in that group, using the same
+    criteria as math.isclose() with an absolute tolerance.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Data to be split into groups, in the order it is stored.
+    tolerance : float
+        Absolute tolerance for two values to be considered equal.
+
+    Returns
+    -------
+    group_starts : numpy.ndarray
+        Indices of values where each group begins.
+    """
+    group_starts = []
+    start = 0
+
+    while start < len(values):
+        group_starts.append(start)
+        remaining = values[start + 1:]
+        # equivalent to math.isclose() with default relative tolerance
+        allowed = np.maximum(
+            1e-09 * np.maximum(abs(values[start]), np.abs(remaining)), tolerance)
+        outside = np.abs(remaining - values[start]) > allowed
+
+        if not outside.any():
+            break
+
+        start += 1 + np.argmax(outside)
+
+    return np.array(group_starts, dtype=int)
+
+
+def _get_structured_grid(independent, dependent):
+    """
+    Reshape data onto a structured grid, if the data is a full tensor-product grid of
+    its independent variables.
+
+    Parameters
+    ----------
+    independent : list of numpy.ndarray
+        Values of each independent variable, with one entry per data point.
+    dependent : dict
+        Values of each dependent variable, with one entry per data point.
+
+    Returns
+    -------
+    structured_data : tuple
+        Tuple of (grid, values). Grid is a list of the unique values of each
+        independent variable, and values is a dict of dependent variables reshaped to
+        the shape of that grid. None if data is not a full tensor-product grid.
+    """
+    grid = [np.unique(val) for val in independent]
+    shape = tuple(len(points) for points in grid)
+
+    if math.prod(shape) != len(independent[0]):
+        return None
+
+    order = np.lexsort(independent[::-1])
+    points = np.array(independent)[:, order]
+    expected_points = np.array([val.ravel()
+                                for val in np.meshgrid(*grid, indexing='ij')])
+
+    if not np.array_equal(points, expected_points):
+        return None
+
+    values = {key: np.asarray(val)[order].reshape(shape)
+              for key, val in dependent.items()}
+
+    return grid, values
+
+
+def _resample_structured_grid(independent, dependent, method):
+    """
+    Resample data onto a structured grid. The grid contains every unique value of each
+    independent variable, unless that grid would be much larger than the original data
+    (e.g. throttle settings that differ at every flight condition). In that case,
+    starting with the last independent variable, variables with more unique values than
+    are present at any single combination of the preceding variables are instead evenly
+    spaced between their minimum and maximum using that many points, until the grid is
+    small enough. Data is interpolated (and extrapolated
+    where needed) onto the grid with a semistructured interpolant, so values at grid
+    points match what a semistructured metamodel of the data would produce.
+
+    Parameters
+    ----------
+    independent : list of numpy.ndarray
+        Values of each independent variable, with one entry per data point.
+    dependent : dict
+        Values of each dependent variable, with one entry per data point.
+    method : str
+        Interpolation method used for resampling.
+
+    Returns
+    -------
+    structured_data : tuple
+        Tuple of (grid, values). Grid is a list of the unique values of each
+        independent variable, and values is a dict of dependent variables on that grid.
+    """
+    grid = [np.unique(val) for val in independent]
+    order = np.lexsort(independent[::-1])
+    semistructured_points = np.array(independent).T[order]
+    num_points = len(semistructured_points)
+
+    # starting with the innermost variable, reduce grid until it is an acceptable size
+    for i in range(len(grid) - 1, 0, -1):
+        if math.prod(len(points) for points in grid) <= \
+                _MAX_RESAMPLE_FACTOR * num_points:
+            break
+        # max number of unique values of this variable for any combination of
+        # preceding variables
+        combinations = np.unique(semistructured_points[:, :i + 1], axis=0)
+        _, counts = np.unique(combinations[:, :i], axis=0, return_counts=True)
+        num_values = max(counts.max(), 2)
+        if len(grid[i]) > num_values:
+            grid[i] = np.linspace(grid[i][0], grid[i][-1], num_values)
+
+    shape = tuple(len(points) for points in grid)
+    points = np.array([val.ravel() for val in np.meshgrid(*grid, indexing='ij')]).T
+
+    values = {}
+    for key, val in dependent.items():
+        interp = InterpNDSemi(semistructured_points, np.asarray(val)[order],
+                              method=method)
+        values[key] = interp.interpolate(points).reshape(shape)
+
+    return grid, values
+
+
 def extend_array(inp_array, size):
     """
     Extends input array such that it is at least as large as the target size in
@@ -44,7 +44,7 @@ class EngineModel(SubsystemBuilderBase):
     ):
         super().__init__(name, meta_data=meta_data)
         if options is not None:
-            self.options = options.deepcopy()
+            self.options = options.deepcopy(lazy=True)
         else:
             self.options = AviaryValues()
 
@@ -189,7 +189,7 @@ class EngineModel(SubsystemBuilderBase):
         """
         Given a new set of AviaryValues, update the engine model and rerun setup.
         """
-        self.options = options.deepcopy()
+        self.options = options.deepcopy(lazy=True)
 
         self._setup(**kwargs)
 
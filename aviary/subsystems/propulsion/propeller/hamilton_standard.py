@@ -1,5 +1,4 @@
 import math
-import warnings
 
 import numpy as np
 import openmdao.api as om
@@ -11,77 +10,106 @@ from aviary.constants import RHO_SEA_LEVEL_ENGLISH
 from aviary.utils.functions import add_aviary_input, add_aviary_output
 
 
-def _unint(xa, ya, x):
+def _interval_coeffs(xa, x, n):
+    """
+    Search and coefficient routine shared by _unint and _biquad.
+    For each x inside its table xa, find the 4 point interval and the coefficients
+    of the variation of 3rd degree interpolation over it.
+
+    xa is either one table shared by all nodes, or holds one table per node (shape
+    (nn, m)), of which only the first n values are used. x has one value per node.
+    Returns the index of the first point of each interval, and the four coefficients.
+    """
+    # idx: the first table value not less than x (on the real part, so that complex
+    # steps follow the same branches)
+    if xa.ndim == 1:
+        idx = np.searchsorted(xa[:n], x.real)
+
+        def take(j):
+            return xa[j]
+    else:
+        nn, m = xa.shape
+        nodes = np.arange(nn)
+        below = xa < x.real[:, np.newaxis]
+        if np.any(n < m):
+            below &= np.arange(m) < n[:, np.newaxis]
+        idx = np.count_nonzero(below, axis=1)
+
+        def take(j):
+            return xa[nodes, j]
+
+    idx = np.minimum(np.maximum(idx, 1), n - 1)
+    # jx1: the first point of four points
+    jx1 = np.maximum(np.minimum(idx - 2, n - 4), 0)
+    # first interval: ra = 1, last interval: ra = 0
+    x_idx = take(idx)
+    ra = (x_idx - x)/(x_idx - take(idx - 1))
+    ra[idx == 1] = 1.0
+    ra[idx == n - 1] = 0.0
+    rb = 1.0 - ra
+
+    x1 = take(jx1)
+    x2 = take(jx1 + 1)
+    x3 = take(jx1 + 2)
+    x4 = take(jx1 + 3)
+    p1 = x2 - x1
+    p2 = x3 - x2
+    p3 = x4 - x3
+    p4 = p1 + p2
+    p5 = p2 + p3
+    d1 = x - x1
+    d2 = x - x2
+    d3 = x - x3
+    d4 = x - x4
+    c1 = ra / p1 * d2 / p4 * d3
+    c2 = -ra / p1 * d1 / p2 * d3 + rb / p2 * d3 / p5 * d4
+    c3 = ra / p2 * d1 / p4 * d2 - rb / p2 * d2 / p3 * d4
+    c4 = rb / p5 * d2 / p3 * d3
+
+    return jx1, (c1, c2, c3, c4)
+
+
+def _unint(xa, ya, x, n=None):
     """
     univariate table routine with seperate arrays for x and y
     This routine interpolates over a 4 point interval using a
     variation of 3nd degree interpolation to produce a continuity
     of slope between adjacent intervals.
-    """
 
-    Lmt = 0
-    n = len(xa)
-    # test for off low end
-    if (xa[0] > x):
-        Lmt = 1  # off low end
-        y = ya[0]
-    elif (xa[0] == x):
-        y = ya[0]  # at low end
+    x is an array of values, one per node. xa and ya are either shared by all nodes
+    or hold one table per node (shape (nn, m)). n is the number of values of each
+    table, len(xa) by default. Returns y and the limit flag Lmt (0: in table,
+    1: off low end, 2: off high end) for each node.
+    """
+    x = np.asarray(x)
+    xa = np.asarray(xa)
+    ya = np.asarray(ya)
+    m = xa.shape[-1]
+    if n is None:
+        n = m
+
+    if xa.ndim == 1 and ya.ndim == 1:
+        def take(y, j):
+            return y[j]
     else:
-        ifnd = 0
-        idx = 0
-        for i in range(1, n):
-            if (xa[i] == x):
-                ifnd = 1  # at a node
-                idx = i
-                break
-            elif (xa[i] > x):
-                ifnd = 2  # between (xa[i-1],xa[i])
-                idx = i
-                break
-        if (ifnd == 0):
-            idx = n
-            Lmt = 2  # off high end
-            y = ya[n-1]
-        elif (ifnd == 1):
-            y = ya[idx]
-        elif (ifnd == 2):
-            # jx1: the first point of four points
-            if (idx == 1):
-                # first interval
-                jx1 = 0
-                ra = 1.0
-            elif (idx == n-1):
-                # last interval
-                jx1 = n - 4
-                ra = 0.0
-            else:
-                jx1 = idx - 2
-                ra = (xa[idx] - x)/(xa[idx] - xa[idx-1])
-            rb = 1.0 - ra
-
-            # get coefficeints and results
-            p1 = xa[jx1+1] - xa[jx1]
-            p2 = xa[jx1+2] - xa[jx1+1]
-            p3 = xa[jx1+3] - xa[jx1+2]
-            p4 = p1 + p2
-            p5 = p2 + p3
-            d1 = x - xa[jx1]
-            d2 = x - xa[jx1+1]
-            d3 = x - xa[jx1+2]
-            d4 = x - xa[jx1+3]
-            c1 = ra / p1 * d2 / p4 * d3
-            c2 = -ra / p1 * d1 / p2 * d3 + rb / p2 * d3 / p5 * d4
-            c3 = ra / p2 * d1 / p4 * d2 - rb / p2 * d2 / p3 * d4
-            c4 = rb / p5 * d2 / p3 * d3
-            y = ya[jx1]*c1 + ya[jx1+1]*c2 + ya[jx1+2]*c3 + ya[jx1+3]*c4
-
-            # we don't want y to be an array
-            try:
-                y = y[0]
-            # floats/ints will give TypeError, numpy versions give IndexError
-            except (TypeError, IndexError):
-                pass
+        nn = x.shape[0]
+        nodes = np.arange(nn)
+        xa = np.broadcast_to(xa, (nn, m))
+        ya = np.broadcast_to(ya[..., :m], (nn, m))
+        n = np.broadcast_to(n, nn)
+
+        def take(y, j):
+            return y[nodes, j]
+
+    jx1, (c1, c2, c3, c4) = _interval_coeffs(xa, x, n)
+    y = (take(ya, jx1)*c1 + take(ya, jx1+1)*c2 + take(ya, jx1+2)*c3
+         + take(ya, jx1+3)*c4)
+
+    # test for off low end, off high end
+    off_low = x.real < take(xa, 0)
+    off_high = ~(x.real <= take(xa, n - 1))
+    y = np.where(off_low, take(ya, 0), np.where(off_high, take(ya, n - 1), y))
+    Lmt = np.where(off_low, 1, np.where(off_high, 2, 0))
 
     return y, Lmt
 
@@ -97,154 +125,55 @@ def _biquad(T, i, xi, yi):
     T(i+1) = number of x values in xi array
     T(i+2) = number of y values in yi array
     T(i+3) = values of x in ascending order
-    """
 
-    lmt = 0
+    xi and yi are arrays of values, one per node. Values off the low end of the
+    table are moved onto it; off the high end of x, z is 0.
+    """
     nx = int(T[i])
     ny = int(T[i+1])
     j1 = int(i + 2)
-    j2 = j1 + nx - 1
-    # search in x sense
-    # jx1 = subscript of 1st x
-    # search routine - input j1, j2, xi
-    #                - output ra_x, rb_x, kx, jx1
-    z = 0.0
-    x = xi
-    kx = 0
-    ifnd_x = 0
-    jn = 0
-    xc = [0, 0, 0, 0]
-    for j in range(j1, j2+1):
-        if (T[j] >= x):
-            ifnd_x = 1
-            jn = j
-            break
-    if (ifnd_x == 0):
-        # off high end
-        x = T[j2]
-        kx = 2
-        # the last 4 points and curve B
-        jx1 = j2 - 3
-        ra_x = 0.0
-    else:
-        # test for -- off low end, first interval, other
-        if (jn < j1+1):
-            if (T[jn] != x):
-                kx = 1
-                x = T[j1]
-        if (jn <= j1+1):
-            jx1 = j1
-            ra_x = 1.0
-        else:
-            # test for last interval
-            if (j == j2):
-                jx1 = j2 - 3
-                ra_x = 0.0
-            else:
-                jx1 = jn - 2
-                ra_x = (T[jn] - x)/(T[jn] - T[jn-1])
-        rb_x = 1. - ra_x
-
-        # return here from search of x
+    j2 = j1 + nx
+    xa = T[j1:j2]
+
+    x = np.asarray(xi)
+    off_low_x = x.real < xa[0]
+    off_high_x = ~(x.real <= xa[-1])
+    x = np.where(off_low_x, xa[0], np.where(off_high_x, xa[-1], x))
+    kx = np.where(off_low_x, 1, 0)
+
+    # get coeff. in x sense
+    jx1, (cx1, cx2, cx3, cx4) = _interval_coeffs(xa, x, nx)
+
+    if (ny == 0):
+        # univariate table
+        za = T[j2:j2+nx]
+        z = cx1*za[jx1] + cx2*za[jx1+1] + cx3*za[jx1+2] + cx4*za[jx1+3]
         lmt = kx
-        jx = jx1
-        # The following code puts x values in xc blocks
-        for j in range(4):
-            xc[j] = T[jx1+j]
-        # get coeff. in x sense
-        # coefficient routine - input x,x1,x2,x3,x4,ra_x,rb_x
-        p1 = xc[1] - xc[0]
-        p2 = xc[2] - xc[1]
-        p3 = xc[3] - xc[2]
-        p4 = p1 + p2
-        p5 = p2 + p3
-        d1 = x - xc[0]
-        d2 = x - xc[1]
-        d3 = x - xc[2]
-        d4 = x - xc[3]
-        cx1 = ra_x/p1*d2/p4*d3
-        cx2 = -ra_x/p1*d1/p2*d3 + rb_x/p2*d3/p5*d4
-        cx3 = ra_x/p2*d1/p4*d2 - rb_x/p2*d2/p3*d4
-        cx4 = rb_x/p5*d2/p3*d3
-        # return to main body
-
-        # return here with coeff. test for univariate or bivariate
-        if (ny == 0):
-            z = 0.0
-            jy = jx + nx
-            z = cx1*T[jy] + cx2*T[jy+1] + cx3*T[jy+2] + cx4*T[jy+3]
-        else:
-            # bivariate table
-            y = yi
-            j3 = j2 + 1
-            j4 = j3 + ny - 1
-            # search in y sense
-            # jy1 = subscript of 1st y
-            # search routine - input j3,j4,y
-            #                - output ra_y,rb_y,ky,,jy1
-            ky = 0
-            ifnd_y = 0
-            for j in range(j3, j4+1):
-                if (T[j] >= y):
-                    ifnd_y = 1
-                    break
-            if (ifnd_y == 0):
-                # off high end
-                y = T[j4]
-                ky = 2
-                # use last 4 points and curve B
-                jy1 = j4 - 3
-                ra_y = 0.0
-            else:
-                # test for off low end, first interval
-                if (j < j3 + 1):
-                    if (T[j] != y):
-                        ky = 1
-                        y = T[j3]
-                if (j <= j3 + 1):
-                    jy1 = j3
-                    ra_y = 1.0
-                else:
-                    # test for last interval
-                    if (j == j4):
-                        jy1 = j4 - 3
-                        ra_y = 0.0
-                    else:
-                        jy1 = j - 2
-                        ra_y = (T[j] - y)/(T[j] - T[j-1])
-            rb_y = 1.0 - ra_y
-
-            lmt = lmt + 3*ky
-            # interpolate in y sense
-            # subscript - base, num. of col., num. of y's
-            jy = (j4 + 1) + (jx - i - 2)*ny + (jy1 - j3)
-            yt = [0, 0, 0, 0]
-            for m in range(4):
-                jx = jy
-                yt[m] = cx1*T[jx] + cx2*T[jx+ny] + cx3*T[jx+2*ny] + cx4*T[jx+3*ny]
-                jy = jy + 1
-
-            # the following code puts y values in yc block
-            yc = [0, 0, 0, 0]
-            for j in range(4):
-                yc[j] = T[jy1]
-                jy1 = jy1 + 1
-            # get coeff. in y sense
-            # coeffient routine - input y, y1, y2, y3, y4, ra_y, rb_y
-            p1 = yc[1] - yc[0]
-            p2 = yc[2] - yc[1]
-            p3 = yc[3] - yc[2]
-            p4 = p1 + p2
-            p5 = p2 + p3
-            d1 = y - yc[0]
-            d2 = y - yc[1]
-            d3 = y - yc[2]
-            d4 = y - yc[3]
-            cy1 = ra_y/p1*d2/p4*d3
-            cy2 = -ra_y/p1*d1/p2*d3 + rb_y/p2*d3/p5*d4
-            cy3 = ra_y/p2*d1/p4*d2 - rb_y/p2*d2/p3*d4
-            cy4 = rb_y/p5*d2/p3*d3
-            z = cy1*yt[0] + cy2*yt[1] + cy3*yt[2] + cy4*yt[3]
+    else:
+        # bivariate table
+        j3 = j2 + ny
+        ya = T[j2:j3]
+        za = T[j3:j3+nx*ny].reshape(nx, ny)
+
+        y = np.asarray(yi)
+        off_low_y = y.real < ya[0]
+        off_high_y = ~(y.real <= ya[-1])
+        y = np.where(off_low_y, ya[0], np.where(off_high_y, ya[-1], y))
+        ky = np.where(off_low_y, 1, np.where(off_high_y, 2, 0))
+        lmt = kx + 3*ky
+
+        # interpolate in y sense
+        jy1, (cy1, cy2, cy3, cy4) = _interval_coeffs(ya, y, ny)
+        yt = [
+            cx1*za[jx1, jy1+m] + cx2*za[jx1+1, jy1+m] + cx3*za[jx1+2, jy1+m]
+            + cx4*za[jx1+3, jy1+m]
+            for m in range(4)
+        ]
+        z = cy1*yt[0] + cy2*yt[1] + cy3*yt[2] + cy4*yt[3]
+
+    # the table is not extrapolated off the high end of x
+    z = np.where(off_high_x, 0.0, z)
+    lmt = np.where(off_high_x, 0, lmt)
 
     return z, lmt
 
@@ -474,6 +403,210 @@ comp_mach_CT_arr = np.array([
 # fmt: on
 
 
+def _unint_lift_coefficients(xa, ya, cl_indices, x):
+    """
+    Look up each x in the tables xa[kl], ya[kl] of every lift coefficient index kl
+    in cl_indices. Values of x off the low end of a table are moved onto it.
+    Returns an array of shape (len(x), len(cl_indices)).
+    """
+    kl = np.tile(cl_indices, len(x))
+    x = np.repeat(x, len(cl_indices))
+    x = np.where(x.real < xa[kl, 0], xa[kl, 0], x)
+    # the thrust tables hold one value less than the longest power tables
+    n = np.minimum(cli_arr_len[kl], xa.shape[1])
+    y, run_flag = _unint(xa[kl], ya[kl], x, n)
+
+    return y.reshape(-1, len(cl_indices))
+
+
+def _interp_lift_coefficient(cli, cl_indices, values):
+    """
+    Interpolate values given at the lift coefficients CL_arr[cl_indices] (shape
+    (nn, len(cl_indices))) to the integrated lift coefficient cli.
+    """
+    if len(cl_indices) == 1:
+        # cli falls on a node point of CL_arr
+        return values[:, 0]
+
+    y, run_flag = _unint(CL_arr[cl_indices], values, np.full(len(values), cli))
+
+    return y
+
+
+def _hamilton_standard(
+    power_coefficient, advance_ratio, mach, tip_mach, act_factor, cli, num_blades,
+    verbosity=Verbosity.BRIEF, report=True,
+):
+    """
+    Compute the thrust coefficient and the propeller tip compressibility loss factor
+    of all nodes at once.
+
+    Inputs may be complex. Every table search and branch follows their real parts,
+    so the outputs can be complex-stepped. Messages are only printed if report is
+    True.
+    """
+    nn = len(advance_ratio)
+    dtype = np.result_type(power_coefficient, advance_ratio, mach, tip_mach,
+                           act_factor, cli)
+    J = advance_ratio
+
+    # AFCP: an AF adjustment of CP to be assigned
+    # AFCT: an AF adjustment of CT to be assigned
+    AF_adj_CP = np.zeros(7, dtype=dtype)
+    AF_adj_CT = np.zeros(7, dtype=dtype)
+    for k in range(2):
+        AF_adj_CP[k] = _unint(Act_Factor_arr, AFCPC[k], [act_factor])[0][0]
+        AF_adj_CT[k] = _unint(Act_Factor_arr, AFCTC[k], [act_factor])[0][0]
+    AF_adj_CP[2:] = AF_adj_CP[1]
+    AF_adj_CT[2:] = AF_adj_CT[1]
+    AFCTE = np.where(J.real <= 0.5,
+                     2.*J*(AF_adj_CT[1] - AF_adj_CT[0]) + AF_adj_CT[0],
+                     AF_adj_CT[1])
+
+    # bounding J (advance ratio) for setting up interpolation: J_begin is 0 for
+    # J <= 1.0, 1 for J <= 1.5, 2 for J <= 2.0 and 3 above, and J_end = J_begin + 3
+    J_begin = np.searchsorted([1.0, 1.5, 2.0], J.real)
+    J_idx = J_begin[:, np.newaxis] + np.arange(4)
+
+    # lift coefficient table indices (NCLT to NCLTT) used for interpolation
+    on_node = np.abs(cli.real - CL_arr) <= 0.0009
+    if np.any(on_node):
+        # given lift coeff (cli) falls on a node point of CL_arr
+        cl_indices = [int(np.argmax(on_node))]
+    elif cli.real <= 0.6:
+        cl_indices = [0, 1, 2, 3]
+    elif cli.real <= 0.7:
+        cl_indices = [1, 2, 3, 4]
+    else:
+        cl_indices = [2, 3, 4, 5]
+
+    if num_blades % 2 == 0:
+        # even number of blades: idx_blade = 0 if 2 blades;
+        #                        idx_blade = 1 if 4 blades;
+        #                        idx_blade = 2 if 6 blades;
+        #                        idx_blade = 3 if 8 blades.
+        # No interpolation needed
+        blade_indices = [num_blades // 2 - 1]
+    else:
+        # odd number of blades. So, interpolation done using the 4 sets of even
+        # number of blades
+        blade_indices = [0, 1, 2, 3]
+    nbb = len(blade_indices)
+
+    # Mach number in excess of the critical one, for each lift coefficient
+    ZMCRT = np.stack([_unint(advance_ratio_array2, mach_corr_table[kl], J)[0]
+                      for kl in cl_indices], axis=1)
+    DMN = np.where(J.real[:, np.newaxis] != 0.0, mach[:, np.newaxis] - ZMCRT,
+                   tip_mach[:, np.newaxis] - mach_tip_corr_arr[cl_indices])
+
+    TFCLII, run_flag = _unint(advance_ratio_array, TF_CLI_arr, J)
+
+    # Every (number of blades, node) pair is computed as a separate case, and every
+    # case at the four advance ratios kdx = J_begin, ..., J_end of its node
+    case_blade = np.repeat(blade_indices, nn)
+    case_node = np.tile(np.arange(nn), nbb)
+    point_case = np.repeat(np.arange(nbb * nn), 4)
+    point_blade = case_blade[point_case]
+    kdx = J_idx[case_node].ravel()
+
+    CP_Eff = power_coefficient[case_node[point_case]]*AF_adj_CP[kdx]
+    # PBL = number of blades correction for power_coefficient
+    PBL, run_flag = _unint(CPEC, BL_P_corr_table[point_blade], CP_Eff)
+    CPE1 = CP_Eff*PBL*PF_CLI_arr[kdx]
+    PXCLI = _unint_lift_coefficients(CP_CLi_table, XPCLI, cl_indices, CPE1)
+    if report:
+        for j, kl in enumerate(cl_indices):
+            if kl < 4:
+                continue
+            for i in np.flatnonzero(CPE1.real < 0.010):
+                print(
+                    f"Extrapolated data is being used for CLI={CL_arr[kl-1]:.1f}"
+                    f"--CPE1,PXCLI,L= , {CPE1[i]},{PXCLI[i, j]},{point_blade[i]}   "
+                    "Suggest inputting CLI=.5")
+    # PCLI = CLI adjustment to power_coefficient
+    PCLI = _interp_lift_coefficient(cli, cl_indices, PXCLI)
+    CP_Eff = CP_Eff*PCLI  # the effective CP at baseline point for kdx
+
+    ang_len = ang_arr_len[kdx]
+    # blade angle at baseline point for kdx
+    BLL, run_flag = _unint(
+        CP_Angle_table[point_blade, kdx], Blade_angle_table[kdx], CP_Eff, ang_len)
+    # thrust coeff at baseline point for kdx
+    CTT, run_flag = _unint(
+        Blade_angle_table[kdx], CT_Angle_table[point_blade, kdx], BLL, ang_len)
+    if report and verbosity >= Verbosity.DEBUG and np.any(run_flag > 1):
+        print(f"ERROR IN PROP. PERF.-- NERPT=2, run_flag={np.max(run_flag)}")
+
+    CT_base, run_flag = _unint(
+        advance_ratio_array[J_idx[case_node]], CTT.reshape(-1, 4), J[case_node])
+
+    # make extra correction. CTG is an "error" function, and the iteration (loop
+    # counter = "IL") tries to drive CTG/CT to 0 for each case
+    # ERR_CT = CTG1[il]/CT_base, where CTG1 = CT_Eff - CT_base.
+    CTG = np.zeros((11, nbb * nn), dtype=dtype)
+    CTG1 = np.zeros((10, nbb * nn), dtype=dtype)
+    CTG[0] = .100
+    CTG[1] = .200
+    CTTT = np.zeros(nbb * nn, dtype=dtype)
+    XXXFT = np.ones(nbb * nn, dtype=dtype)
+    # the cases still iterating
+    active = np.arange(nbb * nn)
+    for il in range(10):
+        nodes = case_node[active]
+        CT_Eff = CTG[il, active]*AFCTE[nodes]
+        # TBL = number of blades correction for thrust_coefficient
+        TBL, run_flag = _unint(CTEC, BL_T_corr_table[case_blade[active]], CT_Eff)
+        CTE1 = CT_Eff*TBL*TFCLII[nodes]
+        TXCLI = _unint_lift_coefficients(CT_CLi_table, XTCLI, cl_indices, CTE1)
+        # compressibility tip loss factor
+        dmn = DMN[nodes]
+        CTE2 = CT_Eff[:, np.newaxis]*TXCLI*TBL[:, np.newaxis]
+        XFFT, run_flag = _biquad(comp_mach_CT_arr, 1, dmn.ravel(), CTE2.ravel())
+        XFFT = np.where(dmn.real > 0.0, XFFT.reshape(dmn.shape), 1.0)
+        TCLII = _interp_lift_coefficient(cli, cl_indices, TXCLI)
+        xft = _interp_lift_coefficient(cli, cl_indices, XFFT)
+
+        CT_Eff = CTG[il, active]*AFCTE[nodes]*TCLII
+        CTG1[il, active] = CT_Eff - CT_base[active]
+
+        converged = np.abs((CTG1[il, active]/CT_base[active]).real) < 0.001
+        done = active[converged]
+        CTTT[done] = CTG[il, done]
+        XXXFT[done] = xft[converged]
+        active = active[~converged]
+        xft = xft[~converged]
+
+        if il > 0:
+            CTG[il+1, active] = -CTG1[il-1, active] * \
+                (CTG[il, active] - CTG[il-1, active]) / \
+                (CTG1[il, active] - CTG1[il-1, active]) + CTG[il-1, active]
+            # no positive thrust coefficient matches
+            stalled = CTG[il+1, active].real <= 0
+            done = active[stalled]
+            CTTT[done] = 0.0
+            XXXFT[done] = xft[stalled]
+            active = active[~stalled]
+
+        if active.size == 0:
+            break
+
+    if active.size > 0:
+        raise ValueError(
+            "Integrated design cl adjustment not working properly for ct "
+            f"definition (ibb={active[0] // nn})"
+        )
+
+    if nbb == 1:
+        return CTTT, XXXFT
+
+    # interpolation by the number of blades if odd number
+    num_blades = np.full(nn, float(num_blades))
+    ct, run_flag = _unint(num_blades_arr, CTTT.reshape(nbb, nn).T, num_blades)
+    xft, run_flag = _unint(num_blades_arr, XXXFT.reshape(nbb, nn).T, num_blades)
+
+    return ct, xft
+
+
 class PreHamiltonStandard(om.ExplicitComponent):
     """
     Pre-process parameters needed by HamiltonStandard component
@@ -634,12 +767,72 @@ class HamiltonStandard(om.ExplicitComponent):
         # propeller tip compressibility loss factor
         self.add_output('comp_tip_loss_factor', val=np.zeros(nn), units='unitless')
 
-        self.declare_partials('*', '*', method='fd', form='forward')
+    def setup_partials(self):
+        arange = np.arange(self.options['num_nodes'])
+
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            [
+                'power_coefficient',
+                'advance_ratio',
+                Dynamic.Mission.MACH,
+                'tip_mach',
+            ],
+            rows=arange,
+            cols=arange,
+        )
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            [
+                Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR,
+                Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT,
+            ],
+        )
 
     def compute(self, inputs, outputs):
+        ct, xft = self._compute_coefficients(inputs)
+
+        outputs['thrust_coefficient'] = ct
+        outputs['comp_tip_loss_factor'] = xft
+
+    def compute_partials(self, inputs, partials):
+        nn = self.options['num_nodes']
+        step = 1e-30
+        values = {name: inputs[name].real for name in inputs}
+
+        # The table lookups are complex-step safe, and every node only depends on its
+        # own inputs, so the partials with respect to the four inputs given at each
+        # node are complex-stepped at once, each one on its own copy of the nodes
+        node_inputs = [
+            'power_coefficient', 'advance_ratio', Dynamic.Mission.MACH, 'tip_mach']
+        perturbed = dict(values)
+        for i, name in enumerate(node_inputs):
+            val = np.tile(values[name], len(node_inputs)).astype(complex)
+            val[i*nn:(i+1)*nn] += step * 1j
+            perturbed[name] = val
+
+        ct, xft = self._compute_coefficients(perturbed, report=False)
+        for i, name in enumerate(node_inputs):
+            partials['thrust_coefficient', name] = ct[i*nn:(i+1)*nn].imag / step
+            partials['comp_tip_loss_factor', name] = xft[i*nn:(i+1)*nn].imag / step
+
+        for name in [
+            Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR,
+            Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT,
+        ]:
+            perturbed = dict(values)
+            perturbed[name] = values[name] + step * 1j
+            ct, xft = self._compute_coefficients(perturbed, report=False)
+
+            partials['thrust_coefficient', name] = ct.imag / step
+            partials['comp_tip_loss_factor', name] = xft.imag / step
+
+    def _compute_coefficients(self, inputs, report=True):
+        """
+        Return the thrust coefficient and the propeller tip compressibility loss
+        factor of all nodes.
+        """
         verbosity = self.options['aviary_options'].get_val(Settings.VERBOSITY)
-        act_factor = inputs[Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR][0]
-        cli = inputs[Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT][0]
         num_blades = self.options['aviary_options'].get_val(
             Aircraft.Engine.NUM_PROPELLER_BLADES
         )
@@ -653,245 +846,17 @@ class HamiltonStandard(om.ExplicitComponent):
         else:
             num_blades = int(num_blades[0])
 
-        for i_node in range(self.options['num_nodes']):
-            ichck = 0
-            run_flag = 0
-            xft = 1.0
-            AF_adj_CP = np.zeros(7)  # AFCP: an AF adjustment of CP to be assigned
-            AF_adj_CT = np.zeros(7)  # AFCT: an AF adjustment of CT to be assigned
-            CTT = np.zeros(7)
-            BLL = np.zeros(7)
-            BLLL = np.zeros(7)
-            PXCLI = np.zeros(7)
-            XFFT = np.zeros(6)
-            CTG = np.zeros(11)
-            CTG1 = np.zeros(11)
-            TXCLI = np.zeros(6)
-            CTTT = np.zeros(4)
-            XXXFT = np.zeros(4)
-
-            for k in range(2):
-                AF_adj_CP[k], run_flag = _unint(Act_Factor_arr, AFCPC[k], act_factor)
-                AF_adj_CT[k], run_flag = _unint(Act_Factor_arr, AFCTC[k], act_factor)
-            for k in range(2, 7):
-                AF_adj_CP[k] = AF_adj_CP[1]
-                AF_adj_CT[k] = AF_adj_CT[1]
-            if (inputs['advance_ratio'][i_node] <= 0.5):
-                AFCTE = 2.*inputs['advance_ratio'][i_node] * \
-                    (AF_adj_CT[1] - AF_adj_CT[0]) + AF_adj_CT[0]
-            else:
-                AFCTE = AF_adj_CT[1]
-
-            # bounding J (advance ratio) for setting up interpolation
-            if (inputs['advance_ratio'][i_node] <= 1.0):
-                J_begin = 0
-                J_end = 3
-            elif (inputs['advance_ratio'][i_node] <= 1.5):
-                J_begin = 1
-                J_end = 4
-            elif (inputs['advance_ratio'][i_node] <= 2.0):
-                J_begin = 2
-                J_end = 5
-            else:
-                J_begin = 3
-                J_end = 6
-
-            CL_tab_idx_begin = 0  # NCLT
-            CL_tab_idx_end = 0  # NCLTT
-            # flag that given lift coeff (cli) does not fall on a node point of CL_arr
-            CL_tab_idx_flg = 0  # NCL_flg
-            ifnd = 0
-
-            power_coefficient = inputs['power_coefficient'][i_node]
-            for ii in range(6):
-                cl_idx = ii
-                if (abs(cli - CL_arr[ii]) <= 0.0009):
-                    ifnd = 1
-                    break
-            if (ifnd == 0):
-                if (cli <= 0.6):
-                    CL_tab_idx_begin = 0
-                    CL_tab_idx_end = 3
-                elif (cli <= 0.7):
-                    CL_tab_idx_begin = 1
-                    CL_tab_idx_end = 4
-                else:
-                    CL_tab_idx_begin = 2
-                    CL_tab_idx_end = 5
-            else:
-                CL_tab_idx_begin = cl_idx
-                CL_tab_idx_end = cl_idx
-                # flag that given lift coeff (cli) falls on a node point of CL_arr
-                CL_tab_idx_flg = 1
-
-            lmod = (num_blades % 2) + 1
-            if (lmod == 1):
-                nbb = 1
-                idx_blade = int(num_blades / 2)
-                # even number of blades idx_blade = 1 if 2 blades;
-                #                       idx_blade = 2 if 4 blades;
-                #                       idx_blade = 3 if 6 blades;
-                #                       idx_blade = 4 if 8 blades.
-                idx_blade = idx_blade - 1
-            else:
-                nbb = 4
-                # odd number of blades
-                idx_blade = 0  # start from first blade
-
-            for ibb in range(nbb):
-                # nbb = 1 even number of blades. No interpolation needed
-                # nbb = 4 odd number of blades. So, interpolation done
-                #       using 4 sets of even J (advance ratio) interpolation
-                for kdx in range(J_begin, J_end+1):
-                    CP_Eff = power_coefficient*AF_adj_CP[kdx]
-                    PBL, run_flag = _unint(CPEC, BL_P_corr_table[idx_blade], CP_Eff)
-                    # PBL = number of blades correction for power_coefficient
-                    CPE1 = CP_Eff*PBL*PF_CLI_arr[kdx]
-                    CL_tab_idx = CL_tab_idx_begin
-                    for kl in range(CL_tab_idx_begin, CL_tab_idx_end+1):
-                        CPE1X = CPE1
-                        if (CPE1 < CP_CLi_table[CL_tab_idx][0]):
-                            CPE1X = CP_CLi_table[CL_tab_idx][0]
-                        cli_len = cli_arr_len[CL_tab_idx]
-                        PXCLI[kl], run_flag = _unint(
-                            CP_CLi_table[CL_tab_idx][:cli_len], XPCLI[CL_tab_idx], CPE1X)
-                        if (run_flag == 1):
-                            ichck = ichck + 1
-                        if verbosity >= Verbosity.DEBUG or ichck <= 1:
-                            if (run_flag == 1):
-                                warnings.warn(
-                                    f"Mach,VTMACH,J,power_coefficient,CP_Eff =: {inputs[Dynamic.Mission.MACH][i_node]},{inputs['tip_mach'][i_node]},{inputs['advance_ratio'][i_node]},{power_coefficient},{CP_Eff}")
-                            if (kl == 4 and CPE1 < 0.010):
-                                print(
-                                    f"Extrapolated data is being used for CLI=.6--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5")
-                            if (kl == 5 and CPE1 < 0.010):
-                                print(
-                                    f"Extrapolated data is being used for CLI=.7--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5")
-                            if (kl == 6 and CPE1 < 0.010):
-                                print(
-                                    f"Extrapolated data is being used for CLI=.8--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5")
-                        NERPT = 1
-                        CL_tab_idx = CL_tab_idx+1
-                    if (CL_tab_idx_flg != 1):
-                        PCLI, run_flag = _unint(
-                            CL_arr[CL_tab_idx_begin:CL_tab_idx_begin+4], PXCLI[CL_tab_idx_begin:CL_tab_idx_begin+4], inputs[Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT][0])
-                    else:
-                        PCLI = PXCLI[CL_tab_idx_begin]
-                        # PCLI = CLI adjustment to power_coefficient
-                    CP_Eff = CP_Eff*PCLI  # the effective CP at baseline point for kdx
-                    ang_len = ang_arr_len[kdx]
-                    BLL[kdx], run_flag = _unint(
-                        # blade angle at baseline point for kdx
-                        CP_Angle_table[idx_blade][kdx][:ang_len],
-                        Blade_angle_table[kdx],
-                        CP_Eff,
-                    )
-                    try:
-                        CTT[kdx], run_flag = _unint(
-                            # thrust coeff at baseline point for kdx
-                            Blade_angle_table[kdx][:ang_len], CT_Angle_table[idx_blade][kdx][:ang_len], BLL[kdx])
-                    except IndexError:
-                        raise om.AnalysisError(
-                            "interp failed for CTT (thrust coefficient) in hamilton_standard.py")
-                    if run_flag > 1:
-                        NERPT = 2
-                        if verbosity >= Verbosity.DEBUG:
-                            print(
-                                f"ERROR IN PROP. PERF.-- NERPT={NERPT}, run_flag={run_flag}")
-
-                BLLL[ibb], run_flag = _unint(
-                    advance_ratio_array[J_begin:J_begin+4], BLL[J_begin:J_begin+4], inputs['advance_ratio'][i_node])
-                ang_blade = BLLL[ibb]
-                CTTT[ibb], run_flag = _unint(
-                    advance_ratio_array[J_begin:J_begin+4], CTT[J_begin:J_begin+4], inputs['advance_ratio'][i_node])
-
-                # make extra correction. CTG is an "error" function, and the iteration (loop counter = "IL") tries to drive CTG/CT to 0
-                # ERR_CT = CTG1[il]/CTTT[ibb], where CTG1 =CT_Eff - CTTT(IBB).
-                CTG[0] = .100
-                CTG[1] = .200
-                TFCLII, run_flag = _unint(
-                    advance_ratio_array, TF_CLI_arr, inputs['advance_ratio'][i_node])
-                NCTG = 10
-                ifnd1 = 0
-                ifnd2 = 0
-                for il in range(NCTG):
-                    ct = CTG[il]
-                    CT_Eff = CTG[il]*AFCTE
-                    TBL, run_flag = _unint(CTEC, BL_T_corr_table[idx_blade], CT_Eff)
-                    # TBL = number of blades correction for thrust_coefficient
-                    CTE1 = CT_Eff*TBL*TFCLII
-                    CL_tab_idx = CL_tab_idx_begin
-                    for kl in range(CL_tab_idx_begin, CL_tab_idx_end+1):
-                        CTE1X = CTE1
-                        if (CTE1 < CT_CLi_table[CL_tab_idx][0]):
-                            CTE1X = CT_CLi_table[CL_tab_idx][0]
-                        cli_len = cli_arr_len[CL_tab_idx]
-                        TXCLI[kl], run_flag = _unint(
-                            CT_CLi_table[CL_tab_idx][:cli_len], XTCLI[CL_tab_idx][:cli_len], CTE1X)
-                        NERPT = 5
-                        if (run_flag == 1):
-                            # off lower bound only.
-                            if verbosity >= Verbosity.DEBUG:
-                                print(
-                                    f"ERROR IN PROP. PERF.-- NERPT={NERPT}, run_flag={run_flag}, il = {il}, kl = {kl}")
-                        if (inputs['advance_ratio'][i_node] != 0.0):
-                            ZMCRT, run_flag = _unint(
-                                advance_ratio_array2, mach_corr_table[CL_tab_idx], inputs['advance_ratio'][i_node])
-                            DMN = inputs[Dynamic.Mission.MACH][i_node] - ZMCRT
-                        else:
-                            ZMCRT = mach_tip_corr_arr[CL_tab_idx]
-                            DMN = inputs['tip_mach'][i_node] - ZMCRT
-                        XFFT[kl] = 1.0  # compressibility tip loss factor
-                        if (DMN > 0.0):
-                            CTE2 = CT_Eff*TXCLI[kl]*TBL
-                            XFFT[kl], run_flag = _biquad(comp_mach_CT_arr, 1, DMN, CTE2)
-                        CL_tab_idx = CL_tab_idx + 1
-                    if (CL_tab_idx_flg != 1):
-                        cli = inputs[Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT][0]
-                        TCLII, run_flag = _unint(
-                            CL_arr[CL_tab_idx_begin:CL_tab_idx_begin+4], TXCLI[CL_tab_idx_begin:CL_tab_idx_begin+4], cli)
-                        xft, run_flag = _unint(
-                            CL_arr[CL_tab_idx_begin:CL_tab_idx_begin+4], XFFT[CL_tab_idx_begin:CL_tab_idx_begin+4], cli)
-                    else:
-                        TCLII = TXCLI[CL_tab_idx_begin]
-                        xft = XFFT[CL_tab_idx_begin]
-                    ct = CTG[il]
-                    CT_Eff = CTG[il]*AFCTE*TCLII
-                    CTG1[il] = CT_Eff - CTTT[ibb]
-                    if (abs(CTG1[il]/CTTT[ibb]) < 0.001):
-                        ifnd1 = 1
-                        break
-                    if (il > 0):
-                        CTG[il+1] = -CTG1[il-1] * \
-                            (CTG[il] - CTG[il-1])/(CTG1[il] - CTG1[il-1]) + CTG[il-1]
-                        if (CTG[il+1] <= 0):
-                            ifnd2 = 1
-                            break
-
-                if (ifnd1 == 0 and ifnd2 == 0):
-                    raise ValueError(
-                        "Integrated design cl adjustment not working properly for ct "
-                        f"definition (ibb={ibb})"
-                    )
-                if (ifnd1 == 0 and ifnd2 == 1):
-                    ct = 0.0
-                CTTT[ibb] = ct
-                XXXFT[ibb] = xft
-                idx_blade = idx_blade + 1
-
-            if (nbb != 1):
-                # interpolation by the number of blades if odd number
-                ang_blade, run_flag = _unint(
-                    num_blades_arr, BLLL[:4], num_blades)
-                ct, run_flag = _unint(num_blades_arr, CTTT, num_blades)
-                xft, run_flag = _unint(num_blades_arr, XXXFT, num_blades)
-
-            # NOTE this could be handled via the metamodel comps (extrapolate flag)
-            if verbosity >= Verbosity.DEBUG and ichck > 0:
-                print(f"  table look-up error = {ichck} (if you go outside the tables.)")
-
-            outputs['thrust_coefficient'][i_node] = ct
-            outputs['comp_tip_loss_factor'][i_node] = xft
+        return _hamilton_standard(
+            inputs['power_coefficient'],
+            inputs['advance_ratio'],
+            inputs[Dynamic.Mission.MACH],
+            inputs['tip_mach'],
+            inputs[Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR][0],
+            inputs[Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT][0],
+            num_blades,
+            verbosity=verbosity,
+            report=report,
+        )
 
 
 class PostHamiltonStandard(om.ExplicitComponent):
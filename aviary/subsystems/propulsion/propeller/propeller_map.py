@@ -64,10 +64,14 @@ class PropellerMap(om.ExplicitComponent):
             val, units = raw_data.get_item(key)
             if key in aliases:
                 # Convert data to expected units. Required so settings like tolerances
-                # that assume units work as expected
+                # that assume units work as expected. Data already in those units is not
+                # copied, so data memory-mapped from a columnar file stays shared
                 try:
-                    val = np.array([convert_units(i, units, default_propeller_units[key])
-                                   for i in val])
+                    if units == default_propeller_units[key]:
+                        val = np.asarray(val)
+                    else:
+                        val = np.array(convert_units(np.asarray(val), units,
+                                                     default_propeller_units[key]))
                 except TypeError:
                     raise TypeError(f"{message}: units of '{units}' provided for "
                                     f'<{key.name}> are not compatible with expected units '
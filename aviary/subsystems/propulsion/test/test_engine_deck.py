@@ -1,15 +1,27 @@
 import csv
+import math
 import unittest
 from pathlib import Path
 
-from openmdao.utils.assert_utils import assert_near_equal
+import numpy as np
+import openmdao.api as om
 
-from aviary.subsystems.propulsion.engine_deck import EngineDeck
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.subsystems.propulsion.engine_deck import EngineDeck, extend_array
 from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
+from aviary.subsystems.propulsion.utils import (SharedMetaModelSemiStructuredComp,
+                                                SharedMetaModelStructuredComp)
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 from aviary.validation_cases.validation_data.flops_data.FLOPS_Test_Data import \
     FLOPS_Test_Data
 from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.preprocessors import preprocess_propulsion
+from aviary.variable_info.variable_meta_data import _MetaData
+from aviary.variable_info.variables import Aircraft, Dynamic
 
 
 class EngineDeckTest(unittest.TestCase):
@@ -132,6 +144,437 @@ class EngineDeckTest(unittest.TestCase):
         assert_near_equal(thrust, expected_thrust, tolerance=tol)
         assert_near_equal(fuel_flow_rate, expected_fuel_flow_rate, tolerance=tol)
 
+    def test_flight_idle_hybrid(self):
+        options = AviaryValues()
+        options.set_val(Aircraft.Engine.DATA_FILE, 'models/engines/turbofan_24k_1.deck')
+
+        base_model = EngineDeck('engine', options)
+        base_data = base_model.data
+
+        # build hybrid deck by sweeping hybrid throttle at each data point
+        hybrid_throttle = np.array([0., 0.5, 1.])
+        data_input = NamedValues()
+        data_input.set_val('mach', np.repeat(base_data[keys.MACH], 3), 'unitless')
+        data_input.set_val('altitude', np.repeat(base_data[keys.ALTITUDE], 3), 'ft')
+        data_input.set_val('throttle', np.repeat(base_data[keys.THROTTLE], 3),
+                           'unitless')
+        data_input.set_val('hybrid_throttle',
+                           np.tile(hybrid_throttle, base_model.model_length),
+                           'unitless')
+        data_input.set_val('thrust', np.repeat(base_data[keys.THRUST], 3) *
+                           np.tile(1 + 0.1 * hybrid_throttle, base_model.model_length),
+                           'lbf')
+        data_input.set_val('fuel_flow', np.repeat(base_data[keys.FUEL_FLOW], 3),
+                           'lbm/h')
+
+        options.set_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE, True)
+        model = EngineDeck('engine', options, data_input)
+        idle_points = model.idle_points
+        self.assertTrue(model.use_hybrid_throttle)
+
+        # hybrid decks get a sweep of three hybrid throttle points per flight condition,
+        # with identical performance data
+        num_points = len(idle_points[keys.MACH])
+        self.assertEqual(num_points % 3, 0)
+        assert_near_equal(idle_points[keys.HYBRID_THROTTLE],
+                          np.tile([-1e-4, 0., 1e-4], num_points // 3), tolerance=1e-12)
+        for key in (keys.MACH, keys.ALTITUDE, keys.THROTTLE, keys.THRUST,
+                    keys.FUEL_FLOW):
+            sweeps = idle_points[key].reshape(-1, 3)
+            np.testing.assert_array_equal(sweeps, sweeps[:, [0, 0, 0]])
+
+        # idle thrust is zero, idle fuel flow is within min/max fraction bounds
+        np.testing.assert_array_equal(idle_points[keys.THRUST], 0.)
+        np.testing.assert_array_equal(idle_points[keys.THROTTLE], -0.1)
+        self.assertTrue(np.all(idle_points[keys.FUEL_FLOW] >= 0.))
+
+    def test_count_and_pack_data(self):
+        # compare vectorized data counting and packing with reference loop-based
+        # implementation for all engine decks included with Aviary
+        for data_file in sorted(get_path('models/engines').glob('*.deck')):
+            with self.subTest(data_file=data_file.name):
+                options = AviaryValues()
+                options.set_val(Aircraft.Engine.DATA_FILE, data_file)
+                options.set_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE, True)
+
+                model = EngineDeck('engine', options)
+
+                expected_counts = _count_data_reference(model)
+                expected_packed_data = _pack_data_reference(model, *expected_counts)
+
+                self.assertEqual(model.mach_max_count, expected_counts[0])
+                self.assertEqual(model.alt_max_count, expected_counts[1])
+                self.assertEqual(model.data_max_count, expected_counts[2])
+                np.testing.assert_array_equal(model.data_indices, expected_counts[3])
+                for key in model.data:
+                    np.testing.assert_array_equal(model.packed_data[key],
+                                                  expected_packed_data[key])
+
+
+    def test_shared_interpolants(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs'].deepcopy()
+        test_points = [(0., 0., 1.), (0.4, 10000., 0.6), (0.8, 35000., 0.8)]
+
+        results = []
+        for share_interpolants in (True, False):
+            engine = build_engine_deck(aviary_values)[0]
+            engine.share_interpolants = share_interpolants
+            preprocess_propulsion(aviary_values, [engine])
+
+            prob = om.Problem()
+            # one mission instance per "phase", each with a different num_nodes
+            for num_nodes in (1, 2, 3):
+                points = test_points[:num_nodes]
+                ivc = om.IndepVarComp()
+                ivc.add_output(Dynamic.Mission.MACH,
+                               np.array([p[0] for p in points]), units='unitless')
+                ivc.add_output(Dynamic.Mission.ALTITUDE,
+                               np.array([p[1] for p in points]), units='ft')
+                ivc.add_output(Dynamic.Mission.THROTTLE,
+                               np.array([p[2] for p in points]), units='unitless')
+
+                phase = prob.model.add_subsystem(f'phase_{num_nodes}', om.Group())
+                phase.add_subsystem('ivc', ivc, promotes=['*'])
+                phase.add_subsystem('engine',
+                                    engine.build_mission(num_nodes, aviary_values),
+                                    promotes=['*'])
+
+            prob.setup()
+            prob.run_model()
+
+            interps = [prob.model._get_subsystem(f'phase_{num_nodes}.engine.'
+                                                 'interpolation').interps
+                       for num_nodes in (1, 2, 3)]
+            for name in interps[0]:
+                shared = interps[0][name] is interps[1][name] is interps[2][name]
+                self.assertEqual(shared, share_interpolants)
+
+            results.append([prob.get_val(f'phase_{num_nodes}.{var}')
+                            for num_nodes in (1, 2, 3)
+                            for var in (Dynamic.Mission.THRUST,
+                                        Dynamic.Mission.THRUST_MAX,
+                                        Dynamic.Mission.FUEL_FLOW_RATE_NEGATIVE)])
+
+        for shared, unshared in zip(*results):
+            assert_near_equal(shared, unshared, 1e-12)
+
+    def test_max_thrust_table(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs'].deepcopy()
+        engine = build_engine_deck(aviary_values)[0]
+        preprocess_propulsion(aviary_values, [engine])
+
+        # evaluate at every flight condition in the data, at max throttle
+        mach_idx, alt_idx = np.nonzero(engine.data_indices)
+        machs = engine.packed_data[keys.MACH][mach_idx, alt_idx, 0]
+        alts = engine.packed_data[keys.ALTITUDE][mach_idx, alt_idx, 0]
+        num_nodes = len(machs)
+
+        prob = om.Problem()
+        ivc = prob.model.add_subsystem('ivc', om.IndepVarComp(), promotes=['*'])
+        ivc.add_output(Dynamic.Mission.MACH, machs, units='unitless')
+        ivc.add_output(Dynamic.Mission.ALTITUDE, alts, units='ft')
+        ivc.add_output(Dynamic.Mission.THROTTLE, np.ones(num_nodes), units='unitless')
+        prob.model.add_subsystem('engine',
+                                 engine.build_mission(num_nodes, aviary_values),
+                                 promotes=['*'])
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        # max thrust is interpolated from a pre-solved (Mach, altitude) table
+        max_interp = prob.model._get_subsystem('engine.max_interpolation')
+        self.assertEqual(max_interp.pnames,
+                         [Dynamic.Mission.MACH, Dynamic.Mission.ALTITUDE])
+
+        assert_near_equal(prob.get_val(Dynamic.Mission.THRUST_MAX, 'lbf'),
+                          prob.get_val(Dynamic.Mission.THRUST, 'lbf'), 1e-12)
+        assert_near_equal(prob.get_val('throttle_max'), np.ones(num_nodes), 1e-12)
+
+        partial_data = prob.check_partials(out_stream=None, method='cs',
+                                           includes='*max_interpolation*')
+        assert_check_partials(partial_data, atol=1e-8, rtol=1e-8)
+
+
+def _count_data_reference(model):
+    """
+    Loop-based implementation of EngineDeck._count_data(), used as a reference for the
+    vectorized version.
+    """
+    mach_count = 0
+    alt_count = 1
+    max_alt_count = 0
+    data_count = 1
+    max_data_count = 0
+    data_indices = np.array([[]])
+    curr_mach = curr_alt = np.inf
+
+    mach_numbers = model.data[keys.MACH]
+    altitudes = model.data[keys.ALTITUDE]
+
+    for idx in range(len(mach_numbers)):
+        mach_num = mach_numbers[idx]
+        alt = altitudes[idx]
+
+        if math.isclose(mach_num, curr_mach, abs_tol=model.mach_tol):
+            if math.isclose(alt, curr_alt, abs_tol=model.alt_tol):
+                data_indices[mach_count - 1, alt_count - 1] = data_count
+                data_count += 1
+            else:
+                curr_alt = alt
+                alt_count += 1
+                data_indices = extend_array(data_indices, [mach_count, alt_count])
+                if data_count > max_data_count:
+                    max_data_count = data_count
+                data_count = 1
+                data_indices[mach_count - 1, alt_count - 1] = 1
+        else:
+            curr_mach = mach_num
+            mach_count += 1
+            if alt_count > max_alt_count:
+                max_alt_count = alt_count
+            curr_alt = alt
+            alt_count = 1
+            data_indices = extend_array(data_indices, [mach_count, alt_count])
+            if data_count > max_data_count:
+                max_data_count = data_count
+            data_count = 1
+            data_indices[mach_count - 1, alt_count - 1] = 1
+
+    return mach_count, max_alt_count, max_data_count, data_indices.astype(int)
+
+
+def _pack_data_reference(model, mach_max_count, alt_max_count, data_max_count,
+                         data_indices):
+    """
+    Loop-based implementation of EngineDeck._pack_data(), used as a reference for the
+    vectorized version.
+    """
+    packed_data = {}
+    idx = 0
+
+    for key in model.data:
+        packed_data[key] = np.zeros((mach_max_count, alt_max_count, data_max_count))
+
+    for M in range(mach_max_count):
+        for A in range(alt_max_count):
+            if data_indices[M, A] == 0:
+                continue
+            for D in range(data_indices[M, A] + 1):
+                for key in model.data:
+                    unpacked_data = model.data[key]
+                    if idx < len(unpacked_data):
+                        packed_data[key][M, A, D] = unpacked_data[idx]
+                idx += 1
+
+    return packed_data
+
+
+@use_tempdirs
+class EngineDeckGridTest(unittest.TestCase):
+    def _run_engine(self, data_file, interpolation_grid):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs'].deepcopy()
+        aviary_values.set_val(Aircraft.Engine.DATA_FILE, data_file)
+        aviary_values.set_val(Aircraft.Engine.INTERPOLATION_GRID, interpolation_grid)
+        engine = build_engine_deck(aviary_values)[0]
+        preprocess_propulsion(aviary_values, [engine])
+
+        prob = om.Problem()
+        ivc = prob.model.add_subsystem('ivc', om.IndepVarComp(), promotes=['*'])
+        ivc.add_output(Dynamic.Mission.MACH, [0., 0.35, 0.62], units='unitless')
+        ivc.add_output(Dynamic.Mission.ALTITUDE, [0., 12300., 27100.], units='ft')
+        ivc.add_output(Dynamic.Mission.THROTTLE, [1., 0.47, 0.83], units='unitless')
+        prob.model.add_subsystem('engine',
+                                 engine.build_mission(3, aviary_values),
+                                 promotes=['*'])
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        return engine, prob
+
+    def test_structured_deck(self):
+        data_file = 'models/engines/turbofan_24k_2.deck'
+        engine, prob = self._run_engine(data_file, 'auto')
+        _, semistructured_prob = self._run_engine(data_file, 'semistructured')
+
+        self.assertEqual(engine.interpolation_grid, 'structured')
+        self.assertIsInstance(prob.model._get_subsystem('engine.interpolation'),
+                              om.MetaModelStructuredComp)
+        self.assertIsInstance(prob.model._get_subsystem('engine.max_interpolation'),
+                              om.MetaModelStructuredComp)
+
+        for var in (Dynamic.Mission.THRUST, Dynamic.Mission.THRUST_MAX,
+                    Dynamic.Mission.FUEL_FLOW_RATE_NEGATIVE):
+            assert_near_equal(prob.get_val(var),
+                              semistructured_prob.get_val(var), 1e-12)
+
+        partial_data = prob.check_partials(out_stream=None, method='cs',
+                                           includes='*interpolation*')
+        assert_check_partials(partial_data, atol=1e-6, rtol=1e-8)
+
+        # report states which type of interpolation was used
+        report_file = Path('propulsion.md')
+        engine.report(prob, report_file, meta_data=_MetaData, engine_idx=0)
+        with open(report_file) as f:
+            self.assertIn('interpolated on a structured grid', f.read())
+
+    def test_resampled_deck(self):
+        data_file = 'models/engines/turbofan_28k.deck'
+        engine, prob = self._run_engine(data_file, 'auto')
+        self.assertEqual(engine.interpolation_grid, 'semistructured')
+
+        engine, resampled_prob = self._run_engine(data_file, 'structured')
+        self.assertEqual(engine.interpolation_grid, 'resampled')
+
+        for var in (Dynamic.Mission.THRUST, Dynamic.Mission.THRUST_MAX,
+                    Dynamic.Mission.FUEL_FLOW_RATE_NEGATIVE):
+            assert_near_equal(resampled_prob.get_val(var), prob.get_val(var), 1e-10)
+
+
+@use_tempdirs
+class EngineDeckCacheTest(unittest.TestCase):
+    def test_data_cache(self):
+        options = AviaryValues()
+        options.set_val(Aircraft.Engine.DATA_FILE, 'models/engines/turbofan_28k.deck')
+        options.set_val(Aircraft.Engine.DATA_CACHE_DIR, 'engine_cache')
+        options.set_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE, True)
+
+        # first deck processes data and writes cache, second deck reads from cache
+        cold_deck = EngineDeck('engine', options)
+        cache_files = list(Path('engine_cache').glob('*.npz'))
+        self.assertEqual(len(cache_files), 1)
+
+        warm_deck = EngineDeck('engine', options)
+        self.assertEqual(len(list(Path('engine_cache').glob('*.npz'))), 1)
+
+        self.assertEqual(list(cold_deck.data), list(warm_deck.data))
+        self.assertEqual(cold_deck.engine_variables, warm_deck.engine_variables)
+        for key in cold_deck.data:
+            np.testing.assert_array_equal(cold_deck.data[key], warm_deck.data[key])
+            np.testing.assert_array_equal(cold_deck.packed_data[key],
+                                          warm_deck.packed_data[key])
+            np.testing.assert_array_equal(cold_deck.idle_points[key],
+                                          warm_deck.idle_points[key])
+        np.testing.assert_array_equal(cold_deck.data_indices, warm_deck.data_indices)
+        self.assertEqual(
+            cold_deck.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf'),
+            warm_deck.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf'))
+        self.assertEqual(
+            cold_deck.get_val(Aircraft.Engine.SCALED_SLS_THRUST, 'lbf'),
+            warm_deck.get_val(Aircraft.Engine.SCALED_SLS_THRUST, 'lbf'))
+
+        # changing an option that affects data processing creates a new cache file
+        options.set_val(Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION, 0.1)
+        EngineDeck('engine', options)
+        self.assertEqual(len(list(Path('engine_cache').glob('*.npz'))), 2)
+
+
+class SharedMetaModelSemiStructuredCompTest(unittest.TestCase):
+    def build_problem(self, comp_class, outputs, **kwargs):
+        x = np.repeat([0., 1., 2.], 3)
+        y = np.tile([0., 1., 3.], 3)
+
+        comp = comp_class(method='slinear', vec_size=2, **kwargs)
+        comp.add_input('x', training_data=x)
+        comp.add_input('y', training_data=y)
+        for name, func in outputs.items():
+            comp.add_output(name, training_data=func(x, y))
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', comp)
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('comp.x', [0.5, 1.5])
+        prob.set_val('comp.y', [2., 0.25])
+        prob.run_model()
+
+        return prob
+
+    def test_setup_hook(self):
+        # SharedMetaModelSemiStructuredComp skips the _setup_var_data of
+        # MetaModelSemiStructuredComp, assuming it only builds the interpolants. If
+        # OpenMDAO changes that method, this fails.
+        outputs = {'f': lambda x, y: x * y + y}
+        prob = self.build_problem(om.MetaModelSemiStructuredComp, outputs)
+        shared_prob = self.build_problem(SharedMetaModelSemiStructuredComp, outputs,
+                                         interp_cache={})
+
+        comp = prob.model.comp
+        shared_comp = shared_prob.model.comp
+        self.assertEqual(vars(comp).keys(), vars(shared_comp).keys())
+        self.assertEqual(comp.interps.keys(), shared_comp.interps.keys())
+
+        assert_near_equal(shared_prob.get_val('comp.f'), prob.get_val('comp.f'), 1e-15)
+        partial_data = shared_prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
+
+    def test_cache_key(self):
+        interp_cache = {}
+        probs = [
+            self.build_problem(SharedMetaModelSemiStructuredComp, outputs,
+                               interp_cache=interp_cache)
+            for outputs in ({'f': lambda x, y: x + y}, {'f': lambda x, y: x + y},
+                            {'f': lambda x, y: x - y})]
+
+        interps = [prob.model.comp.interps['f'] for prob in probs]
+        self.assertIs(interps[0], interps[1])
+        # the same names with other training data do not share interpolants
+        self.assertIsNot(interps[0], interps[2])
+        self.assertEqual(len(interp_cache), 2)
+
+        assert_near_equal(probs[2].get_val('comp.f'), [-1.5, 1.25], 1e-15)
+
+
+class SharedMetaModelStructuredCompTest(unittest.TestCase):
+    def build_problem(self, comp_class, values, **kwargs):
+        # two components evaluated at different points
+        points = {'comp_1': ([0.5, 2.], [1.5, 0.25]),
+                  'comp_2': ([1.75, 0.2], [0.1, 2.5])}
+
+        prob = om.Problem()
+        for name in points:
+            comp = comp_class(method='lagrange2', vec_size=2, **kwargs)
+            comp.add_input('x', training_data=[0., 1., 2.])
+            comp.add_input('y', training_data=[0., 1., 3.])
+            comp.add_output('f', training_data=values)
+            prob.model.add_subsystem(name, comp)
+
+        prob.setup(force_alloc_complex=True)
+        for name, (x, y) in points.items():
+            prob.set_val(f'{name}.x', x)
+            prob.set_val(f'{name}.y', y)
+        prob.run_model()
+
+        return prob
+
+    def test_shared_interpolants(self):
+        x, y = np.meshgrid([0., 1., 2.], [0., 1., 3.], indexing='ij')
+        values = x**2 * y + y
+
+        prob = self.build_problem(om.MetaModelStructuredComp, values)
+        shared_prob = self.build_problem(SharedMetaModelStructuredComp, values,
+                                         interp_cache={})
+
+        # SharedMetaModelStructuredComp skips the _setup_var_data of
+        # MetaModelStructuredComp, assuming it only builds the interpolants. If
+        # OpenMDAO changes that method, this fails.
+        comp = prob.model.comp_1
+        shared_comp = shared_prob.model.comp_1
+        self.assertEqual(vars(comp).keys(), vars(shared_comp).keys())
+        self.assertIs(shared_comp.interps['f'], shared_prob.model.comp_2.interps['f'])
+
+        for name in ('comp_1.f', 'comp_2.f'):
+            assert_near_equal(shared_prob.get_val(name), prob.get_val(name), 1e-15)
+
+        # the model is linearized after both components were run, so comp_2 was the
+        # last to evaluate the shared interpolant
+        of = ['comp_1.f', 'comp_2.f']
+        wrt = ['comp_1.x', 'comp_1.y', 'comp_2.x', 'comp_2.y']
+        totals = prob.compute_totals(of, wrt)
+        shared_totals = shared_prob.compute_totals(of, wrt)
+        for key, val in totals.items():
+            assert_near_equal(shared_totals[key], val, 1e-15)
+
+        partial_data = shared_prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
+
 
 if __name__ == "__main__":
     unittest.main()
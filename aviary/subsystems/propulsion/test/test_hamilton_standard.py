@@ -126,6 +126,57 @@ class HamiltonStandardTest(unittest.TestCase):
         assert_check_partials(partial_data, atol=1e-5, rtol=1e-5)
 
 
+class HamiltonStandardOddBladesTest(unittest.TestCase):
+    """
+    Test that HamiltonStandard computes all nodes at once as it computes each of them
+    alone, interpolating between numbers of blades, and that its partials are
+    complex-step safe.
+    """
+
+    def setUp(self):
+        self.options = get_option_defaults()
+        self.options.set_val(Aircraft.Engine.NUM_PROPELLER_BLADES,
+                             val=3, units='unitless')
+
+        self.inputs = {
+            "power_coefficient": np.array([0.2352, 0.2352, 0.2553, 0.1, 0.3]),
+            "advance_ratio": np.array([0.0, 0.8295, 1.9908, 1.25, 2.6]),
+            Dynamic.Mission.MACH: np.array([0.0, 0.1887, 0.4976, 0.35, 0.6]),
+            "tip_mach": np.array([1.2094, 1.2094, 1.3290, 0.8, 1.1]),
+            Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR: 114.0,
+            Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT: 0.55,
+        }
+
+    def run_problem(self, num_nodes, index=slice(None)):
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'hs',
+            HamiltonStandard(num_nodes=num_nodes, aviary_options=self.options),
+            promotes=['*'],
+        )
+        prob.setup(force_alloc_complex=True)
+
+        for name, val in self.inputs.items():
+            prob.set_val(name, val if np.isscalar(val) else val[index])
+
+        prob.run_model()
+
+        return prob
+
+    def test_nodes(self):
+        prob = self.run_problem(5)
+
+        for i in range(5):
+            node_prob = self.run_problem(1, [i])
+            for name in ("thrust_coefficient", "comp_tip_loss_factor"):
+                assert_near_equal(
+                    prob.get_val(name)[i], node_prob.get_val(name)[0], 1e-14)
+
+        partial_data = prob.check_partials(
+            out_stream=None, method="cs", compact_print=True)
+        assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
+
+
 class PostHamiltonStandardTest(unittest.TestCase):
     """
     Test computation in PostHamiltonStandard class.
@@ -6,10 +6,13 @@ default_units : dict
 """
 
 from enum import Enum
+import hashlib
 from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
+from openmdao.components.interp_util.interp import InterpND
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
 
 import aviary.constants as constants
 
@@ -214,6 +217,150 @@ def build_engine_deck(aviary_options: AviaryValues, meta_data=_MetaData):
     ]
 
 
+class SharedMetaModelSemiStructuredComp(om.MetaModelSemiStructuredComp):
+    '''
+    MetaModelSemiStructuredComp that can share its trained interpolants with other
+    instances built from the same data (e.g. the same engine model used in multiple
+    mission phases). Only the evaluation buffers sized by vec_size are allocated per
+    instance.
+    '''
+
+    def initialize(self):
+        super().initialize()
+
+        self.options.declare(
+            'interp_cache',
+            types=dict,
+            default=None,
+            allow_none=True,
+            recordable=False,
+            desc='Dictionary of trained interpolants shared between components. '
+            'Interpolants are keyed on the names and training data of the inputs and '
+            'output, the method and extrapolation, so components only share them if '
+            'they were trained on the same data. If None, interpolants are not shared.',
+        )
+
+    def _setup_var_data(self):
+        interp_cache = self.options['interp_cache']
+
+        if interp_cache is None:
+            super()._setup_var_data()
+            return
+
+        interp_method = self.options['method']
+        extrapolate = self.options['extrapolate']
+        pnames = tuple(self.pnames)
+
+        # Make sure all training data is sized correctly.
+        size = len(self.training_inputs[pnames[0]])
+        for data_dict in (self.training_inputs, self.training_outputs):
+            for name, data in data_dict.items():
+                if len(data) != size:
+                    raise ValueError(
+                        f"Size mismatch: training data for '{name}' is length "
+                        f"{len(data)}, but data for '{pnames[0]}' is length {size}."
+                    )
+
+        grid = np.array([col for col in self.training_inputs.values()]).T
+        grid_digest = _get_array_digest(grid)
+
+        for name, train_data in self.training_outputs.items():
+            key = (pnames, grid_digest, name, _get_array_digest(train_data),
+                   interp_method, extrapolate)
+            if key not in interp_cache:
+                interp_cache[key] = InterpNDSemi(
+                    grid, train_data, method=interp_method, extrapolate=extrapolate
+                )
+            self.interps[name] = interp_cache[key]
+
+        # skip rebuilding interpolants in MetaModelSemiStructuredComp, which does
+        # nothing else (checked by test_engine_deck)
+        super(om.MetaModelSemiStructuredComp, self)._setup_var_data()
+
+
+class SharedMetaModelStructuredComp(om.MetaModelStructuredComp):
+    '''
+    MetaModelStructuredComp that can share its trained interpolants with other
+    instances built from the same data (e.g. the same aero tables used in multiple
+    mission phases), like SharedMetaModelSemiStructuredComp. Interpolants are not
+    shared when the training data is passed through connections.
+    '''
+
+    def initialize(self):
+        super().initialize()
+
+        self.options.declare(
+            'interp_cache',
+            types=dict,
+            default=None,
+            allow_none=True,
+            recordable=False,
+            desc='Dictionary of trained interpolants shared between components. '
+            'Interpolants are keyed on the names and training data of the inputs and '
+            'output, the method and extrapolation, so components only share them if '
+            'they were trained on the same data. If None, or if training data '
+            'gradients are used, interpolants are not shared.',
+        )
+
+    def _is_shared(self):
+        return (self.options['interp_cache'] is not None
+                and not self.options['training_data_gradients'])
+
+    def _setup_var_data(self):
+        if not self._is_shared():
+            super()._setup_var_data()
+            return
+
+        interp_cache = self.options['interp_cache']
+        interp_method = self.options['method']
+        extrapolate = self.options['extrapolate']
+        pnames = tuple(self.pnames)
+        grid_digest = tuple(_get_array_digest(points) for points in self.inputs)
+
+        for name, train_data in self.training_outputs.items():
+            key = ('structured', pnames, grid_digest, name,
+                   _get_array_digest(train_data), interp_method, extrapolate)
+            if key not in interp_cache:
+                interp_cache[key] = InterpND(
+                    method=interp_method, points=self.inputs, values=train_data,
+                    extrapolate=extrapolate
+                )
+            self.interps[name] = interp_cache[key]
+
+        # skip rebuilding interpolants in MetaModelStructuredComp, which does nothing
+        # else without training data gradients (checked by test_engine_deck)
+        super(om.MetaModelStructuredComp, self)._setup_var_data()
+
+    def compute_partials(self, inputs, partials):
+        if not self._is_shared():
+            super().compute_partials(inputs, partials)
+            return
+
+        # a shared interpolant holds the derivatives of the last point it
+        # interpolated, which may belong to another component
+        pt = np.array([inputs[pname].ravel() for pname in self.pnames]).T
+
+        for out_name, interp in self.interps.items():
+            _, dval = interp.interpolate(pt, compute_derivative=True)
+
+            if len(dval.shape) < 2:
+                partials[out_name, self.pnames[0]] = dval
+            else:
+                for i, p in enumerate(self.pnames):
+                    partials[out_name, p] = dval[:, i]
+
+
+def _get_array_digest(array):
+    '''
+    Return a digest of the contents, type and shape of an array of training data.
+    '''
+    array = np.ascontiguousarray(array)
+    digest = hashlib.sha1(repr((array.dtype.str, array.shape)).encode('utf-8'))
+    digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+
 # TODO combine with aviary/utils/data_interpolator_builder.py build_data_interpolator
 class EngineDataInterpolator(om.Group):
     '''
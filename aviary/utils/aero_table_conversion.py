@@ -33,11 +33,15 @@ allowed_headers = {
 }
 
 
-def AeroDataConverter(input_file=None, output_file=None, data_format=None):
+def AeroDataConverter(input_file=None, output_file=None, data_format=None,
+                      columnar=False):
     """This is a utility class to convert a legacy aero data file to Aviary format.
     There are two options for the legacy aero data file format: FLOPS and GASP.
     As an Aviary command, the usage is:
     aviary convert_aero_table -F {FLOPS|GASP} input_file output_file
+
+    If columnar is True, the columnar companion files of the output files are also
+    written, which read_data_file() memory-maps instead of parsing the output files.
     """
     data_format = CodeOrigin(data_format)
     data_file = get_path(input_file)
@@ -70,7 +74,8 @@ def AeroDataConverter(input_file=None, output_file=None, data_format=None):
         data, comments = _load_gasp_aero_table(data_file)
         comments = [stamp] + comments
 
-        write_data_file(output_file, data, comments, include_timestamp=True)
+        write_data_file(output_file, data, comments, include_timestamp=True,
+                        columnar=columnar)
     elif data_format is CodeOrigin.FLOPS:
         if type(output_file) is not list:
             # if only one filename is given, split into two
@@ -88,12 +93,13 @@ def AeroDataConverter(input_file=None, output_file=None, data_format=None):
         # write lift-dependent drag file
         lift_drag_comments = [stamp] + lift_drag_comments
         write_data_file(output_file[0], lift_drag_data,
-                        lift_drag_comments, include_timestamp=True)
+                        lift_drag_comments, include_timestamp=True, columnar=columnar)
 
         # write zero-lift drag file
         zero_lift_drag_comments = [stamp] + zero_lift_drag_comments
         write_data_file(output_file[1], zero_lift_drag_data,
-                        zero_lift_drag_comments, include_timestamp=True)
+                        zero_lift_drag_comments, include_timestamp=True,
+                        columnar=columnar)
 
 
 def _load_flops_aero_table(filepath: Path):
@@ -253,13 +259,17 @@ def _setup_ATC_parser(parser):
                         help='path to file where new converted data will be written')
     parser.add_argument('-f', '--data_format', type=str, choices=[origin.value for origin in CodeOrigin],
                         help='data format used by input_file')
+    parser.add_argument('--columnar', action='store_true',
+                        help='also write a columnar binary copy of the converted data, '
+                             'which is memory-mapped when it is read')
 
 
 def _exec_ATC(args, user_args):
     AeroDataConverter(
         input_file=args.input_file,
         output_file=args.output_file,
-        data_format=args.data_format
+        data_format=args.data_format,
+        columnar=args.columnar
     )
 
 
@@ -17,6 +17,7 @@ class AviaryValues
     define a collection of named values with associated units
 '''
 from enum import EnumMeta
+import functools
 
 import numpy as np
 from openmdao.utils.units import convert_units as _convert_units
@@ -55,10 +56,13 @@ class AviaryValues(NamedValues):
             if units of `None` were specified or units of any type other than `str`
         '''
 
-        # Special handling to access an Enum member from either the member name or its value.
         my_val = val
-        if key in _MetaData.keys():
-            expected_types = _MetaData[key]['types']
+        var = _MetaData.get(key)
+
+        if var is not None:
+            # Special handling to access an Enum member from either the member name or
+            # its value.
+            expected_types = var['types']
             if type(expected_types) is EnumMeta:
                 if self._is_iterable(val):
                     my_val = [self._convert_to_enum(
@@ -66,9 +70,8 @@ class AviaryValues(NamedValues):
                 else:
                     my_val = self._convert_to_enum(val, expected_types)
 
-        # Special handling if the variable is supposed to be an array
-        if key in _MetaData.keys():
-            default_value = _MetaData[key]['default_value']
+            # Special handling if the variable is supposed to be an array
+            default_value = var['default_value']
             # if the item is supposed to be an iterable...
             if self._is_iterable(default_value):
                 # but the provided value is not...
@@ -84,6 +87,69 @@ class AviaryValues(NamedValues):
 
         super().set_val(key=key, val=my_val, units=units)
 
+    def update(self, other=None, **kwargs):
+        '''
+        Assign named values and their associated units found in another
+        collection to this collection, overwriting existing items.
+
+        Values found in another `AviaryValues` were validated when they were set, so
+        they are not validated again (see `bulk_update`).
+
+        Parameters
+        ----------
+        other (None)
+            a collection of named values and their associated units
+
+        **kwargs (optional)
+            individual named values and their associated units
+        '''
+        self.bulk_update(other)
+        self.bulk_update(kwargs)
+
+    def bulk_update(self, items, validate='once', meta_data=_MetaData):
+        '''
+        Assign named values and their associated units found in another
+        collection to this collection, overwriting existing items.
+
+        Parameters
+        ----------
+        items
+            a collection of named values and their associated units, of any of the
+            types supported by `update`
+
+        validate : str ('once')
+            how the values are validated against the metadata:
+
+                * 'once': values found in another `AviaryValues` were validated when
+                  they were set, so only other values are validated
+                * 'always': all values are validated
+                * 'never': no values are validated, nor converted to the types
+                  expected by the metadata
+
+        meta_data : dict
+            metadata the values are validated against
+
+        Raises
+        ------
+        ValueError
+            if validate is not one of the supported values
+        '''
+        if validate not in ('once', 'always', 'never'):
+            raise ValueError("validate must be one of 'once', 'always' or 'never', "
+                             f"not {validate!r}.")
+
+        if not items:
+            return
+
+        if validate == 'never' or (
+                validate == 'once' and isinstance(items, AviaryValues)):
+            set_val = super().set_val
+        else:
+            def set_val(key, val, units='unitless'):
+                self.set_val(key, val, units, meta_data=meta_data)
+
+        self._update(items, set_val)
+
     def _check_type(self, key, val, meta_data=_MetaData):
         if key in meta_data.keys():
             expected_types = meta_data[key]['types']
@@ -121,19 +187,17 @@ class AviaryValues(NamedValues):
     def _check_units_compatability(self, key, val, units, meta_data=_MetaData):
         if key in meta_data.keys():
             expected_units = meta_data[key]['units']
+            error = _get_units_error(expected_units, units)
 
-            try:
-                # NOTE the value here is unimportant, we only care if OpenMDAO will
-                # convert the units
-                _convert_units(10, expected_units, units)
-            except ValueError:
+            if error is None:
+                return
+            if error is ValueError:
                 raise ValueError(
                     f'The units {units} which you have provided for {key} are invalid.')
-            except TypeError:
+            if error is TypeError:
                 raise TypeError(
                     f'The base units of {key} are {expected_units}, and you have tried to set {key} with units of {units}, which are not compatible.')
-            except BaseException:
-                raise KeyError('There is an unknown error with your units.')
+            raise KeyError('There is an unknown error with your units.')
 
     def _is_iterable(self, val):
         return isinstance(val, _valid_iterables)
@@ -151,3 +215,23 @@ class AviaryValues(NamedValues):
 
 
 _valid_iterables = (list, np.ndarray, tuple)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_units_error(expected_units, units):
+    '''
+    Return the type of error raised when converting from the expected units to the
+    given ones, or None if they are compatible.
+    '''
+    try:
+        # NOTE the value here is unimportant, we only care if OpenMDAO will
+        # convert the units
+        _convert_units(10, expected_units, units)
+    except ValueError:
+        return ValueError
+    except TypeError:
+        return TypeError
+    except Exception:
+        return KeyError
+
+    return None
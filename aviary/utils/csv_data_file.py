@@ -1,8 +1,12 @@
 import getpass
+import json
 import numpy as np
+import os
 import re
+import tempfile
 import warnings
 
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +17,31 @@ from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 
 
+# maximum number of parsed data files kept in memory by read_data_file()
+DATA_FILE_CACHE_SIZE = 64
+
+# suffix added to the name of a data file to get the name of its columnar companion
+# file
+COLUMNAR_FILE_SUFFIX = '.columnar'
+
+# start of every columnar file, including the version of its format
+_COLUMNAR_FILE_MAGIC = b'AVIARY COLUMNAR 1\n'
+
+# alignment of the numerical data in columnar files, in bytes
+_COLUMNAR_DATA_ALIGNMENT = 64
+
+# parsed data files, by file and the metadata and aliases used to parse them, in order
+# of last use
+_data_file_cache = OrderedDict()
+
+
+def clear_data_file_cache():
+    """
+    Forget all data files parsed by read_data_file(), so they are read from disk again.
+    """
+    _data_file_cache.clear()
+
+
 # multiple type annotation uses "typeA | typeB" syntax, but requires Python 3.10+
 def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                    save_comments=False):
@@ -21,6 +50,12 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
     whitespace allowed between data entries. Spaces are not allowed in openMDAO
     variables, so any spaces in header entries are replaced with underscores.
 
+    Parsed files are cached for the rest of the process, so reading the same file again
+    with the same metadata and aliases does not parse it again as long as its
+    modification time and size are unchanged. The arrays in the returned data are
+    shared with the cache and are read-only: replace them rather than modifying them in
+    place.
+
     Parameters
     ----------
     filename : (str, Path)
@@ -42,16 +77,13 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
     -------
     data : NamedValues
         data read from file in NamedValues format, including variable name, units, and 
-        values (stored in a numpy array)
+        values (stored in a read-only numpy array)
     comments : list of str
         any comments from file, with comment characters ('#') stripped out (only if 
         save_comments=True)
     """
     filepath = get_path(filename)
 
-    data = NamedValues()
-    comments = []
-
     # prep aliases for case-insensitive matching, with spaces == underscores
     if aliases:
         for key in aliases:
@@ -59,124 +91,387 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                 aliases[key] = [aliases[key]]
             aliases[key] = [re.sub('\s', '_', item).lower() for item in aliases[key]]
 
+    stat = filepath.stat()
+    cache_key = (str(filepath.resolve()), stat.st_mtime_ns, stat.st_size,
+                 _get_metadata_signature(metadata), _get_aliases_signature(aliases))
+
+    parsed = _data_file_cache.get(cache_key)
+    if parsed is None:
+        parsed = _parse_data_file(filepath, metadata, aliases)
+        _data_file_cache[cache_key] = parsed
+        if len(_data_file_cache) > DATA_FILE_CACHE_SIZE:
+            _data_file_cache.popitem(last=False)
+    else:
+        _data_file_cache.move_to_end(cache_key)
+
+    columns, comments, warning_messages = parsed
+
+    # warnings are given every time the file is read, not only when it is parsed
+    for message in warning_messages:
+        warnings.warn(message)
+
+    # store data in NamedValues object
+    data = NamedValues()
+    for variable, (val, units) in columns:
+        data.set_val(variable, val=val, units=units)
+
+    if save_comments:
+        return data, list(comments)
+    else:
+        return data
+
+
+def _get_metadata_signature(metadata):
+    """
+    Return a hashable summary of everything in metadata that read_data_file() uses.
+    """
+    if metadata is None:
+        return None
+
+    return tuple((name, var.get('units')) for name, var in metadata.items())
+
+
+def _get_aliases_signature(aliases):
+    """
+    Return a hashable copy of prepped aliases, in lookup order.
+    """
+    if not aliases:
+        return None
+
+    return tuple((key, tuple(aliases[key])) for key in aliases)
+
+
+def _parse_data_file(filepath, metadata, aliases, bulk=True, columnar=True):
+    """
+    Parse a data file for read_data_file(), with aliases already prepped.
+
+    Unless columnar is False, the table is loaded from the columnar companion file of
+    the data file when it has one that is up to date. Otherwise comments and the header
+    are read line by line. Unless bulk is False, the numerical data that follows is then
+    parsed all at once by numpy, falling back to parsing it line by line if numpy
+    cannot, so that any error found is reported the same way.
+
+    Returns a tuple of the columns read, as a list of (variable, (values, units)) with
+    read-only values, the comments, and the messages of any warnings to give.
+    """
+    warning_messages = []
+
+    table = None
+    if columnar:
+        table = _read_columnar_data_file(filepath)
+
+    if table is not None:
+        header_line, header_entries, comments, table_data = table
+        header, valid_indices = _parse_header(header_entries, filepath, metadata,
+                                              aliases, warning_messages)
+
+        # same error as when the header is read from the data file itself
+        if len(header) == 0:
+            raise ValueError(
+                f'Non-numerical value found in data file <{filepath}> on line '
+                f'{str(header_line)}')
+
+        data = [table_data[index] for index in valid_indices]
+
+    else:
+        lines = _read_lines(filepath)
+        header_line, _, header, valid_indices, comments = _find_header(
+            lines, filepath, metadata, aliases, warning_messages)
+        data, data_comments = _parse_data(lines, header_line + 1, valid_indices,
+                                          filepath, bulk)
+        comments.extend(data_comments)
+
+    columns = []
+    for (variable, units), val in zip(header.items(), data):
+        # cached values are shared by every read of the file
+        val.flags.writeable = False
+        columns.append((variable, (val, units)))
+
+    return columns, tuple(comments), tuple(warning_messages)
+
+
+def _read_lines(filepath):
+    """
+    Return the lines of a data file, without newline characters.
+    """
     with open(filepath, newline=None, encoding='utf-8-sig') as file:
         # csv.reader() and other avaliable packages that can read csv files are not used
         # Manual control of file reading ensures that comments are kept intact and other
         # checks can be performed
-        check_for_header = True
-        for line_count, line_data in enumerate(file):
-            # if comments are present in line, strip them out
-            if '#' in line_data:
-                index = line_data.index('#')
-                comments.append(line_data[index+1:].strip())
-                line_data = line_data[:index]
-
-            # split by delimiters, remove whitespace and newline characters
-            line_data = re.split(r'[;,]\s*', line_data.strip())
-
-            # ignore empty lines
-            if not line_data or line_data == ['']:
-                continue
+        return file.read().split('\n')
 
-            # try to convert line_data to float, skip any blank strings
-            try:
-                line_data = [float(var) for var in line_data if var != '']
-            # data contains things other than floats
-            except (ValueError):
-                # skip checking for header data if not required
-                if check_for_header:
-                    # dictionary of header name: units
-                    header = {}
-                    # list of which column goes with each valid header entry
-                    valid_indices = []
-                    for index in range(len(line_data)):
-                        item = re.split('[(]', line_data[index])
-                        item = [item[i].strip(') ') for i in range(len(item))]
-                        # openMDAO vars can't have spaces, convert to underscores
-                        name = re.sub('\s', '_', item[0])
-                        if aliases:
-                            # "reverse" lookup name in alias dict
-                            for key in aliases:
-                                if name.lower() in aliases[key]:
-                                    name = key
-                                    break
-                        # 'default' default_units
-                        default_units = 'unitless'
-                        # if metadata is provided, ensure variable exists and update
-                        # default_units
-                        if metadata is not None:
-                            if name not in metadata.keys():
-                                warnings.warn(f'Header <{name}> was not recognized, and '
-                                              'will be skipped'
-                                              )
-                                continue
-                            else:
-                                default_units = metadata[name]['units']
-
-                        # if units are provided, check that they are valid
-                        if len(item) > 1:
-                            units = item[-1]
-                            if valid_units(item[1]):
-                                # check that units are compatible with expected units
-                                if metadata is not None:
-                                    if not is_compatible(units, default_units):
-                                        # Raising error here, as trying to use default
-                                        # units could mean accidental conversion which
-                                        # would significantly impact analysis
-                                        raise ValueError(f'Provided units of <{units}> '
-                                                         f'for column <{name}>, which '
-                                                         'are not compatible with default '
-                                                         f'units of {default_units}')
-                            else:
-                                # Units were not recognized. Raise error
-                                raise ValueError(f'Invalid units <{units}> provided for '
-                                                 f'column <{name}> while reading '
-                                                 f'<{filepath}>.')
-                        else:
-                            if metadata is not None and default_units != 'unitless':
-                                # units were not provided, but variable should have them
-                                # assume default units for that variable
-                                warning = f'Units were not provided for column <{name}> '\
-                                          f'while reading <{filepath}>. Using default '\
-                                          f'units of {default_units}.'
-                                warnings.warn(warning)
-                            units = default_units
-
-                        header[name] = units
-                        valid_indices.append(index)
-
-                    if len(header) > 0:
-                        check_for_header = False
-                        raw_data = {key: [] for key in header.keys()}
-                        continue
-
-                # only raise error if not checking for header, or invalid header found
+
+def _find_header(lines, filepath, metadata, aliases, warning_messages):
+    """
+    Find and parse the header of a data file.
+
+    Returns the line number of the header, its entries, the dictionary of header name:
+    units, the list of which column goes with each valid header entry, and the comments
+    found up to the header.
+    """
+    comments = []
+    header = None
+    for line_count, line_data in enumerate(lines):
+        # if comments are present in line, strip them out
+        if '#' in line_data:
+            index = line_data.index('#')
+            comments.append(line_data[index+1:].strip())
+            line_data = line_data[:index]
+
+        # split by delimiters, remove whitespace and newline characters
+        line_data = re.split(r'[;,]\s*', line_data.strip())
+
+        # ignore empty lines
+        if not line_data or line_data == ['']:
+            continue
+
+        # try to convert line_data to float, skip any blank strings
+        try:
+            [float(var) for var in line_data if var != '']
+        # data contains things other than floats
+        except (ValueError):
+            header, valid_indices = _parse_header(line_data, filepath, metadata,
+                                                  aliases, warning_messages)
+
+            # only raise error if invalid header found
+            if len(header) == 0:
                 raise ValueError(
                     f'Non-numerical value found in data file <{filepath}> on line '
                     f'{str(line_count)}')
 
-            # This point is reached when the first valid numerical entry in data file
-            # is found. Stop looking for header data from now on
-            check_for_header = False
+        # stop looking for header data once either the header or the first valid
+        # numerical entry in data file is found
+        break
 
-            # pull out data for each valid header, ignore other columns
-            for idx, variable in enumerate(header.keys()):
-                # valid_indices matches dictionary order, pull data from correct column
-                raw_data[variable].append(line_data[valid_indices[idx]])
+    if header is None:
+        raise ValueError(f'No header found in data file <{filepath}>')
 
-    # store data in NamedValues object
-    for variable in header.keys():
-        data.set_val(variable, val=np.array(raw_data[variable]), units=header[variable])
+    return line_count, line_data, header, valid_indices, comments
 
-    if save_comments:
-        return data, comments
-    else:
-        return data
+
+def _parse_data(lines, line_start, valid_indices, filepath, bulk=True):
+    """
+    Parse the lines of numerical data of a data file, starting at line number
+    line_start.
+
+    Returns an array for each valid header entry, and the comments found.
+    """
+    data_lines = lines[line_start:]
+
+    parsed = None
+    if bulk:
+        parsed = _parse_data_lines_bulk(data_lines, valid_indices)
+    if parsed is None:
+        parsed = _parse_data_lines(data_lines, line_start, valid_indices, filepath)
+
+    return parsed
+
+
+def _parse_header(line_data, filepath, metadata, aliases, warning_messages):
+    """
+    Parse the entries of a data file header.
+
+    Returns a dictionary of header name: units, and the list of which column goes with
+    each valid header entry.
+    """
+    header = {}
+    valid_indices = []
+    for index in range(len(line_data)):
+        item = re.split('[(]', line_data[index])
+        item = [item[i].strip(') ') for i in range(len(item))]
+        # openMDAO vars can't have spaces, convert to underscores
+        name = re.sub('\s', '_', item[0])
+        if aliases:
+            # "reverse" lookup name in alias dict
+            for key in aliases:
+                if name.lower() in aliases[key]:
+                    name = key
+                    break
+        # 'default' default_units
+        default_units = 'unitless'
+        # if metadata is provided, ensure variable exists and update default_units
+        if metadata is not None:
+            if name not in metadata.keys():
+                warning_messages.append(
+                    f'Header <{name}> was not recognized, and will be skipped')
+                continue
+            else:
+                default_units = metadata[name]['units']
+
+        # if units are provided, check that they are valid
+        if len(item) > 1:
+            units = item[-1]
+            if valid_units(item[1]):
+                # check that units are compatible with expected units
+                if metadata is not None:
+                    if not is_compatible(units, default_units):
+                        # Raising error here, as trying to use default units could
+                        # mean accidental conversion which would significantly impact
+                        # analysis
+                        raise ValueError(f'Provided units of <{units}> for column '
+                                         f'<{name}>, which are not compatible with '
+                                         f'default units of {default_units}')
+            else:
+                # Units were not recognized. Raise error
+                raise ValueError(f'Invalid units <{units}> provided for column '
+                                 f'<{name}> while reading <{filepath}>.')
+        else:
+            if metadata is not None and default_units != 'unitless':
+                # units were not provided, but variable should have them
+                # assume default units for that variable
+                warning = f'Units were not provided for column <{name}> while '\
+                          f'reading <{filepath}>. Using default units of '\
+                          f'{default_units}.'
+                warning_messages.append(warning)
+            units = default_units
+
+        header[name] = units
+        valid_indices.append(index)
+
+    return header, valid_indices
+
+
+def _parse_data_lines(lines, line_start, valid_indices, filepath):
+    """
+    Parse lines of numerical data one by one, starting at line number line_start.
+
+    Returns an array for each valid header entry, and the comments found.
+    """
+    raw_data = [[] for _ in valid_indices]
+    comments = []
+    for line_count, line_data in enumerate(lines, line_start):
+        # if comments are present in line, strip them out
+        if '#' in line_data:
+            index = line_data.index('#')
+            comments.append(line_data[index+1:].strip())
+            line_data = line_data[:index]
+
+        # split by delimiters, remove whitespace and newline characters
+        line_data = re.split(r'[;,]\s*', line_data.strip())
+
+        # ignore empty lines
+        if not line_data or line_data == ['']:
+            continue
+
+        # try to convert line_data to float, skip any blank strings
+        try:
+            line_data = [float(var) for var in line_data if var != '']
+        # data contains things other than floats
+        except (ValueError):
+            raise ValueError(
+                f'Non-numerical value found in data file <{filepath}> on line '
+                f'{str(line_count)}')
+
+        # pull out data for each valid header, ignore other columns
+        for idx, index in enumerate(valid_indices):
+            # valid_indices matches header order, pull data from correct column
+            raw_data[idx].append(line_data[index])
+
+    return [np.array(column) for column in raw_data], comments
+
+
+def _parse_data_lines_bulk(lines, valid_indices):
+    """
+    Parse lines of numerical data all at once.
+
+    Returns an array for each valid header entry, and the comments found. Returns None
+    if the data is not a plain table of numbers with the same number of columns in every
+    line, which _parse_data_lines() must then handle.
+    """
+    text = '\n'.join(lines)
+
+    comments = []
+    if '#' in text:
+        lines = [line_data.partition('#') for line_data in lines]
+        comments = [comment.strip() for _, found, comment in lines if found]
+        lines = [line_data for line_data, _, _ in lines]
+
+    if ';' in text:
+        lines = [line_data.replace(';', ',') for line_data in lines]
+
+    # ignore empty lines
+    lines = [line_data for line_data in lines if line_data and not line_data.isspace()]
+    if not lines:
+        return None
+
+    try:
+        data = np.loadtxt(lines, delimiter=',', comments=None, ndmin=2)
+    except ValueError:
+        return None
+
+    if data.shape[1] <= max(valid_indices):
+        return None
+
+    return [np.ascontiguousarray(data[:, index]) for index in valid_indices], comments
+
+
+def _get_columnar_filepath(filepath):
+    """
+    Return the path of the columnar companion file of a data file.
+    """
+    return filepath.with_name(filepath.name + COLUMNAR_FILE_SUFFIX)
+
+
+def _get_columnar_data_offset(header_length):
+    """
+    Return the offset of the numerical data in a columnar file with a header of the
+    given length.
+    """
+    offset = len(_COLUMNAR_FILE_MAGIC) + 8 + header_length
+    return -(-offset // _COLUMNAR_DATA_ALIGNMENT) * _COLUMNAR_DATA_ALIGNMENT
+
+
+def _read_columnar_data_file(filepath):
+    """
+    Load the table of a data file from its columnar companion file.
+
+    Returns the line number of the header of the data file, the entries of that
+    header, the comments of the file, and a memory-mapped, read-only array with one row
+    per header entry. Returns None if there is no columnar file, or if it is not valid
+    or if the size or modification time of the data file changed since it was written.
+    """
+    columnar_filepath = _get_columnar_filepath(filepath)
+
+    try:
+        with open(columnar_filepath, 'rb') as file:
+            if file.read(len(_COLUMNAR_FILE_MAGIC)) != _COLUMNAR_FILE_MAGIC:
+                return None
+            header_length = int.from_bytes(file.read(8), 'little')
+            header = json.loads(file.read(header_length))
+
+        # same validation as the cache of read_data_file(), without reading the file
+        stat = filepath.stat()
+        if (header['source_size'] != stat.st_size
+                or header['source_mtime_ns'] != stat.st_mtime_ns):
+            return None
+
+        shape = (len(header['header_entries']), header['num_rows'])
+        if 0 in shape:
+            table_data = np.zeros(shape)
+        else:
+            # pages of the file are shared by every process that maps it
+            table_data = np.memmap(columnar_filepath, dtype='<f8', mode='r',
+                                   offset=_get_columnar_data_offset(header_length),
+                                   shape=shape)
+
+    except FileNotFoundError:
+        return None
+
+    except (OSError, KeyError, TypeError, ValueError) as err:
+        warnings.warn(f'Columnar file <{columnar_filepath}> could not be read ({err}), '
+                      f'and will be ignored')
+        return None
+
+    table_data = [np.asarray(row) for row in table_data]
+
+    return (header['header_line'], header['header_entries'], header['comments'],
+            table_data)
 
 
 # multiple type annotation uses "typeA | typeB" syntax, but requires Python 3.10+
 def write_data_file(filename: (str, Path) = None, data: NamedValues = None,
-                    comments: (str, list) = [], include_timestamp: bool = False):
+                    comments: (str, list) = [], include_timestamp: bool = False,
+                    columnar: bool = False):
     """
     Write data to a comma-separated values (csv) format file using the Aviary data table
     format.
@@ -193,6 +488,9 @@ def write_data_file(filename: (str, Path) = None, data: NamedValues = None,
         data begins
     include_timestamp : bool, optional
         optional flag to set if timestamp and user should be include in file comments
+    columnar : bool, optional
+        optional flag to set if the columnar companion file of the output file should
+        also be written, see write_columnar_data_file()
     """
     if isinstance(filename, str):
         filepath = Path(filename)
@@ -269,3 +567,70 @@ def write_data_file(filename: (str, Path) = None, data: NamedValues = None,
                delimiter=',',
                header=', '.join(header),
                comments='\n'.join(comments))
+
+    if columnar:
+        write_columnar_data_file(filepath)
+
+
+def write_columnar_data_file(filename: (str, Path)):
+    """
+    Write the columnar companion file of a data file in Aviary format.
+
+    The columnar file holds the header, comments and numerical data of the data file in
+    binary form, with the data of each column stored contiguously. When it is up to
+    date, read_data_file() memory-maps it instead of parsing the data file, so processes
+    reading the same data file share a single copy of its data. It is ignored once the
+    size or modification time of the data file change, so it must be written again
+    after the data file is modified or copied.
+
+    Parameters
+    ----------
+    filename : (str, Path)
+        filename or filepath of data file to write the columnar companion file of
+
+    Returns
+    -------
+    columnar_filepath : Path
+        filepath of the columnar file that was written
+    """
+    filepath = get_path(filename)
+    columnar_filepath = _get_columnar_filepath(filepath)
+
+    # taken before reading, so that the columnar file is ignored if the data file
+    # changes while it is written
+    stat = filepath.stat()
+
+    lines = _read_lines(filepath)
+    # without metadata, every header entry is valid
+    header_line, header_entries, _, valid_indices, comments = _find_header(
+        lines, filepath, None, None, [])
+    data, data_comments = _parse_data(lines, header_line + 1, valid_indices, filepath)
+
+    header = json.dumps({
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'header_line': header_line,
+        'header_entries': header_entries,
+        'comments': comments + data_comments,
+        'num_rows': len(data[0]),
+    }).encode('utf-8')
+
+    offset = _get_columnar_data_offset(len(header))
+    prefix = _COLUMNAR_FILE_MAGIC + len(header).to_bytes(8, 'little') + header
+
+    # write to a temporary file first, so that no process reads a partial file
+    with tempfile.NamedTemporaryFile(dir=columnar_filepath.parent, suffix='.tmp',
+                                     delete=False) as file:
+        try:
+            file.write(prefix.ljust(offset, b'\0'))
+            file.write(np.asarray(data, dtype='<f8').tobytes())
+            # temporary files are only readable by their owner, while every process
+            # that can read the data file should be able to map its columnar file
+            os.chmod(file.name, stat.st_mode & 0o777)
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+    os.replace(file.name, columnar_filepath)
+
+    return columnar_filepath
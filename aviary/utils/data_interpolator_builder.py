@@ -1,9 +1,12 @@
+import hashlib
 import warnings
 import numpy as np
 import openmdao.api as om
 
 from pathlib import Path
 
+from aviary.subsystems.propulsion.utils import (SharedMetaModelSemiStructuredComp,
+                                                SharedMetaModelStructuredComp)
 from aviary.utils.named_values import get_keys, get_items
 from aviary.utils.csv_data_file import read_data_file
 from aviary.utils.functions import get_path
@@ -12,7 +15,8 @@ from aviary.utils.named_values import NamedValues
 
 def build_data_interpolator(num_nodes, interpolator_data=None, interpolator_outputs=None,
                             method='slinear', extrapolate=True, structured=None,
-                            connect_training_data=False):
+                            connect_training_data=False, data_cache=None,
+                            data_key=None):
     """
     Builder for openMDAO metamodel components using data provided via data file, directly
     provided as an argument, or training data passed through openMDAO connections.
@@ -53,10 +57,23 @@ def build_data_interpolator(num_nodes, interpolator_data=None, interpolator_outp
         connections. If True, any provided values for dependent variables will
         be ignored.
 
+    data_cache : dict, optional
+        Dictionary where the formatted (sorted and structured) data and the trained
+        interpolants are stored, keyed on the data and the settings that affect them.
+        Interpolators built later with the same data and settings, such as the ones of
+        every phase of a mission, reuse them instead of formatting the data and
+        training the interpolants again. The formatted values are shared and
+        read-only. Interpolants are not shared if connect_training_data is True.
+
+    data_key : hashable, optional
+        Key identifying the contents of interpolator_data in data_cache, when the
+        caller already has one. By default, the key is a digest of the data.
+
     Returns
     -------
     interp_comp : om.MetaModelSemiStructuredComp, om.MetaModelStructuredComp
-        OpenMDAO metamodel component using the provided data and flags
+        OpenMDAO metamodel component using the provided data and flags (the shared
+        subclasses of these if data_cache is given)
     """
     # Argument checking #
     if interpolator_outputs is None:
@@ -67,6 +84,106 @@ def build_data_interpolator(num_nodes, interpolator_data=None, interpolator_outp
     if isinstance(interpolator_data, Path):
         interpolator_data = read_data_file(interpolator_data)
 
+    cache_key = None
+    cached = None
+    if data_cache is not None:
+        if data_key is None:
+            data_key = _get_data_key(interpolator_data)
+        cache_key = (data_key, tuple(interpolator_outputs.items()), structured,
+                     connect_training_data)
+        cached = data_cache.get(cache_key)
+
+    if cached is None:
+        structured = _format_interpolator_data(interpolator_data, interpolator_outputs,
+                                               structured, connect_training_data)
+
+        if cache_key is not None:
+            formatted_data = NamedValues()
+            for key, (val, units) in get_items(interpolator_data):
+                # formatted data is shared by every interpolator built from the cache
+                val = np.array(val)
+                val.flags.writeable = False
+                formatted_data.set_val(key, val, units)
+            cached = data_cache[cache_key] = (formatted_data, structured)
+
+    if cached is not None:
+        # interpolator_data ends up formatted the same way as if it was formatted here
+        formatted_data, structured = cached
+        for key, (val, units) in get_items(formatted_data):
+            interpolator_data.set_val(key, val, units)
+
+    indep_keys = [key for key in get_keys(interpolator_data)
+                  if key not in interpolator_outputs]
+
+    # create interpolation component
+    if data_cache is not None and not connect_training_data:
+        # trained interpolants are shared by every component built from the cache
+        interp_cache = data_cache.setdefault('interpolants', {})
+        if structured:
+            interp_comp = SharedMetaModelStructuredComp(method=method,
+                                                        extrapolate=extrapolate,
+                                                        vec_size=num_nodes,
+                                                        interp_cache=interp_cache)
+        else:
+            interp_comp = SharedMetaModelSemiStructuredComp(method=method,
+                                                            extrapolate=extrapolate,
+                                                            vec_size=num_nodes,
+                                                            interp_cache=interp_cache)
+    elif structured:
+        interp_comp = om.MetaModelStructuredComp(method=method,
+                                                 extrapolate=extrapolate,
+                                                 vec_size=num_nodes,
+                                                 training_data_gradients=connect_training_data)
+    else:
+        interp_comp = om.MetaModelSemiStructuredComp(method=method,
+                                                     extrapolate=extrapolate,
+                                                     vec_size=num_nodes,
+                                                     training_data_gradients=connect_training_data)
+
+    # add interpolator inputs
+    for key in indep_keys:
+        values, units = interpolator_data.get_item(key)
+        interp_comp.add_input(key,
+                              training_data=values,
+                              units=units)
+    # add interpolator outputs
+    for key in interpolator_outputs:
+        if key in interpolator_data:
+            values, units = interpolator_data.get_item(key)
+        if connect_training_data:
+            units = interpolator_outputs[key]
+            interp_comp.add_output(key,
+                                   units=units)
+        else:
+            interp_comp.add_output(key,
+                                   training_data=values,
+                                   units=units)
+
+    return interp_comp
+
+
+def _get_data_key(interpolator_data):
+    """
+    Return a hashable key identifying the contents of interpolator data.
+    """
+    data_hash = hashlib.sha1()
+    # unlike get_items(), this does not copy the values shared with lazy copies
+    for key, (val, units) in interpolator_data._mapping.items():
+        val = np.ascontiguousarray(val)
+        data_hash.update(repr((key, units, val.dtype.str, val.shape)).encode('utf-8'))
+        data_hash.update(val.tobytes())
+
+    return data_hash.hexdigest()
+
+
+def _format_interpolator_data(interpolator_data, interpolator_outputs, structured,
+                              connect_training_data):
+    """
+    Format interpolator data in place for the metamodel component that will use it,
+    converting data to a structured grid when needed.
+
+    Returns the structured flag, set based on the provided data if it was None.
+    """
     # Pre-format data: Independent variables placed before dependent variables - position
     #                  of these variables relative to others of their type is preserved
     #                  All data converted to numpy arrays
@@ -204,35 +321,4 @@ def build_data_interpolator(num_nodes, interpolator_data=None, interpolator_outp
             val = np.unique(val)
             interpolator_data.set_val(key, val, units)
 
-    # create interpolation component
-    if structured:
-        interp_comp = om.MetaModelStructuredComp(method=method,
-                                                 extrapolate=extrapolate,
-                                                 vec_size=num_nodes,
-                                                 training_data_gradients=connect_training_data)
-    else:
-        interp_comp = om.MetaModelSemiStructuredComp(method=method,
-                                                     extrapolate=extrapolate,
-                                                     vec_size=num_nodes,
-                                                     training_data_gradients=connect_training_data)
-
-    # add interpolator inputs
-    for key in get_keys(indep_vars):
-        values, units = interpolator_data.get_item(key)
-        interp_comp.add_input(key,
-                              training_data=values,
-                              units=units)
-    # add interpolator outputs
-    for key in interpolator_outputs:
-        if key in interpolator_data:
-            values, units = interpolator_data.get_item(key)
-        if connect_training_data:
-            units = interpolator_outputs[key]
-            interp_comp.add_output(key,
-                                   units=units)
-        else:
-            interp_comp.add_output(key,
-                                   training_data=values,
-                                   units=units)
-
-    return interp_comp
+    return structured
@@ -71,7 +71,8 @@ header_names = {
 }
 
 
-def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
+def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType,
+                        columnar=False):
     '''
     Converts FLOPS- or GASP-formatted engine decks into Aviary csv format.
     FLOPS decks are changed from column-delimited to csv format with added headers.
@@ -86,6 +87,9 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
         path to file where new converted data will be written
     data_format : (EngineDeckType)
         data format used by input_file (FLOPS or GASP)
+    columnar : bool, optional
+        if True, also write the columnar companion file of output_file, which
+        read_data_file() memory-maps instead of parsing output_file
     '''
     # TODO rounding for calculated values?
 
@@ -134,15 +138,17 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
 
     elif data_format in (EngineDeckType.GASP, EngineDeckType.GASP_TS):
         is_turbo_prop = True if data_format == EngineDeckType.GASP_TS else False
-        temperature = gasp_keys.pop()
-        fuelflow = gasp_keys.pop()
+        # copy the default keys, so converting more than one deck works
+        keys = list(gasp_keys)
+        temperature = keys.pop()
+        fuelflow = keys.pop()
         if is_turbo_prop:
-            gasp_keys.extend((SHAFT_POWER_CORRECTED, TAILPIPE_THRUST))
+            keys.extend((SHAFT_POWER_CORRECTED, TAILPIPE_THRUST))
         else:
-            gasp_keys.extend((THRUST,))  # must keep "," here
-        gasp_keys.extend((fuelflow, temperature))
+            keys.extend((THRUST,))  # must keep "," here
+        keys.extend((fuelflow, temperature))
 
-        data = {key: [] for key in gasp_keys}
+        data = {key: [] for key in keys}
 
         scalars, tables, fields = _read_gasp_engine(data_file, is_turbo_prop)
         if 'throttle_type' in scalars:
@@ -197,12 +203,12 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
             compute_T4 = False
             data.pop(TEMPERATURE)
             # temperature is assumed last in keys
-            gasp_keys.pop(-1)
+            keys.pop(-1)
         else:
             compute_T4 = True
 
         # define header now that we know what is in the engine deck
-        header = {key: default_units[key] for key in gasp_keys}
+        header = {key: default_units[key] for key in keys}
 
         if compute_T4:
             # compute T4 using atmospheric model
@@ -314,7 +320,8 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
         else:
             ext = '.deck'
         output_file = data_file.stem + ext
-    write_data_file(output_file, write_data, comments, include_timestamp=False)
+    write_data_file(output_file, write_data, comments, include_timestamp=False,
+                    columnar=columnar)
 
 
 def _read_flops_engine(input_file):
@@ -721,13 +728,17 @@ def _setup_EDC_parser(parser):
                         help='path to file where new converted data will be written')
     parser.add_argument('-f', '--data_format', type=EngineDeckType, choices=list(EngineDeckType),
                         help='data format used by input_file')
+    parser.add_argument('--columnar', action='store_true',
+                        help='also write a columnar binary copy of the converted data, '
+                             'which is memory-mapped when it is read')
 
 
 def _exec_EDC(args, user_args):
     EngineDeckConverter(
         input_file=args.input_file,
         output_file=args.output_file,
-        data_format=args.data_format
+        data_format=args.data_format,
+        columnar=args.columnar
     )
 
 
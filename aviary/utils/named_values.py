@@ -17,10 +17,14 @@ class NamedValues
 '''
 import copy
 from collections.abc import Collection
+from enum import Enum
+import functools
 from typing import Any, Tuple, Union
 
+import numpy as np
+
 from openmdao.core.constants import _UNDEFINED
-from openmdao.utils.units import convert_units as _convert_units
+from openmdao.utils.units import unit_conversion
 
 Units = str
 ValueAndUnits = Tuple[Any, Units]
@@ -49,6 +53,11 @@ class NamedValues(Collection):
         type of `ValueAndUnits`.
         '''
         self._mapping = {}
+        # keys whose mutable values may also be held by other collections, mapped to
+        # the number of collections holding them, which is shared by all of these
+        # collections; a value is copied the first time it is accessed, unless the
+        # other collections no longer hold it (see `deepcopy`)
+        self._shared = {}
 
         self.update(other, **kwargs)
 
@@ -80,6 +89,9 @@ class NamedValues(Collection):
         if item is _UNDEFINED:
             return default
 
+        if self._shared and key in self._shared:
+            item = self._unshare(key)
+
         return item
 
     def copy(self):
@@ -96,19 +108,47 @@ class NamedValues(Collection):
         '''
         return copy.copy(self)
 
-    def deepcopy(self):
+    def deepcopy(self, lazy=False):
         '''
         Return a deep copy of the instance of this class.
 
         Parameters
         ---------
-        None
+        lazy : bool (False)
+            if True, the copy shares its mutable values, such as arrays and lists,
+            with this instance, and each of the two only copies a shared value the
+            first time it accesses it, if the other one still holds it. Values that
+            are never accessed, or only set, are never copied.
 
         Returns
         -------
         NamedValues()
+
+        Notes
+        -----
+        A lazy copy is only independent of references to its values obtained from
+        this instance before it was made: modifying such a value in place also
+        modifies it in the copy, until the copy accesses it.
         '''
-        return copy.deepcopy(self)
+        if not lazy:
+            other = copy.deepcopy(self)
+            other._shared = {}
+
+            return other
+
+        other = copy.copy(self)
+        other._mapping = self._mapping.copy()
+
+        shared = self._shared
+        for key, (val, _) in self._mapping.items():
+            if key in shared:
+                shared[key][0] += 1
+            elif not _is_immutable(val):
+                shared[key] = [2]
+
+        other._shared = shared.copy()
+
+        return other
 
     def get_val(self, key, units='unitless') -> Any:
         '''
@@ -146,6 +186,9 @@ class NamedValues(Collection):
         if item is _UNDEFINED:
             raise KeyError(f'KeyError: key not found: {key}')
 
+        if self._shared and key in self._shared:
+            item = self._unshare(key)
+
         val, old_units = item
 
         if isinstance(val, tuple):
@@ -182,6 +225,9 @@ class NamedValues(Collection):
 
         self._mapping[key] = (val, units)
 
+        if self._shared:
+            self._release(key)
+
     def __repr__(self):
         '''
         Return a string containing a printable representation of the collection.
@@ -194,6 +240,9 @@ class NamedValues(Collection):
         '''
         self._mapping.clear()
 
+        for key in list(self._shared):
+            self._release(key)
+
     def update(self, other=None, **kwargs):
         '''
         Assign named values and their associated units found in another
@@ -220,13 +269,22 @@ class NamedValues(Collection):
         When assigning from keyword arguments, the mapped item must be of a
         type of `ValueAndUnits`.
         '''
-        if not (other or kwargs):
+        self._update(other, self.set_val)
+        self._update(kwargs, self.set_val)
+
+    def _update(self, other, set_val):
+        '''
+        Assign named values and their associated units found in another
+        collection to this collection with the given function.
+        '''
+        if not other:
             return
 
-        set_val = self.set_val
+        shared = ()
 
         if isinstance(other, type(self)):
             # NamedValues
+            shared = other._shared
             other = other._mapping
 
         if other is not None:
@@ -244,8 +302,10 @@ class NamedValues(Collection):
                     val, units = other[key]
                     set_val(key, val, units)
 
-        for key, (val, units) in kwargs.items():
-            set_val(key, val, units)
+                    # values shared with a lazy copy remain shared
+                    if key in shared:
+                        count = self._shared[key] = shared[key]
+                        count[0] += 1
 
     def delete(self, key):
         '''
@@ -262,6 +322,8 @@ class NamedValues(Collection):
         except KeyError:
             raise KeyError(f'KeyError: key not found: {key}')
 
+        self._release(key)
+
     def __eq__(self, other):
         '''
         Return whether or not this collection is equivalent to another.
@@ -283,6 +345,9 @@ class NamedValues(Collection):
         '''
         Return an iterator over the `(key, (val, units))` data stored in this collection.
         '''
+        if self._shared:
+            self._unshare_all()
+
         items = self._mapping.items()
 
         yield from items
@@ -293,6 +358,37 @@ class NamedValues(Collection):
         '''
         return len(self._mapping)
 
+    def _release(self, key):
+        '''
+        Stop sharing the value of a key that is no longer held by this collection.
+        '''
+        count = self._shared.pop(key, None)
+
+        if count is not None:
+            count[0] -= 1
+
+    def _unshare(self, key):
+        '''
+        Replace the value of a key shared with a lazy copy by a copy of it, returning
+        the new item. The value is kept if no other collection still holds it.
+        '''
+        item = self._mapping[key]
+        count = self._shared.pop(key)
+        count[0] -= 1
+
+        if count[0] > 0:
+            val, units = item
+            item = self._mapping[key] = (copy.deepcopy(val), units)
+
+        return item
+
+    def _unshare_all(self):
+        '''
+        Replace all values shared with a lazy copy by copies of them.
+        '''
+        for key in list(self._shared):
+            self._unshare(key)
+
     def _check_units(self, funcname, key, units):
         '''
         If units of `None` were specified or units of any type other than `str`, raise
@@ -315,7 +411,7 @@ class NamedValues(Collection):
                 f' unsupported units: {units}'
             )
 
-    __slots__ = ('_mapping',)
+    __slots__ = ('_mapping', '_shared')
 
 
 def get_keys(named_values: NamedValues):
@@ -329,6 +425,8 @@ def get_items(named_values: NamedValues):
     '''
     Return a new view of the collection's `(key, (val, units))`.
     '''
+    named_values._unshare_all()
+
     return named_values._mapping.items()
 
 
@@ -336,4 +434,42 @@ def get_values(named_values: NamedValues):
     '''
     Return a new view of the collection's `(val, units)`.
     '''
+    named_values._unshare_all()
+
     return named_values._mapping.values()
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_conversion(old_units, new_units):
+    '''
+    Return the factor and offset that convert values from old_units to new_units.
+    '''
+    return unit_conversion(old_units, new_units)
+
+
+def _convert_units(val, old_units, new_units):
+    '''
+    Return the value converted from old_units to new_units.
+
+    Same as OpenMDAO's `convert_units`, but the conversion factor and offset of each
+    pair of units are only computed once.
+    '''
+    if not old_units or not new_units:  # one side has no units
+        return val
+
+    factor, offset = _get_conversion(old_units, new_units)
+
+    return (val + offset) * factor
+
+
+_immutable_types = (bool, int, float, complex, str, bytes, type(None), Enum, np.generic)
+
+
+def _is_immutable(val):
+    '''
+    Return True if the value cannot be modified in place.
+    '''
+    if isinstance(val, tuple):
+        return all(_is_immutable(item) for item in val)
+
+    return isinstance(val, _immutable_types)
@@ -25,12 +25,16 @@ CT = PropellerModelVariables.CT
 J = PropellerModelVariables.J
 
 
-def PropDataConverter(input_file, output_file, data_format: PropMapType):
+def PropDataConverter(input_file, output_file, data_format: PropMapType,
+                      columnar=False):
     """
     This is a utility class to convert a propeller map file to Aviary format.
     Currently, there is only one option: from GASP format to Aviary format.
     As an Aviary command, the usage is:
     aviary convert_prop_table -f GASP input_file output_file
+
+    If columnar is True, the columnar companion file of output_file is also written,
+    which read_data_file() memory-maps instead of parsing output_file.
     """
 
     timestamp = datetime.now().strftime('%m/%d/%y at %H:%M')
@@ -73,7 +77,8 @@ def PropDataConverter(input_file, output_file, data_format: PropMapType):
         else:
             ext = '.prop'
         output_file = data_file.stem + ext
-    write_data_file(output_file, write_data, comments, include_timestamp=False)
+    write_data_file(output_file, write_data, comments, include_timestamp=False,
+                    columnar=columnar)
 
 
 def _read_gasp_propeller(fp, cmts):
@@ -153,13 +158,17 @@ def _setup_PMC_parser(parser):
     parser.add_argument('-f', '--data_format', type=PropMapType, choices=list(PropMapType),
                         nargs='?', default='GASP',
                         help='data format used by input_file')
+    parser.add_argument('--columnar', action='store_true',
+                        help='also write a columnar binary copy of the converted data, '
+                             'which is memory-mapped when it is read')
 
 
 def _exec_PMC(args, user_args):
     PropDataConverter(
         input_file=args.input_file,
         output_file=args.output_file,
-        data_format=args.data_format
+        data_format=args.data_format,
+        columnar=args.columnar
     )
 
 
@@ -142,6 +142,7 @@ class TestAeroTableConversion(unittest.TestCase):
         args.input_file = 'subsystems/aerodynamics/gasp_based/data/GASP_aero_flaps.txt'
         args.output_file = str(Path.cwd() / Path('TEST_'+Path(args.input_file).name))
         args.data_format = 'GASP'
+        args.columnar = False
         _exec_ATC(args, None)
 
         validation_data = get_path(
@@ -170,6 +171,7 @@ class TestAeroTableConversion(unittest.TestCase):
         args.input_file = 'utils/test/flops_test_polar.txt'
         args.output_file = str(Path(tempdir, 'TEST_'+Path(args.input_file).name))
         args.data_format = 'FLOPS'
+        args.columnar = False
         _exec_ATC(args, None)
 
         # Only testing that this runs without an error, not comparing the resulting data
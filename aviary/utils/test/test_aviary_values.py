@@ -7,6 +7,7 @@ from aviary.examples.variable_meta_data_extension import ExtendedMetaData
 from aviary.examples.variables_extension import Aircraft as ExtendedAircraft
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import get_path
+from aviary.utils.named_values import NamedValues
 from aviary.variable_info.enums import FlapType, GASPEngineType
 from aviary.variable_info.variables import Aircraft, Mission
 
@@ -236,6 +237,63 @@ class TestUnits(unittest.TestCase):
             self.fail('Expecting TypeError.')
 
 
+class TestBulkUpdate(unittest.TestCase):
+    """
+    Test validation of values assigned with bulk_update.
+    """
+
+    def test_validate(self):
+        vals = AviaryValues()
+        vals.bulk_update({
+            Aircraft.CrewPayload.NUM_PASSENGERS: (5, 'unitless'),
+            Aircraft.Engine.TYPE: ('turbojet', 'unitless'),
+            Mission.Design.RANGE: (3500, 'NM'),
+        })
+
+        # values are converted as set_val does
+        self.assertIs(vals.get_val(Aircraft.Engine.TYPE), GASPEngineType.TURBOJET)
+        assert_near_equal(vals.get_val(Mission.Design.RANGE, 'NM'), 3500)
+
+        for validate in ('once', 'always'):
+            with self.assertRaises(TypeError):
+                vals.bulk_update(
+                    [(Aircraft.CrewPayload.NUM_PASSENGERS, ('five', 'unitless'))],
+                    validate=validate)
+
+            with self.assertRaises(TypeError):
+                vals.bulk_update({Mission.Design.RANGE: (3500, 'kg')}, validate=validate)
+
+        with self.assertRaises(ValueError):
+            vals.bulk_update(vals, validate='sometimes')
+
+    def test_skip_validation(self):
+        vals = AviaryValues()
+        vals.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, 5)
+
+        # bypass validation to show it is skipped for values of another AviaryValues
+        other = AviaryValues()
+        NamedValues.set_val(other, Aircraft.CrewPayload.NUM_PASSENGERS, 'five')
+        vals.bulk_update(other)
+        self.assertEqual(vals.get_val(Aircraft.CrewPayload.NUM_PASSENGERS), 'five')
+        vals.update(other)
+        self.assertEqual(AviaryValues(other), other)
+
+        with self.assertRaises(TypeError):
+            vals.bulk_update(other, validate='always')
+
+        vals.bulk_update({Mission.Design.RANGE: (3500, 'kg')}, validate='never')
+        self.assertEqual(vals.get_item(Mission.Design.RANGE), (3500, 'kg'))
+
+    def test_update_validates(self):
+        vals = AviaryValues()
+
+        with self.assertRaises(TypeError):
+            vals.update({Aircraft.CrewPayload.NUM_PASSENGERS: ('five', 'unitless')})
+
+        with self.assertRaises(TypeError):
+            vals.update(**{Aircraft.CrewPayload.NUM_PASSENGERS: ('five', 'unitless')})
+
+
 class TestVariableExtension(unittest.TestCase):
     """
     Test set_val function for extended Aviary variables.
@@ -1,12 +1,21 @@
+import glob
 import os
+import shutil
+import time
 import unittest
 import warnings
+from pathlib import Path
 
+import numpy as np
+from numpy.testing import assert_equal
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.om_warnings import SetupWarning
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.utils.csv_data_file import write_data_file, read_data_file
+from aviary.utils import csv_data_file
+from aviary.utils.csv_data_file import (COLUMNAR_FILE_SUFFIX, clear_data_file_cache,
+                                       read_data_file, write_columnar_data_file,
+                                       write_data_file)
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues, get_items, get_keys
 from aviary.utils.process_input_decks import parse_inputs
@@ -125,5 +134,330 @@ class TestAviaryCSV(unittest.TestCase):
                                  f'match expected units of {expected_units}')
 
 
+@use_tempdirs
+class TestDataFileCache(unittest.TestCase):
+    """
+    Test that read_data_file() only parses unchanged files once.
+    """
+
+    def setUp(self):
+        clear_data_file_cache()
+        shutil.copy(get_path('utils/test/csv_test.csv'), 'cache_test.csv')
+        self.filename = os.path.abspath('cache_test.csv')
+
+    def tearDown(self):
+        clear_data_file_cache()
+
+    def test_cached(self):
+        data, comments = read_data_file(self.filename, save_comments=True)
+        cached_data, cached_comments = read_data_file(self.filename, save_comments=True)
+
+        # each read returns its own NamedValues sharing the same read-only arrays
+        self.assertIsNot(cached_data, data)
+        self.assertEqual(cached_comments, comments)
+        for key, (val, units) in data:
+            cached_val, cached_units = cached_data.get_item(key)
+            self.assertIs(cached_val, val)
+            self.assertEqual(cached_units, units)
+            self.assertFalse(val.flags.writeable)
+
+        with self.assertRaises(ValueError):
+            val[0] = 1.0
+
+        # changing the returned data does not change the cache
+        data.set_val('fake_var', [1.0, 2.0, 3.0, 4.0], 'lbm')
+        comments.append('new comment')
+        data, comments = read_data_file(self.filename, save_comments=True)
+        assert_near_equal(data.get_val('fake_var', 'lbm'), [0.932, 1023.54, 0, -13])
+        self.assertEqual(comments, cached_comments)
+
+        self.assertEqual(len(csv_data_file._data_file_cache), 1)
+
+    def test_aliases_and_metadata(self):
+        data = read_data_file(self.filename)
+        aliased_data = read_data_file(self.filename, aliases={'Real Var': 'Fake Var'})
+
+        self.assertIn('fake_var', data)
+        self.assertIn('Real Var', aliased_data)
+        self.assertIs(aliased_data.get_item('Real Var')[0],
+                      read_data_file(self.filename,
+                                     aliases={'Real Var': ['fake var']}).get_item(
+                                         'Real Var')[0])
+
+        meta_data = {'aircraft:wing:span': {'units': 'ft'},
+                     'aircraft:crew_and_payload:num_passengers': {'units': 'unitless'}}
+
+        # warnings are given again when the file is read from the cache
+        for _ in range(2):
+            with assert_warning(UserWarning,
+                                'Header <fake_var> was not recognized, and will be '
+                                'skipped'):
+                data = read_data_file(self.filename, meta_data)
+            self.assertNotIn('fake_var', data)
+
+        meta_data['fake_var'] = {'units': 'lbm'}
+        data = read_data_file(self.filename, meta_data)
+        self.assertIn('fake_var', data)
+
+        self.assertEqual(len(csv_data_file._data_file_cache), 4)
+
+    def test_changed_file(self):
+        data = read_data_file(self.filename)
+
+        with open(self.filename, 'a') as file:
+            file.write('1, 2, 3\n')
+
+        changed_data = read_data_file(self.filename)
+        self.assertEqual(len(changed_data.get_val('fake_var', 'lbm')), 5)
+        self.assertEqual(len(data.get_val('fake_var', 'lbm')), 4)
+
+    def test_clear(self):
+        data = read_data_file(self.filename)
+        clear_data_file_cache()
+        self.assertEqual(len(csv_data_file._data_file_cache), 0)
+
+        self.assertIsNot(read_data_file(self.filename).get_item('fake_var')[0],
+                         data.get_item('fake_var')[0])
+
+    def test_eviction(self):
+        cache_size = csv_data_file.DATA_FILE_CACHE_SIZE
+        try:
+            csv_data_file.DATA_FILE_CACHE_SIZE = 2
+            data = read_data_file(self.filename)
+
+            for idx in range(2):
+                filename = f'cache_test_{idx}.csv'
+                shutil.copy(self.filename, filename)
+                read_data_file(filename)
+
+            self.assertEqual(len(csv_data_file._data_file_cache), 2)
+            self.assertIsNot(read_data_file(self.filename).get_item('fake_var')[0],
+                             data.get_item('fake_var')[0])
+        finally:
+            csv_data_file.DATA_FILE_CACHE_SIZE = cache_size
+
+    def bench_test_read_data_file(self):
+        filename = get_path('models/engines/turbofan_24k_2.deck')
+
+        for name, clear in (('parsed', True), ('cached', False)):
+            start = time.perf_counter()
+            for _ in range(10):
+                if clear:
+                    clear_data_file_cache()
+                read_data_file(filename)
+            print(f'{name}: {(time.perf_counter() - start) * 100:.2f} ms per read')
+
+
+@use_tempdirs
+class TestBulkParsing(unittest.TestCase):
+    """
+    Test that parsing data all at once gives the same results as line by line.
+    """
+
+    def assert_same_parse(self, filename, metadata=None, aliases=None):
+        filepath = get_path(filename)
+        columns, comments, warning_messages = csv_data_file._parse_data_file(
+            filepath, metadata, aliases)
+        expected_columns, expected_comments, expected_warning_messages = \
+            csv_data_file._parse_data_file(filepath, metadata, aliases, bulk=False)
+
+        self.assertEqual(comments, expected_comments)
+        self.assertEqual(warning_messages, expected_warning_messages)
+        self.assertEqual([(key, units) for key, (_, units) in columns],
+                         [(key, units) for key, (_, units) in expected_columns])
+        for (key, (val, _)), (_, (expected_val, _)) in zip(columns, expected_columns):
+            self.assertEqual(val.dtype, expected_val.dtype)
+            assert_equal(val, expected_val, err_msg=f'{filename}: {key}')
+
+    def test_engine_decks(self):
+        for filename in sorted(glob.glob(str(get_path('models/engines') / '*.deck'))):
+            with self.subTest(filename=filename):
+                self.assert_same_parse(filename)
+
+    def test_formats(self):
+        contents = {
+            'comments.csv': '# comment\nx, y (ft)\n1, 2 # inline\n  # indented\n3, 4\n',
+            'blank_lines.csv': 'x, y\n\n1, 2\n   \n\t\n3, 4\n\n',
+            'semicolons.csv': 'x; y\n1; 2\n3;4\n',
+            'trailing_delimiter.csv': 'x, y\n1, 2,\n3, 4,\n',
+            'extra_columns.csv': 'x, y\n1, 2, 5\n3, 4\n',
+            'header_only.csv': 'x, y\n',
+            'nan.csv': 'x, y\nnan, inf\n1_000, 2\n',
+        }
+        for filename, content in contents.items():
+            with open(filename, 'w') as file:
+                file.write(content)
+            with self.subTest(filename=filename):
+                self.assert_same_parse(filename, aliases={'z': ['y']})
+
+    def test_errors(self):
+        contents = {
+            'Non-numerical value found in data file <{}> on line 3':
+                'x, y\n1, 2\n\n3, four\n',
+            'No header found in data file <{}>': '1, 2\nx, y\n',
+        }
+        for msg, content in contents.items():
+            with open('bad.csv', 'w') as file:
+                file.write(content)
+            filepath = get_path('bad.csv')
+            for bulk in (True, False):
+                with self.subTest(msg=msg, bulk=bulk):
+                    with self.assertRaises(ValueError) as cm:
+                        csv_data_file._parse_data_file(filepath, None, None, bulk=bulk)
+                    self.assertEqual(str(cm.exception), msg.format(filepath))
+
+        with open('short.csv', 'w') as file:
+            file.write('x, y\n1, 2\n3\n')
+        with self.assertRaises(IndexError):
+            csv_data_file._parse_data_file(get_path('short.csv'), None, None)
+
+    def bench_test_parse_engine_decks(self):
+        for filename in sorted(glob.glob(str(get_path('models/engines') / '*.deck'))):
+            times = []
+            for bulk in (False, True):
+                start = time.perf_counter()
+                csv_data_file._parse_data_file(Path(filename), None, None, bulk=bulk)
+                times.append(time.perf_counter() - start)
+            print(f'{os.path.basename(filename)}: {times[0] * 1000:.1f} ms line by line, '
+                  f'{times[1] * 1000:.1f} ms bulk')
+
+
+@use_tempdirs
+class TestColumnarDataFile(unittest.TestCase):
+    """
+    Test reading data files from their columnar companion files.
+    """
+
+    def setUp(self):
+        clear_data_file_cache()
+        shutil.copy(get_path('utils/test/csv_test.csv'), 'columnar_test.csv')
+        self.filepath = get_path('columnar_test.csv')
+        self.columnar_filepath = Path('columnar_test.csv' + COLUMNAR_FILE_SUFFIX)
+
+    def tearDown(self):
+        clear_data_file_cache()
+
+    def assert_same_parse(self, metadata=None, aliases=None):
+        columns, comments, warning_messages = csv_data_file._parse_data_file(
+            self.filepath, metadata, aliases)
+        expected_columns, expected_comments, expected_warning_messages = \
+            csv_data_file._parse_data_file(self.filepath, metadata, aliases,
+                                           columnar=False)
+
+        self.assertEqual(comments, expected_comments)
+        self.assertEqual(warning_messages, expected_warning_messages)
+        self.assertEqual([(key, units) for key, (_, units) in columns],
+                         [(key, units) for key, (_, units) in expected_columns])
+        for (key, (val, _)), (_, (expected_val, _)) in zip(columns, expected_columns):
+            assert_equal(val, expected_val, err_msg=key)
+
+        return columns
+
+    def test_read(self):
+        self.assertEqual(write_columnar_data_file(self.filepath).resolve(),
+                         self.columnar_filepath.resolve())
+
+        columns = self.assert_same_parse()
+        # data is mapped from the columnar file, not parsed
+        for _, (val, _) in columns:
+            self.assertIsInstance(val.base, np.memmap)
+            self.assertFalse(val.flags.writeable)
+
+        self.assert_same_parse(aliases={'Real Var': ['fake_var']})
+
+        meta_data = {'aircraft:wing:span': {'units': 'ft'},
+                     'aircraft:crew_and_payload:num_passengers': {'units': 'unitless'}}
+        self.assert_same_parse(meta_data)
+
+        with self.assertRaises(ValueError) as cm:
+            csv_data_file._parse_data_file(self.filepath, {'other': {'units': 'ft'}},
+                                           None)
+        self.assertEqual(str(cm.exception),
+                         f'Non-numerical value found in data file <{self.filepath}> '
+                         'on line 3')
+
+        self._compare_read(*read_data_file(self.filepath, save_comments=True))
+
+    def test_write_data_file(self):
+        data, comments = read_data_file(self.filepath, save_comments=True)
+        write_data_file('written.csv', data, comments, columnar=True)
+
+        self.assertTrue(Path('written.csv' + COLUMNAR_FILE_SUFFIX).exists())
+        columns, _, _ = csv_data_file._parse_data_file(get_path('written.csv'), None,
+                                                       None)
+        self.assertIsInstance(columns[0][1][0].base, np.memmap)
+
+    def test_changed_file(self):
+        write_columnar_data_file(self.filepath)
+
+        with open(self.filepath, 'a') as file:
+            file.write('1, 2, 3\n')
+
+        columns = self.assert_same_parse()
+        for _, (val, _) in columns:
+            self.assertEqual(len(val), 5)
+            self.assertNotIsInstance(val.base, np.memmap)
+
+    def test_file_mode(self):
+        for mode in (0o664, 0o644, 0o600):
+            with self.subTest(mode=oct(mode)):
+                os.chmod(self.filepath, mode)
+                write_columnar_data_file(self.filepath)
+
+                self.assertEqual(self.columnar_filepath.stat().st_mode & 0o777, mode)
+
+    def test_touched_file(self):
+        write_columnar_data_file(self.filepath)
+
+        # same size, but a new modification time
+        stat = self.filepath.stat()
+        os.utime(self.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        columns = self.assert_same_parse()
+        for _, (val, _) in columns:
+            self.assertNotIsInstance(val.base, np.memmap)
+
+    def test_bad_file(self):
+        write_columnar_data_file(self.filepath)
+        # cut the data short
+        self.columnar_filepath.write_bytes(self.columnar_filepath.read_bytes()[:-8])
+
+        msg = (f'Columnar file <{self.filepath}{COLUMNAR_FILE_SUFFIX}> could not be '
+               'read (mmap length is greater than file size), and will be ignored')
+        with assert_warning(UserWarning, msg):
+            self.assert_same_parse()
+
+    def test_header_only(self):
+        with open(self.filepath, 'w') as file:
+            file.write('# comment\nx, y (ft)\n')
+        write_columnar_data_file(self.filepath)
+
+        columns = self.assert_same_parse()
+        self.assertEqual(columns[1][1][0].shape, (0,))
+
+    def _compare_read(self, data, comments):
+        expected_data, expected_comments = read_data_file(
+            get_path('utils/test/csv_test.csv'), save_comments=True)
+
+        self.assertEqual(comments, expected_comments)
+        for key, (val, units) in expected_data:
+            assert_equal(data.get_val(key, units), val)
+
+    def bench_test_read_engine_decks(self):
+        for filename in sorted(glob.glob(str(get_path('models/engines') / '*.deck'))):
+            shutil.copy(filename, '.')
+            filepath = get_path(os.path.basename(filename))
+            write_columnar_data_file(filepath)
+
+            times = []
+            for columnar in (False, True):
+                start = time.perf_counter()
+                csv_data_file._parse_data_file(filepath, None, None,
+                                               columnar=columnar)
+                times.append(time.perf_counter() - start)
+            print(f'{filepath.name}: {times[0] * 1000:.1f} ms parsed, '
+                  f'{times[1] * 1000:.1f} ms memory-mapped')
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,11 @@
 import unittest
 from pathlib import Path
 
+from numpy.testing import assert_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
+from aviary.subsystems.propulsion.engine_deck import aliases
+from aviary.utils.csv_data_file import COLUMNAR_FILE_SUFFIX, _parse_data_file
 from aviary.utils.engine_deck_conversion import EngineDeckType, _exec_EDC
 from aviary.utils.functions import get_path
 
@@ -12,6 +15,7 @@ class DummyArgs(object):
         self.input_file = None
         self.output_file = None
         self.data_format = None
+        self.columnar = False
 
 
 @use_tempdirs
@@ -20,7 +24,8 @@ class TestEngineDeckConversion(unittest.TestCase):
     Test engine deck conversion utility by comparing against previously converted engine deck files
     """
 
-    def prepare_and_run(self, filename, output_file=None, data_format=EngineDeckType.GASP):
+    def prepare_and_run(self, filename, output_file=None, data_format=EngineDeckType.GASP,
+                        columnar=False):
         args = DummyArgs()
 
         # Specify the input file
@@ -35,6 +40,7 @@ class TestEngineDeckConversion(unittest.TestCase):
 
         # Specify the legacy code and engine type
         args.data_format = data_format
+        args.columnar = columnar
 
         # Execute the conversion
         _exec_EDC(args, None)
@@ -83,6 +89,24 @@ class TestEngineDeckConversion(unittest.TestCase):
         args = self.prepare_and_run(filename, data_format=EngineDeckType.GASP_TS)
         self.compare_files(filename, skip_list=['# created'])
 
+    def test_columnar(self):
+        args = self.prepare_and_run('turboshaft_4465hp.eng',
+                                    data_format=EngineDeckType.GASP_TS, columnar=True)
+
+        output_file = Path(args.output_file)
+        self.assertTrue(
+            output_file.with_name(output_file.name + COLUMNAR_FILE_SUFFIX).exists())
+
+        columns, comments, _ = _parse_data_file(output_file, None, aliases)
+        expected_columns, expected_comments, _ = _parse_data_file(
+            output_file, None, aliases, columnar=False)
+
+        self.assertEqual(comments, expected_comments)
+        self.assertEqual([(key, units) for key, (_, units) in columns],
+                         [(key, units) for key, (_, units) in expected_columns])
+        for (_, (val, _)), (_, (expected_val, _)) in zip(columns, expected_columns):
+            assert_equal(val, expected_val)
+
 
 if __name__ == "__main__":
     unittest.main()
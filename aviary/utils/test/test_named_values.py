@@ -1,9 +1,15 @@
 '''
 Unit test cases for class NamedValues.
 '''
+import timeit
 import unittest
 
-from aviary.utils.named_values import NamedValues, get_items, get_keys, get_values
+import numpy as np
+from numpy.testing import assert_equal
+from openmdao.utils.units import convert_units
+
+from aviary.utils.named_values import (NamedValues, _convert_units, get_items,
+                                       get_keys, get_values)
 from aviary.variable_info.variables import Aircraft, Mission
 
 
@@ -223,6 +229,93 @@ class NamedValuesTest(unittest.TestCase):
             a.delete(key)
         self._do_test_full_equal(a, _empty, ())
 
+    def test_convert_units(self):
+        for val in (3.5, 7, np.array([1.0, -2.0, 300.0])):
+            for old_units, new_units in (('ft', 'm'), ('degF', 'degC'), ('degR', 'degF'),
+                                         ('lbm/h', 'kg/s'), ('m', 'm'), (None, 'm')):
+                assert_equal(_convert_units(val, old_units, new_units),
+                             convert_units(val, old_units, new_units))
+
+        with self.assertRaises(TypeError):
+            _convert_units(1.0, 'ft', 'kg')
+
+        with self.assertRaises(ValueError):
+            _convert_units(1.0, 'ft', 'not_units')
+
+    def bench_test_get_val(self):
+        vals = NamedValues()
+        vals.set_val('WING_AREA', 1370.0, 'ft**2')
+        vals.set_val('ENGINE_DATA', np.linspace(0.0, 1.0, 1000), 'lbf')
+
+        for key, units in (('WING_AREA', 'ft**2'), ('WING_AREA', 'm**2'),
+                           ('ENGINE_DATA', 'lbf'), ('ENGINE_DATA', 'N')):
+            old_units = vals.get_item(key)[1]
+            num = 10000
+            get_val = timeit.timeit(lambda: vals.get_val(key, units), number=num)
+            convert = timeit.timeit(
+                lambda: convert_units(vals.get_item(key)[0], old_units, units),
+                number=num)
+            print(f'get_val({key}, {units}): {get_val / num * 1e6:.2f} us, '
+                  f'with convert_units: {convert / num * 1e6:.2f} us')
+
+    def test_lazy_deepcopy(self):
+        a = NamedValues(_data1)
+        a.set_val('WING_AREA', np.array([1.0, 2.0]), 'ft**2')
+        a.set_val('FLAPS', [1, 2])
+
+        b = a.deepcopy(lazy=True)
+        self._do_test_full_equal(b, a, ())
+
+        # immutable values are never copied
+        self.assertIs(b.get_item('NUM_ENGINES'), a.get_item('NUM_ENGINES'))
+
+        # mutable values are shared until accessed
+        self.assertIs(b._mapping['WING_AREA'][0], a._mapping['WING_AREA'][0])
+
+        area = b.get_val('WING_AREA', 'ft**2')
+        self.assertIsNot(area, a._mapping['WING_AREA'][0])
+        area[0] = 5.0
+        b.get_item('FLAPS')[0].append(3)
+
+        assert_equal(a.get_val('WING_AREA', 'ft**2'), [1.0, 2.0])
+        self.assertEqual(a.get_val('FLAPS'), [1, 2])
+        assert_equal(b.get_val('WING_AREA', 'ft**2'), [5.0, 2.0])
+        self.assertEqual(b.get_val('FLAPS'), [1, 2, 3])
+
+        # only one of the two copies a shared value
+        a = NamedValues(FLAPS=([1, 2], 'unitless'))
+        flaps = a._mapping['FLAPS'][0]
+        b = a.deepcopy(lazy=True)
+        b.get_val('FLAPS').append(3)
+        self.assertIs(a.get_val('FLAPS'), flaps)
+        self.assertEqual(flaps, [1, 2])
+
+        # setting or deleting a value stops sharing it
+        c = a.deepcopy(lazy=True)
+        c.set_val('FLAPS', [4])
+        self.assertIs(a.get_val('FLAPS'), flaps)
+        d = a.deepcopy(lazy=True)
+        d.delete('FLAPS')
+        self.assertIs(a.get_val('FLAPS'), flaps)
+
+    def test_lazy_deepcopy_update(self):
+        a = NamedValues(FLAPS=([1, 2], 'unitless'))
+        b = a.deepcopy(lazy=True)
+
+        # values of a lazy copy remain shared when copied into another collection
+        c = NamedValues(b)
+        c.get_val('FLAPS').append(3)
+        self.assertEqual(a.get_val('FLAPS'), [1, 2])
+        self.assertEqual(b.get_val('FLAPS'), [1, 2])
+
+        # iterating hands out the values, so they are copied first
+        for key, (val, units) in b:
+            val.append(4)
+        for _, (val, _) in get_items(a):
+            val.append(5)
+        self.assertEqual(b.get_val('FLAPS'), [1, 2, 4])
+        self.assertEqual(a.get_val('FLAPS'), [1, 2, 5])
+
     def _do_test_full_equal(self, d, eq, ne):
         self.assertEqual(d._mapping, eq)
         self.assertEqual(d, eq)
@@ -12,6 +12,7 @@ class DummyArgs(object):
         self.input_file = None
         self.output_file = None
         self.data_format = None
+        self.columnar = False
 
 
 @use_tempdirs
@@ -28,7 +28,7 @@ def get_option_defaults(engine=True, meta_data=_MetaData) -> AviaryValues:
             option_defaults.set_val(key, var['default_value'], var['units'])
 
     if engine:
-        engine_options = option_defaults.deepcopy()
+        engine_options = option_defaults.deepcopy(lazy=True)
         engine_options.set_val(Aircraft.Engine.DATA_FILE,
                                get_path('models/engines/turbofan_23k_1.deck'))
         engine_options.set_val(Aircraft.Engine.SCALE_FACTOR,
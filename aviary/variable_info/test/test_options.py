@@ -0,0 +1,90 @@
+import subprocess
+import sys
+import timeit
+import unittest
+
+from numpy.testing import assert_equal
+
+from aviary.variable_info.options import get_option_defaults
+from aviary.variable_info.variable_meta_data import _MetaData
+from aviary.variable_info.variables import Aircraft
+
+# prints the time taken by a statement run once in a new process, after setup
+time_statement = '''
+import time
+{setup}
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+class OptionDefaultsTest(unittest.TestCase):
+    """
+    Test that the option defaults match the metadata they are built from.
+    """
+
+    def assert_defaults_match(self, option_defaults):
+        options = [key for key, var in _MetaData.items()
+                   if var['option'] and var['default_value'] is not None]
+        self.assertEqual([key for key, _ in option_defaults], options)
+
+        for key in options:
+            var = _MetaData[key]
+            val, units = option_defaults.get_item(key)
+            self.assertEqual(units, var['units'])
+            self.assertIs(type(val), type(var['default_value']))
+            assert_equal(val, var['default_value'], err_msg=key)
+
+    def test_option_defaults(self):
+        self.assert_defaults_match(get_option_defaults(engine=False))
+
+    def test_independent(self):
+        option_defaults = get_option_defaults(engine=False)
+        option_defaults.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, 4)
+
+        self.assert_defaults_match(get_option_defaults(engine=False))
+
+    def test_changed_option(self):
+        get_option_defaults(engine=False)
+
+        var = _MetaData[Aircraft.CrewPayload.NUM_PASSENGERS]
+        default_value = var['default_value']
+        try:
+            var['default_value'] = 4
+            option_defaults = get_option_defaults(engine=False)
+            self.assertEqual(
+                option_defaults.get_val(Aircraft.CrewPayload.NUM_PASSENGERS), 4)
+        finally:
+            var['default_value'] = default_value
+
+        option_defaults = get_option_defaults(engine=False)
+        self.assertEqual(option_defaults.get_val(Aircraft.CrewPayload.NUM_PASSENGERS),
+                         default_value)
+
+    def bench_test_import_time(self):
+        setups = {
+            # import everything the metadata needs first, so only its own cost is
+            # timed
+            'metadata alone': ('import numpy, aviary.utils.develop_metadata, '
+                               'aviary.variable_info.variables, '
+                               'aviary.variable_info.enums'),
+            'metadata and its dependencies': '',
+        }
+
+        for name, setup in setups.items():
+            code = time_statement.format(
+                setup=setup, statement='import aviary.variable_info.variable_meta_data')
+            times = [float(subprocess.check_output([sys.executable, '-c', code]))
+                     for _ in range(5)]
+            print(f'import of {name}: {min(times) * 1000:.1f} ms')
+
+        get_option_defaults(engine=False)
+        num_calls = 100
+        call_time = min(timeit.repeat(lambda: get_option_defaults(engine=False),
+                                      number=num_calls, repeat=5)) / num_calls
+        print(f'get_option_defaults(engine=False): {call_time * 1000:.2f} ms per call')
+
+
+if __name__ == '__main__':
+    unittest.main()
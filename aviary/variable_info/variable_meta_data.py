@@ -1754,6 +1754,23 @@ add_meta_data(
     default_value=0.0
 )
 
+add_meta_data(
+    Aircraft.Engine.DATA_CACHE_DIR,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units='unitless',
+    types=(str, Path),
+    default_value=None,
+    option=True,
+    desc='directory where pre-processed engine performance data is cached. If '
+         'provided, engine decks read from a data file are stored in binary form after '
+         'their first use, and subsequent runs load that cached data instead of '
+         're-processing the data file. Caching is disabled if not provided.'
+)
+
 # TODO there should be a GASP name that pairs here
 add_meta_data(
     Aircraft.Engine.DATA_FILE,
@@ -1909,6 +1926,16 @@ add_meta_data(
          'engine deck with negative net thrust are ignored.'
 )
 
+add_meta_data(
+    Aircraft.Engine.INTERPOLATION_GRID, meta_data=_MetaData,
+    historical_name={"GASP": None, "FLOPS": None, "LEAPS1": None},
+    units="unitless", option=True, default_value='auto', types=str,
+    desc="type of grid used for interpolation on an engine deck's data. 'auto' uses a "
+    "structured grid if the data is a full tensor-product grid, and a semistructured "
+    "grid otherwise. 'structured' resamples data that is not already a structured grid "
+    "onto one, which is faster to interpolate but may only approximate the original "
+    "data. 'semistructured' always uses a semistructured grid.",)
+
 add_meta_data(
     Aircraft.Engine.INTERPOLATION_METHOD, meta_data=_MetaData,
     historical_name={"GASP": None, "FLOPS": None, "LEAPS1": None},
@@ -209,6 +209,7 @@ class Aircraft:
             'aircraft:engine:compute_propeller_installation_loss'
         CONSTANT_FUEL_CONSUMPTION = 'aircraft:engine:constant_fuel_consumption'
         CONTROLS_MASS = 'aircraft:engine:controls_mass'
+        DATA_CACHE_DIR = 'aircraft:engine:data_cache_dir'
         DATA_FILE = 'aircraft:engine:data_file'
         FIXED_RPM = 'aircraft:engine:fixed_rpm'
         FLIGHT_IDLE_MAX_FRACTION = 'aircraft:engine:flight_idle_max_fraction'
@@ -220,6 +221,7 @@ class Aircraft:
         GEOPOTENTIAL_ALT = 'aircraft:engine:geopotential_alt'
         HAS_PROPELLERS = 'aircraft:engine:has_propellers'
         IGNORE_NEGATIVE_THRUST = 'aircraft:engine:ignore_negative_thrust'
+        INTERPOLATION_GRID = 'aircraft:engine:interpolation_grid'
         INTERPOLATION_METHOD = 'aircraft:engine:interpolation_method'
         MASS = 'aircraft:engine:mass'
         MASS_SCALER = 'aircraft:engine:mass_scaler'